@@ -0,0 +1,42 @@
+"""Add message history indexes
+
+Revision ID: 4f7c2a1d9e3b
+Revises: e56d87f8994a
+Create Date: 2026-10-19 10:40:12.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "4f7c2a1d9e3b"
+down_revision: Union[str, None] = "e56d87f8994a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MESSAGE_INDEXES = {
+    "ix_message_session_id_timestamp": ["session_id", "timestamp"],
+    "ix_message_flow_id_timestamp": ["flow_id", "timestamp"],
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for index_name, columns in MESSAGE_INDEXES.items():
+            if index_name not in indexes_names:
+                batch_op.create_index(index_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for index_name in MESSAGE_INDEXES:
+            if index_name in indexes_names:
+                batch_op.drop_index(index_name)
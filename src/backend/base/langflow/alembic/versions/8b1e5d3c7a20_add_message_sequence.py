@@ -0,0 +1,48 @@
+"""Add message sequence
+
+Revision ID: 8b1e5d3c7a20
+Revises: 4f7c2a1d9e3b
+Create Date: 2026-10-19 16:05:41.527310
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "8b1e5d3c7a20"
+down_revision: Union[str, None] = "4f7c2a1d9e3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("message")]
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        if "sequence" not in column_names:
+            # Messages stored before the column existed keep being ordered by timestamp and id
+            batch_op.add_column(sa.Column("sequence", sa.BigInteger(), nullable=False, server_default="0"))
+        if "ix_message_session_id_timestamp" in indexes_names:
+            batch_op.drop_index("ix_message_session_id_timestamp")
+        if "ix_message_session_id_timestamp_sequence" not in indexes_names:
+            batch_op.create_index(
+                "ix_message_session_id_timestamp_sequence", ["session_id", "timestamp", "sequence"], unique=False
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("message")]
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        if "ix_message_session_id_timestamp_sequence" in indexes_names:
+            batch_op.drop_index("ix_message_session_id_timestamp_sequence")
+        if "ix_message_session_id_timestamp" not in indexes_names:
+            batch_op.create_index("ix_message_session_id_timestamp", ["session_id", "timestamp"], unique=False)
+        if "sequence" in column_names:
+            batch_op.drop_column("sequence")
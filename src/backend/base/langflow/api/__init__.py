@@ -1,5 +1,6 @@
 from langflow.api.health_check_router import health_check_router
 from langflow.api.log_router import log_router
+from langflow.api.metrics_router import metrics_router
 from langflow.api.router import router
 
-__all__ = ["health_check_router", "log_router", "router"]
+__all__ = ["health_check_router", "log_router", "metrics_router", "router"]
@@ -34,7 +34,7 @@ from langflow.graph.utils import log_vertex_build
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow import Flow
-from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
+from langflow.services.deps import get_chat_service, get_settings_service, get_telemetry_service, session_scope
 from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
@@ -182,6 +182,7 @@ async def generate_flow_events(
     """
     chat_service = get_chat_service()
     telemetry_service = get_telemetry_service()
+    settings = get_settings_service().settings
     if not inputs:
         inputs = InputValueRequest(session=str(flow_id))
 
@@ -191,11 +192,20 @@ async def generate_flow_events(
         graph = None
         try:
             flow_id_str = str(flow_id)
+            # The previous build is read before the new graph replaces it in the cache
+            previous_graph = await get_cached_graph(flow_id_str) if settings.incremental_builds else None
             # Create a fresh session for database operations
             async with session_scope() as fresh_session:
                 graph = await create_graph(fresh_session, flow_id_str, flow_name)
 
             graph.validate_stream()
+            if previous_graph is not None:
+                always_build = [vertex_id for vertex_id in (start_component_id, stop_component_id) if vertex_id]
+                incremental_build = graph.reuse_unchanged_results(previous_graph, always_build=always_build)
+                logger.debug(
+                    f"Incremental build of flow {flow_id_str}: reusing {incremental_build.reused}, "
+                    f"rebuilding {incremental_build.rebuilt}"
+                )
             first_layer = sort_vertices(graph)
 
             for vertex_id in first_layer:
@@ -219,6 +229,12 @@ async def generate_flow_events(
             raise HTTPException(status_code=500, detail=str(exc)) from exc
         return first_layer, vertices_to_run, graph
 
+    async def get_cached_graph(flow_id_str: str) -> Graph | None:
+        cached = await chat_service.get_cache(flow_id_str)
+        if isinstance(cached, dict) and isinstance(cached.get("result"), Graph):
+            return cached["result"]
+        return None
+
     async def log_telemetry(
         start_time: float, components_count: int, *, success: bool, error_message: str | None = None
     ):
@@ -352,6 +368,7 @@ async def generate_flow_events(
                 params=params,
                 id=vertex.id,
                 data=result_data_response,
+                profile=vertex.profile.to_dict() if vertex.profile else None,
             )
             background_tasks.add_task(
                 telemetry_service.log_package_component,
@@ -429,7 +446,10 @@ async def generate_flow_events(
         event_manager.on_error(data=error_message.data)
         raise
 
-    event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run})
+    vertices_sorted = {"ids": ids, "to_run": vertices_to_run}
+    if graph.incremental_build is not None:
+        vertices_sorted.update(graph.incremental_build._asdict())
+    event_manager.on_vertices_sorted(data=vertices_sorted)
 
     tasks = []
     for vertex_id in ids:
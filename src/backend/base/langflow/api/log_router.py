@@ -1,7 +1,6 @@
-import asyncio
 import json
 from http import HTTPStatus
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -12,33 +11,17 @@ log_router = APIRouter(tags=["Log"])
 
 
 NUMBER_OF_NOT_SENT_BEFORE_KEEPALIVE = 5
+STREAM_WAIT_TIMEOUT = 1.0
 
 
 async def event_generator(request: Request):
     global log_buffer  # noqa: PLW0602
-    last_read_item = None
+    # Follow the buffer from the next entry written; the writer wakes us up on this loop instead of a polling scan
+    cursor = log_buffer.next_seq
     current_not_sent = 0
     while not await request.is_disconnected():
-        to_write: list[Any] = []
-        with log_buffer.get_write_lock():
-            if last_read_item is None:
-                last_read_item = log_buffer.buffer[len(log_buffer.buffer) - 1]
-            else:
-                found_last = False
-                for item in log_buffer.buffer:
-                    if found_last:
-                        to_write.append(item)
-                        last_read_item = item
-                        continue
-                    if item is last_read_item:
-                        found_last = True
-                        continue
-
-                # in case the last item is nomore in the buffer
-                if not found_last:
-                    for item in log_buffer.buffer:
-                        to_write.append(item)
-                        last_read_item = item
+        await log_buffer.wait_for_entries(cursor, STREAM_WAIT_TIMEOUT)
+        to_write, cursor = log_buffer.get_since(cursor)
         if to_write:
             for ts, msg in to_write:
                 yield f"{json.dumps({ts: msg})}\n\n"
@@ -48,8 +31,6 @@ async def event_generator(request: Request):
                 current_not_sent = 0
                 yield "keepalive\n\n"
 
-        await asyncio.sleep(1)
-
 
 @log_router.get("/logs-stream")
 async def stream_logs(
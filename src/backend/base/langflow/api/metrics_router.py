@@ -0,0 +1,25 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, HTTPException, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from langflow.services.deps import get_settings_service
+from langflow.services.telemetry.runtime_metrics import generate_runtime_metrics
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get("/metrics")
+async def metrics():
+    """Runtime metrics of the engine in the Prometheus text format.
+
+    Reports build jobs and queued events, events sent, cache hit rates, database pool usage,
+    vertex build latencies per component type and event loop lag.
+    """
+    if not get_settings_service().settings.runtime_metrics_enabled:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_IMPLEMENTED,
+            detail="Runtime metrics are disabled",
+        )
+
+    return Response(generate_runtime_metrics(), media_type=CONTENT_TYPE_LATEST)
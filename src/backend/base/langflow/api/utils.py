@@ -12,6 +12,7 @@ from sqlalchemy import delete
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.graph.graph.base import Graph
+from langflow.memory import invalidate_message_history
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import User
 from langflow.services.database.models.flow import Flow
@@ -295,6 +296,7 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
         # it might cause unexpected behaviors because the session id could still be
         # used elsewhere to search for these messages.
         await session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))
+        invalidate_message_history(flow_id=flow_id)
         await session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))
         await session.exec(delete(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id))
         await session.exec(delete(Flow).where(Flow.id == flow_id))
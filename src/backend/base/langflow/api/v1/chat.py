@@ -388,6 +388,7 @@ async def build_vertex(
             params=params,
             id=vertex.id,
             data=result_data_response,
+            profile=vertex.profile.to_dict() if vertex.profile else None,
         )
         background_tasks.add_task(
             telemetry_service.log_package_component,
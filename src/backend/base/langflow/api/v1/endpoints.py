@@ -477,6 +477,7 @@ async def experimental_run_flow(
     tweaks: Annotated[Tweaks | None, Body(embed=True)] = None,
     stream: Annotated[bool, Body(embed=True)] = False,
     session_id: Annotated[None | str, Body(embed=True)] = None,
+    max_concurrency: Annotated[int, Body(embed=True, ge=1)] = 1,
     api_key_user: Annotated[UserRead, Depends(api_key_security)],
 ) -> RunResponse:
     """Executes a specified flow by ID with optional input values, output selection, tweaks, and streaming capability.
@@ -495,6 +496,8 @@ async def experimental_run_flow(
     - `stream` (bool, optional): Specifies whether the results should be streamed. Defaults to False.
     - `session_id` (Union[None, str], optional): An optional session ID to utilize existing session data for the flow
       execution.
+    - `max_concurrency` (int, optional): How many of the inputs may run at the same time, each on its own copy of
+      the flow. Defaults to 1, which runs the inputs one after another.
     - `api_key_user` (User): The user associated with the current API key. Automatically resolved from the API key.
 
     ### Returns:
@@ -579,6 +582,7 @@ async def experimental_run_flow(
             inputs=inputs,
             outputs=outputs,
             stream=stream,
+            max_concurrency=max_concurrency,
         )
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 from datetime import datetime, timezone
 from http import HTTPStatus
@@ -11,6 +12,7 @@ from fastapi.responses import StreamingResponse
 
 from langflow.api.utils import CurrentActiveUser, DbSession
 from langflow.api.v1.schemas import UploadFileResponse
+from langflow.schema.image import detect_image_format, with_image_extension
 from langflow.services.database.models.flow import Flow
 from langflow.services.deps import get_settings_service, get_storage_service
 from langflow.services.settings.service import SettingsService
@@ -63,7 +65,9 @@ async def upload_file(
         file_content = await file.read()
         timestamp = datetime.now(tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
         file_name = file.filename or hashlib.sha256(file_content).hexdigest()
-        full_file_name = f"{timestamp}_{file_name}"
+        # Detect images once, at upload time, and record the format in the extension of the stored file
+        image_format = await asyncio.to_thread(detect_image_format, BytesIO(file_content))
+        full_file_name = with_image_extension(f"{timestamp}_{file_name}", image_format)
         folder = str(flow.id)
         await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
         return UploadFileResponse(flow_id=str(flow.id), file_path=f"{folder}/{full_file_name}")
@@ -11,6 +11,7 @@ from uuid import UUID
 import orjson
 from aiofile import async_open
 from anyio import Path
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
@@ -19,7 +20,15 @@ from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
+from langflow.api.utils import (
+    CurrentActiveUser,
+    DbSession,
+    cascade_delete_flow,
+    get_is_component_from_data,
+    remove_api_keys,
+    validate_is_component,
+)
+from langflow.api.v1.mcp import invalidate_mcp_tool_catalog
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
@@ -36,6 +45,12 @@ from langflow.utils.compression import compress_response
 # build router
 router = APIRouter(prefix="/flows", tags=["Flows"])
 
+# Number of rows fetched per keyset-paginated query when listing flow headers
+FLOW_HEADER_BATCH_SIZE = 500
+
+# The default and starter folders are looked up on every flow listing, so their ids are reused
+_folder_id_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
 
 async def _verify_fs_path(path: str | None) -> None:
     if path:
@@ -44,6 +59,73 @@ async def _verify_fs_path(path: str | None) -> None:
             await path_.touch()
 
 
+async def _get_folder_ids(session: AsyncSession, *names: str) -> dict[str, UUID]:
+    """Get the ids of the folders with the given names, reusing previous lookups for the same database."""
+    bind = session.bind
+    database_url = str(bind.url) if bind is not None else ""
+    folder_ids: dict[str, UUID] = {}
+    for name in names:
+        if (cached_id := _folder_id_cache.get((database_url, name))) is not None:
+            folder_ids[name] = cached_id
+    if missing_names := [name for name in names if name not in folder_ids]:
+        rows = (await session.exec(select(Folder.name, Folder.id).where(col(Folder.name).in_(missing_names)))).all()
+        for name, folder_id in rows:
+            if name not in folder_ids:
+                folder_ids[name] = folder_id
+                _folder_id_cache[database_url, name] = folder_id
+    return folder_ids
+
+
+def clear_folder_id_cache() -> None:
+    """Forget cached folder lookups. Must be called when a folder is renamed or deleted."""
+    _folder_id_cache.clear()
+
+
+async def _read_flow_headers(session: AsyncSession, conditions: list) -> list[FlowHeader]:
+    """Read flow headers without loading the data column of flows that are not components.
+
+    Rows are fetched in keyset-paginated batches ordered by id so large workspaces never
+    require a single huge result set.
+    """
+    header_columns = (
+        Flow.id,
+        Flow.name,
+        Flow.folder_id,
+        Flow.is_component,
+        Flow.endpoint_name,
+        Flow.description,
+        Flow.access_type,
+        Flow.tags,
+    )
+    flow_headers: list[FlowHeader] = []
+    last_id: UUID | None = None
+    while True:
+        stmt = select(*header_columns).where(*conditions).order_by(col(Flow.id)).limit(FLOW_HEADER_BATCH_SIZE)
+        if last_id is not None:
+            stmt = stmt.where(col(Flow.id) > last_id)
+        rows = [dict(row._mapping) for row in (await session.exec(stmt)).all()]
+        if not rows:
+            break
+
+        # The data is only needed for components, or to infer is_component when it was never set
+        ids_needing_data = [row["id"] for row in rows if row["is_component"] is not False]
+        if ids_needing_data:
+            data_stmt = select(Flow.id, Flow.data).where(col(Flow.id).in_(ids_needing_data))
+            data_by_id = dict((await session.exec(data_stmt)).all())
+            for row in rows:
+                data = data_by_id.get(row["id"])
+                if data and row["is_component"] is None:
+                    is_component = get_is_component_from_data(data)
+                    row["is_component"] = is_component if is_component is not None else len(data.get("nodes", [])) == 1
+                row["data"] = data
+
+        flow_headers.extend(FlowHeader.model_validate(row) for row in rows)
+        if len(rows) < FLOW_HEADER_BATCH_SIZE:
+            break
+        last_id = rows[-1]["id"]
+    return flow_headers
+
+
 async def _save_flow_to_fs(flow: Flow) -> None:
     if flow.fs_path:
         async with async_open(flow.fs_path, "w") as f:
@@ -146,6 +228,7 @@ async def create_flow(
     try:
         db_flow = await _new_flow(session=session, flow=flow, user_id=current_user.id)
         await session.commit()
+        invalidate_mcp_tool_catalog(current_user.id)
         await session.refresh(db_flow)
 
         await _save_flow_to_fs(db_flow)
@@ -203,13 +286,11 @@ async def read_flows(
     try:
         auth_settings = get_settings_service().auth_settings
 
-        default_folder = (await session.exec(select(Folder).where(Folder.name == DEFAULT_FOLDER_NAME))).first()
-        default_folder_id = default_folder.id if default_folder else None
-
-        starter_folder = (await session.exec(select(Folder).where(Folder.name == STARTER_FOLDER_NAME))).first()
-        starter_folder_id = starter_folder.id if starter_folder else None
+        folder_ids = await _get_folder_ids(session, DEFAULT_FOLDER_NAME, STARTER_FOLDER_NAME)
+        default_folder_id = folder_ids.get(DEFAULT_FOLDER_NAME)
+        starter_folder_id = folder_ids.get(STARTER_FOLDER_NAME)
 
-        if not starter_folder and not default_folder:
+        if not starter_folder_id and not default_folder_id:
             raise HTTPException(
                 status_code=404,
                 detail="Starter folder and default folder not found. Please create a folder and add flows to it.",
@@ -219,33 +300,37 @@ async def read_flows(
             folder_id = default_folder_id
 
         if auth_settings.AUTO_LOGIN:
-            stmt = select(Flow).where(
+            conditions = [
                 (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
-            )
+            ]
         else:
-            stmt = select(Flow).where(Flow.user_id == current_user.id)
+            conditions = [Flow.user_id == current_user.id]
 
         if remove_example_flows:
-            stmt = stmt.where(Flow.folder_id != starter_folder_id)
+            conditions.append(Flow.folder_id != starter_folder_id)
 
         if components_only:
-            stmt = stmt.where(Flow.is_component == True)  # noqa: E712
+            conditions.append(Flow.is_component == True)  # noqa: E712
 
         if get_all:
-            flows = (await session.exec(stmt)).all()
+            if header_flows:
+                # Only load the header columns (and the data of components) instead of every flow's full data
+                flow_headers = await _read_flow_headers(session, conditions)
+                if components_only:
+                    flow_headers = [flow for flow in flow_headers if flow.is_component]
+                return compress_response(flow_headers)
+
+            flows = (await session.exec(select(Flow).where(*conditions))).all()
             flows = validate_is_component(flows)
             if components_only:
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
 
             # Compress the full flows response
             return compress_response(flows)
 
+        stmt = select(Flow).where(*conditions)
         stmt = stmt.where(Flow.folder_id == folder_id)
         return await paginate(session, stmt, params=params)
 
@@ -341,6 +426,7 @@ async def update_flow(
 
         session.add(db_flow)
         await session.commit()
+        invalidate_mcp_tool_catalog(current_user.id)
         await session.refresh(db_flow)
 
         await _save_flow_to_fs(db_flow)
@@ -382,6 +468,7 @@ async def delete_flow(
         raise HTTPException(status_code=404, detail="Flow not found")
     await cascade_delete_flow(session, flow.id)
     await session.commit()
+    invalidate_mcp_tool_catalog(current_user.id)
     return {"message": "Flow deleted successfully"}
 
 
@@ -400,6 +487,7 @@ async def create_flows(
         session.add(db_flow)
         db_flows.append(db_flow)
     await session.commit()
+    invalidate_mcp_tool_catalog(current_user.id)
     for db_flow in db_flows:
         await session.refresh(db_flow)
     return db_flows
@@ -428,6 +516,7 @@ async def upload_file(
 
     try:
         await session.commit()
+        invalidate_mcp_tool_catalog(current_user.id)
         for db_flow in response_list:
             await session.refresh(db_flow)
             await _save_flow_to_fs(db_flow)
@@ -475,6 +564,7 @@ async def delete_multiple_flows(
             await cascade_delete_flow(db, flow.id)
 
         await db.commit()
+        invalidate_mcp_tool_catalog(user.id)
         return {"deleted": len(flows_to_delete)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -16,7 +16,8 @@ from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, custom_params, remove_api_keys
-from langflow.api.v1.flows import create_flows
+from langflow.api.v1.flows import clear_folder_id_cache, create_flows
+from langflow.api.v1.mcp import invalidate_mcp_tool_catalog
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.flow import generate_unique_flow_name
 from langflow.helpers.folders import generate_unique_folder_name
@@ -185,6 +186,7 @@ async def update_folder(
             existing_folder.name = folder.name
             session.add(existing_folder)
             await session.commit()
+            clear_folder_id_cache()
             await session.refresh(existing_folder)
             return existing_folder
 
@@ -250,6 +252,8 @@ async def delete_folder(
     try:
         await session.delete(folder)
         await session.commit()
+        clear_folder_id_cache()
+        invalidate_mcp_tool_catalog(current_user.id)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
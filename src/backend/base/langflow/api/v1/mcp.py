@@ -2,12 +2,15 @@ import asyncio
 import base64
 import json
 import logging
+from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
 from functools import wraps
 from typing import Annotated, Any, ParamSpec, TypeVar
 from urllib.parse import quote, unquote, urlparse
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pydantic
 from anyio import BrokenResourceError
@@ -16,12 +19,11 @@ from fastapi.responses import StreamingResponse
 from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
-from sqlmodel import select
+from sqlmodel import col, func, select
 from starlette.background import BackgroundTasks
 
 from langflow.api.v1.chat import build_flow_and_stream
 from langflow.api.v1.schemas import InputValueRequest
-from langflow.base.mcp.util import get_flow_snake_case
 from langflow.helpers.flow import json_schema_from_flow
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import Flow, User
@@ -89,6 +91,92 @@ def get_enable_progress_notifications() -> bool:
     return get_settings_service().settings.mcp_server_enable_progress_notifications
 
 
+@dataclass
+class MCPToolCatalog:
+    """The flows of one user exposed as MCP tools.
+
+    `fingerprint` is the (count, latest updated_at) of the user's flows when the catalog was built and
+    is used to detect changes made outside the flow endpoints. `schemas` keeps the input schema of each
+    flow together with the `updated_at` it was computed for, so a rebuild only re-reads changed flows.
+    """
+
+    fingerprint: tuple[int, datetime | None]
+    tools: list[types.Tool] = field(default_factory=list)
+    flow_ids: dict[str, UUID] = field(default_factory=dict)
+    schemas: dict[UUID, tuple[datetime | None, dict]] = field(default_factory=dict)
+    stale: bool = False
+
+    def is_current(self, fingerprint: tuple[int, datetime | None]) -> bool:
+        return not self.stale and self.fingerprint == fingerprint
+
+
+_tool_catalogs: dict[UUID, MCPToolCatalog] = {}
+_tool_catalog_locks: defaultdict[UUID, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+def invalidate_mcp_tool_catalog(user_id: UUID | None = None) -> None:
+    """Mark the MCP tool catalog of a user, or of every user when no user is given, for rebuilding.
+
+    Input schemas of flows that did not change are kept and reused by the rebuild.
+    """
+    catalogs = _tool_catalogs.values() if user_id is None else [_tool_catalogs.get(user_id)]
+    for catalog in catalogs:
+        if catalog is not None:
+            catalog.stale = True
+
+
+def _tool_name(flow_name: str) -> str:
+    return "_".join(flow_name.lower().split())
+
+
+async def get_mcp_tool_catalog(session, user_id: UUID) -> MCPToolCatalog:
+    """Return the MCP tool catalog of a user, rebuilding it only when their flows changed."""
+    flow_filter = (Flow.user_id == user_id, Flow.is_component == False)  # noqa: E712
+    stmt = select(func.count(col(Flow.id)), func.max(Flow.updated_at)).where(*flow_filter)
+    count, last_updated_at = (await session.exec(stmt)).one()
+    fingerprint = (count, last_updated_at)
+    catalog = _tool_catalogs.get(user_id)
+    if catalog is not None and catalog.is_current(fingerprint):
+        return catalog
+
+    async with _tool_catalog_locks[user_id]:
+        catalog = _tool_catalogs.get(user_id)
+        if catalog is not None and catalog.is_current(fingerprint):
+            return catalog
+        previous_schemas = catalog.schemas if catalog is not None else {}
+
+        headers = (
+            await session.exec(select(Flow.id, Flow.name, Flow.description, Flow.updated_at).where(*flow_filter))
+        ).all()
+        updated_ats = {flow_id: updated_at for flow_id, _, _, updated_at in headers}
+        schemas = {
+            flow_id: previous_schemas[flow_id]
+            for flow_id, updated_at in updated_ats.items()
+            if flow_id in previous_schemas and previous_schemas[flow_id][0] == updated_at
+        }
+        if stale_ids := [flow_id for flow_id in updated_ats if flow_id not in schemas]:
+            for flow in (await session.exec(select(Flow).where(col(Flow.id).in_(stale_ids)))).all():
+                schemas[flow.id] = (updated_ats[flow.id], json_schema_from_flow(flow))
+
+        catalog = MCPToolCatalog(fingerprint=fingerprint, schemas=schemas)
+        for flow_id, flow_name, description, _ in headers:
+            if flow_id not in schemas:
+                continue
+            name = _tool_name(flow_name)
+            if name in catalog.flow_ids:
+                continue
+            catalog.flow_ids[name] = flow_id
+            catalog.tools.append(
+                types.Tool(
+                    name=name,
+                    description=f"{flow_id}: {description}" if description else f"Tool generated from flow: {name}",
+                    inputSchema=schemas[flow_id][1],
+                )
+            )
+        _tool_catalogs[user_id] = catalog
+        return catalog
+
+
 @server.list_prompts()
 async def handle_list_prompts():
     return []
@@ -176,30 +264,16 @@ async def handle_read_resource(uri: str) -> bytes:
 
 @server.list_tools()
 async def handle_list_tools():
-    tools = []
+    current_user = current_user_ctx.get()
     try:
         db_service = get_db_service()
         async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
-
-            for flow in flows:
-                if flow.user_id is None:
-                    continue
-
-                flow_name = "_".join(flow.name.lower().split())
-                tool = types.Tool(
-                    name=flow_name,
-                    description=f"{flow.id}: {flow.description}"
-                    if flow.description
-                    else f"Tool generated from flow: {flow_name}",
-                    inputSchema=json_schema_from_flow(flow),
-                )
-                tools.append(tool)
+            catalog = await get_mcp_tool_catalog(session, current_user.id)
     except Exception as e:
         msg = f"Error in listing tools: {e!s}"
         logger.exception(msg)
         raise
-    return tools
+    return list(catalog.tools)
 
 
 @server.call_tool()
@@ -216,11 +290,11 @@ async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent
 
     async def execute_tool(session):
         # get flow id from name
-        flow = await get_flow_snake_case(name, current_user.id, session)
-        if not flow:
+        catalog = await get_mcp_tool_catalog(session, current_user.id)
+        flow_id = catalog.flow_ids.get(name)
+        if flow_id is None:
             msg = f"Flow with name '{name}' not found"
             raise ValueError(msg)
-        flow_id = flow.id
 
         # Process inputs
         processed_inputs = dict(arguments)
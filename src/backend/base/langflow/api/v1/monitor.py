@@ -8,6 +8,8 @@ from sqlalchemy import delete
 from sqlmodel import col, select
 
 from langflow.api.utils import DbSession, custom_params
+from langflow.graph.vertex.profiling import PhaseHistogram, get_vertex_profile_stats
+from langflow.memory import invalidate_message_history
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
@@ -40,6 +42,19 @@ async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSes
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/profiles", dependencies=[Depends(get_current_active_user)])
+async def get_vertex_profiles(
+    component: Annotated[str | None, Query(description="Only return the phases of this component type")] = None,
+) -> list[PhaseHistogram]:
+    """Histograms of the build phase timings of each component type since the server started."""
+    return get_vertex_profile_stats().histograms(component)
+
+
+@router.delete("/profiles", status_code=204, dependencies=[Depends(get_current_active_user)])
+async def delete_vertex_profiles() -> None:
+    get_vertex_profile_stats().clear()
+
+
 @router.get("/messages")
 async def get_messages(
     session: DbSession,
@@ -75,6 +90,8 @@ async def delete_messages(message_ids: list[UUID], session: DbSession) -> None:
         await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    # The sessions of the deleted messages are not known here
+    invalidate_message_history()
 
 
 @router.put("/messages/{message_id}", dependencies=[Depends(get_current_active_user)], response_model=MessageRead)
@@ -101,6 +118,7 @@ async def update_message(
         await session.refresh(db_message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    invalidate_message_history(db_message.session_id)
     return db_message
 
 
@@ -138,6 +156,8 @@ async def update_session_id(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    invalidate_message_history(old_session_id)
+    invalidate_message_history(new_session_id)
     return message_responses
 
 
@@ -155,6 +175,7 @@ async def delete_messages_session(
         await session.commit()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
+    invalidate_message_history(session_id)
 
     return {"message": "Messages deleted successfully"}
 
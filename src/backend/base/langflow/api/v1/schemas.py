@@ -273,6 +273,7 @@ class ResultDataResponse(BaseModel):
     timedelta: float | None = None
     duration: str | None = None
     used_frozen_result: bool | None = False
+    output_execution: dict[str, str] | None = None
 
     @field_serializer("results")
     @classmethod
@@ -292,6 +293,7 @@ class ResultDataResponse(BaseModel):
             "timedelta": self.timedelta,
             "duration": self.duration,
             "used_frozen_result": self.used_frozen_result,
+            "output_execution": self.output_execution,
         }
 
 
@@ -307,6 +309,8 @@ class VertexBuildResponse(BaseModel):
     """Mapping of vertex ids to result dict containing the param name and result value."""
     timestamp: datetime | None = Field(default_factory=lambda: datetime.now(timezone.utc))
     """Timestamp of the build."""
+    profile: dict[str, dict[str, Any]] | None = None
+    """Wall time, CPU time and net memory change of each build phase, when the vertex was profiled."""
 
     @field_serializer("data")
     def serialize_data(self, data: ResultDataResponse) -> dict:
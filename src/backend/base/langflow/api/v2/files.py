@@ -1,3 +1,4 @@
+import asyncio
 import re
 import uuid
 from collections.abc import AsyncGenerator
@@ -5,23 +6,55 @@ from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlmodel import String, cast, select
 
 from langflow.api.schemas import UploadFileResponse
 from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.schema.image import detect_image_format, with_image_extension
 from langflow.services.database.models.file import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
-from langflow.services.storage.service import StorageService
+from langflow.services.storage.service import STREAM_CHUNK_SIZE, StorageService
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
-
-async def byte_stream_generator(file_bytes: bytes, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
-    """Convert bytes object into an async generator that yields chunks."""
-    for i in range(0, len(file_bytes), chunk_size):
-        yield file_bytes[i : i + chunk_size]
+RANGE_HEADER_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+async def upload_file_chunks(file: UploadFile, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncGenerator[bytes, None]:
+    """Read an uploaded file in chunks instead of loading it into memory at once."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
+def parse_range_header(range_header: str, file_size: int) -> tuple[int, int] | None:
+    """Return the byte range [start, end) requested by a Range header.
+
+    Only single byte ranges are supported; None is returned for headers that should be ignored, in which
+    case the whole file is sent. Ranges that start past the end of the file raise a 416 error.
+    """
+    match = RANGE_HEADER_PATTERN.match(range_header.strip())
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last `last` bytes of the file
+        start, end = max(0, file_size - int(last)), file_size
+        if int(last) == 0 or file_size == 0:
+            start = end = file_size
+    else:
+        start = int(first)
+        end = file_size if last == "" else min(int(last) + 1, file_size)
+        if last != "" and int(last) < start:
+            return None
+    if start >= end:
+        raise HTTPException(
+            status_code=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{file_size}"},
+        )
+    return start, end
 
 
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
@@ -68,20 +101,23 @@ async def upload_user_file(
             detail=f"File size is larger than the maximum file size {max_file_size_upload}MB.",
         )
 
-    # Read file content and create a unique file name
+    # Create a unique file name and stream the file content to the storage
     try:
         # Create a unique file name
         file_id = uuid.uuid4()
-        file_content = await file.read()
 
         # Get file extension of the file
         file_extension = "." + file.filename.split(".")[-1] if file.filename and "." in file.filename else ""
-        anonymized_file_name = f"{file_id!s}{file_extension}"
+        # Detect images once, at upload time, and record the format in the extension of the stored file
+        image_format = await asyncio.to_thread(detect_image_format, file.file)
+        anonymized_file_name = with_image_extension(f"{file_id!s}{file_extension}", image_format)
 
         # Here we use the current user's id as the folder name
         folder = str(current_user.id)
-        # Save the file using the storage service.
-        await storage_service.save_file(flow_id=folder, file_name=anonymized_file_name, data=file_content)
+        # Save the file using the storage service, one chunk at a time.
+        file_size = await storage_service.save_file_stream(
+            flow_id=folder, file_name=anonymized_file_name, chunks=upload_file_chunks(file)
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
 
@@ -117,9 +153,6 @@ async def upload_user_file(
             # Split the extension from the filename
             root_filename = f"{root_filename} ({count + 1})"
 
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(flow_id=folder, file_name=anonymized_file_name)
-
         # Compute the file path
         file_path = f"{folder}/{anonymized_file_name}"
 
@@ -165,28 +198,41 @@ async def download_file(
     current_user: CurrentActiveUser,
     session: DbSession,
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
 ):
-    """Download a file by its ID."""
-    try:
-        # Fetch the file from the DB
-        file = await fetch_file_object(file_id, current_user, session)
+    """Download a file by its ID.
+
+    A single byte range can be requested with the Range header, e.g. to resume an interrupted download.
+    """
+    # Fetch the file from the DB
+    file = await fetch_file_object(file_id, current_user, session)
+    byte_range = parse_range_header(range_header, file.size) if range_header else None
+    start, end = byte_range or (0, file.size)
 
+    try:
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
 
         # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
-
-        # Ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+        byte_stream = await storage_service.get_file_stream(
+            flow_id=str(current_user.id), file_name=file_name, start=start, end=end
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading file: {e}") from e
 
+    headers = {
+        "Content-Disposition": f'attachment; filename="{file.name}"',
+        "Accept-Ranges": "bytes",
+    }
+    if byte_range:
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{file.size}"
+
     # Return the file as a streaming response
     return StreamingResponse(
         byte_stream,
+        status_code=HTTPStatus.PARTIAL_CONTENT if byte_range else HTTPStatus.OK,
         media_type="application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{file.name}"'},
+        headers=headers,
     )
 
 
@@ -1,3 +1,4 @@
+import asyncio
 import re
 from abc import abstractmethod
 from typing import TYPE_CHECKING, cast
@@ -8,6 +9,11 @@ from langchain_core.runnables import Runnable
 
 from langflow.base.agents.callback import AgentAsyncHandler
 from langflow.base.agents.events import ExceptionWithMessageError, process_agent_events
+from langflow.base.agents.tool_execution import (
+    DEFAULT_MAX_TOOL_CONCURRENCY,
+    ConcurrentToolsAgentExecutor,
+    get_session_tool_result_cache,
+)
 from langflow.base.agents.utils import data_to_messages
 from langflow.custom import Component
 from langflow.custom.custom_component.component import _get_component_toolkit
@@ -118,6 +124,23 @@ class LCAgentComponent(Component):
         # might be overridden in subclasses
         return None
 
+    def _get_session_id(self) -> str | None:
+        if hasattr(self, "graph"):
+            return self.graph.session_id
+        if hasattr(self, "_session_id"):
+            return self._session_id
+        return None
+
+    def get_tool_execution_kwargs(self) -> dict:
+        """Keyword arguments for the `ConcurrentToolsAgentExecutor` running this agent's tools."""
+        max_tool_concurrency = getattr(self, "max_tool_concurrency", None) or DEFAULT_MAX_TOOL_CONCURRENCY
+        session_id = self._get_session_id()
+        cache_tool_results = getattr(self, "cache_tool_results", False) and session_id
+        return {
+            "max_tool_concurrency": max_tool_concurrency,
+            "tool_result_cache": get_session_tool_result_cache(session_id) if cache_tool_results else None,
+        }
+
     async def run_agent(
         self,
         agent: Runnable | BaseSingleActionAgent | BaseMultiActionAgent | AgentExecutor,
@@ -131,12 +154,13 @@ class LCAgentComponent(Component):
             handle_parsing_errors = hasattr(self, "handle_parsing_errors") and self.handle_parsing_errors
             verbose = hasattr(self, "verbose") and self.verbose
             max_iterations = hasattr(self, "max_iterations") and self.max_iterations
-            runnable = AgentExecutor.from_agent_and_tools(
+            runnable = ConcurrentToolsAgentExecutor.from_agent_and_tools(
                 agent=agent,
                 tools=self.tools,
                 handle_parsing_errors=handle_parsing_errors,
                 verbose=verbose,
                 max_iterations=max_iterations,
+                **self.get_tool_execution_kwargs(),
             )
         input_dict: dict[str, str | list[BaseMessage]] = {"input": self.input_value}
         if hasattr(self, "system_prompt"):
@@ -144,12 +168,7 @@ class LCAgentComponent(Component):
         if hasattr(self, "chat_history") and self.chat_history:
             input_dict["chat_history"] = data_to_messages(self.chat_history)
 
-        if hasattr(self, "graph"):
-            session_id = self.graph.session_id
-        elif hasattr(self, "_session_id"):
-            session_id = self._session_id
-        else:
-            session_id = None
+        session_id = self._get_session_id()
 
         agent_message = Message(
             sender=MESSAGE_SENDER_AI,
@@ -167,6 +186,7 @@ class LCAgentComponent(Component):
                 ),
                 agent_message,
                 cast("SendMessageFunctionType", self.send_message),
+                self._send_message_delta_event,
             )
         except ExceptionWithMessageError as e:
             if hasattr(e, "agent_message") and hasattr(e.agent_message, "id"):
@@ -183,6 +203,10 @@ class LCAgentComponent(Component):
         self.status = result
         return result
 
+    async def _send_message_delta_event(self, delta: dict) -> None:
+        if hasattr(self, "_event_manager") and self._event_manager:
+            await asyncio.to_thread(self._event_manager.on_message_delta, data=delta)
+
     @abstractmethod
     def create_agent_runnable(self) -> Runnable:
         """Create the agent."""
@@ -211,15 +235,31 @@ class LCToolsAgentComponent(LCAgentComponent):
             info="These are the tools that the agent can use to help with tasks.",
         ),
         *LCAgentComponent._base_inputs,
+        IntInput(
+            name="max_tool_concurrency",
+            display_name="Max Parallel Tool Calls",
+            value=DEFAULT_MAX_TOOL_CONCURRENCY,
+            advanced=True,
+            info="The maximum number of tool calls from a single model turn that run at the same time.",
+        ),
+        BoolInput(
+            name="cache_tool_results",
+            display_name="Cache Tool Results",
+            value=True,
+            advanced=True,
+            info="Reuse the results of tools marked as idempotent when they are called again with the same input "
+            "in the same session.",
+        ),
     ]
 
     def build_agent(self) -> AgentExecutor:
         self.validate_tool_names()
         agent = self.create_agent_runnable()
-        return AgentExecutor.from_agent_and_tools(
+        return ConcurrentToolsAgentExecutor.from_agent_and_tools(
             agent=RunnableAgent(runnable=agent, input_keys_arg=["input"], return_keys_arg=["output"]),
             tools=self.tools,
             **self.get_agent_kwargs(flatten=True),
+            **self.get_tool_execution_kwargs(),
         )
 
     @abstractmethod
@@ -1,7 +1,7 @@
 # Add helper functions for each event type
 from collections.abc import AsyncIterator
 from time import perf_counter
-from typing import Any, Protocol
+from typing import Any, Protocol, cast
 
 from langchain_core.agents import AgentFinish
 from langchain_core.messages import BaseMessage
@@ -216,6 +216,110 @@ async def handle_on_chain_stream(
     return agent_message, start_time
 
 
+class SendMessageDeltaFunctionType(Protocol):
+    async def __call__(self, delta: dict[str, Any]) -> None: ...
+
+
+DEFAULT_PERSIST_INTERVAL = 2.0
+# Events that finish an agent step; the message is persisted on them once the persist interval has passed.
+STEP_BOUNDARY_EVENTS = {"on_chain_end", "on_tool_end", "on_tool_error"}
+
+
+def _dump_properties(message: Message) -> dict:
+    properties = message.properties
+    return dict(properties) if isinstance(properties, dict) else properties.model_dump()
+
+
+class IncrementalMessageSender:
+    """Sends agent message updates as deltas and persists the full message only from time to time.
+
+    It is passed to the event handlers in place of the component's `send_message`. Each update is sent to
+    the client as a delta that holds only the content blocks, contents, text and properties that changed since
+    the previous update. The full message is persisted (and re-sent) when it has no id yet, at a step boundary
+    once `persist_interval` seconds have passed since it was last persisted, and on `flush`.
+    """
+
+    def __init__(
+        self,
+        send_message_method: SendMessageFunctionType,
+        send_delta_method: SendMessageDeltaFunctionType,
+        persist_interval: float = DEFAULT_PERSIST_INTERVAL,
+    ):
+        self._send_message = send_message_method
+        self._send_delta = send_delta_method
+        self.persist_interval = persist_interval
+        self.at_step_boundary = False
+        self._last_persisted = perf_counter()
+        self._has_unpersisted_changes = False
+        self._sent_blocks: list[list[dict]] = []
+        self._sent_text: str | None = None
+        self._sent_properties: dict = {}
+
+    async def __call__(self, message: Message, **kwargs: Any) -> Message:  # noqa: ARG002
+        persist_due = self.at_step_boundary and perf_counter() - self._last_persisted >= self.persist_interval
+        if not getattr(message, "id", None) or persist_due:
+            return await self.persist(message)
+        if delta := self._diff(message):
+            await self._send_delta(delta)
+            self._has_unpersisted_changes = True
+        return message
+
+    async def persist(self, message: Message) -> Message:
+        stored_message = await self._send_message(message=message)
+        # Keep working on the same message so handlers holding its contents keep updating it.
+        message.id = getattr(stored_message, "id", None)
+        self._snapshot(message)
+        self._last_persisted = perf_counter()
+        self._has_unpersisted_changes = False
+        return message
+
+    async def flush(self, message: Message) -> Message:
+        """Persist the message if it changed since it was last persisted."""
+        if self._has_unpersisted_changes or self._diff(message):
+            return await self.persist(message)
+        return message
+
+    def _snapshot(self, message: Message) -> None:
+        self._sent_blocks = [
+            [content.model_dump() for content in block.contents] for block in message.content_blocks or []
+        ]
+        self._sent_text = message.text if isinstance(message.text, str) else None
+        self._sent_properties = _dump_properties(message)
+
+    def _diff(self, message: Message) -> dict[str, Any] | None:
+        blocks: list[dict[str, Any]] = []
+        contents: list[dict[str, Any]] = []
+        for block_index, block in enumerate(message.content_blocks or []):
+            if block_index >= len(self._sent_blocks):
+                blocks.append({"block_index": block_index, "block": block.model_dump()})
+                self._sent_blocks.append([content.model_dump() for content in block.contents])
+                continue
+            sent_contents = self._sent_blocks[block_index]
+            for content_index, content in enumerate(block.contents):
+                dumped = content.model_dump()
+                if content_index < len(sent_contents) and sent_contents[content_index] == dumped:
+                    continue
+                contents.append({"block_index": block_index, "content_index": content_index, "content": dumped})
+                if content_index < len(sent_contents):
+                    sent_contents[content_index] = dumped
+                else:
+                    sent_contents.append(dumped)
+
+        delta: dict[str, Any] = {}
+        if blocks:
+            delta["blocks"] = blocks
+        if contents:
+            delta["contents"] = contents
+        if isinstance(message.text, str) and message.text != self._sent_text:
+            delta["text"] = self._sent_text = message.text
+        properties = _dump_properties(message)
+        if properties != self._sent_properties:
+            delta["properties"] = self._sent_properties = properties
+        if not delta:
+            return None
+        return {"id": str(message.id), **delta}
+
+
 class ToolEventHandler(Protocol):
     async def __call__(
         self,
@@ -257,8 +361,22 @@ async def process_agent_events(
     agent_executor: AsyncIterator[dict[str, Any]],
     agent_message: Message,
     send_message_method: SendMessageFunctionType,
+    send_delta_method: SendMessageDeltaFunctionType | None = None,
+    persist_interval: float = DEFAULT_PERSIST_INTERVAL,
 ) -> Message:
-    """Process agent events and return the final output."""
+    """Process agent events and return the final output.
+
+    When `send_delta_method` is given, intermediate updates are sent to the client as deltas and the message
+    is only persisted at step boundaries, at most once every `persist_interval` seconds, and at the end.
+    Otherwise every update persists and re-sends the whole message.
+    """
+    sender = (
+        IncrementalMessageSender(send_message_method, send_delta_method, persist_interval)
+        if send_delta_method is not None
+        else None
+    )
+    if sender is not None:
+        send_message_method = cast("SendMessageFunctionType", sender)
     if isinstance(agent_message.properties, dict):
         agent_message.properties.update({"icon": "Bot", "state": "partial"})
     else:
@@ -271,6 +389,8 @@ async def process_agent_events(
         tool_blocks_map: dict[str, ToolContent] = {}
         start_time = perf_counter()
         async for event in agent_executor:
+            if sender is not None:
+                sender.at_step_boundary = event["event"] in STEP_BOUNDARY_EVENTS
             if event["event"] in TOOL_EVENT_HANDLERS:
                 tool_handler = TOOL_EVENT_HANDLERS[event["event"]]
                 agent_message, start_time = await tool_handler(
@@ -280,6 +400,8 @@ async def process_agent_events(
                 chain_handler = CHAIN_EVENT_HANDLERS[event["event"]]
                 agent_message, start_time = await chain_handler(event, agent_message, send_message_method, start_time)
         agent_message.properties.state = "complete"
+        if sender is not None:
+            agent_message = await sender.flush(agent_message)
     except Exception as e:
         raise ExceptionWithMessageError(agent_message, str(e)) from e
     return await Message.create(**agent_message.model_dump())
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache, TTLCache
+from langchain.agents import AgentExecutor
+from langchain_core.tools import BaseTool
+from pydantic import PrivateAttr
+
+if TYPE_CHECKING:
+    from langchain_core.agents import AgentAction, AgentStep
+    from langchain_core.callbacks import AsyncCallbackManagerForChainRun
+
+IDEMPOTENT_TOOL_METADATA_KEY = "idempotent"
+DEFAULT_MAX_TOOL_CONCURRENCY = 4
+
+_MISSING = object()
+
+
+def is_idempotent_tool(tool: BaseTool) -> bool:
+    """Whether the tool declares that repeated calls with the same input return the same result."""
+    return bool(tool.metadata and tool.metadata.get(IDEMPOTENT_TOOL_METADATA_KEY))
+
+
+class ToolResultCache:
+    """Observations returned by idempotent tools, keyed by tool name and input."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600):
+        self._results: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(tool_name: str, tool_input: str | dict) -> str:
+        return f"{tool_name}:{json.dumps(tool_input, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            return self._results.get(key, _MISSING)
+
+    def set(self, key: str, observation: Any) -> None:
+        with self._lock:
+            self._results[key] = observation
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+_session_tool_result_caches: LRUCache = LRUCache(maxsize=1024)
+_session_tool_result_caches_lock = threading.Lock()
+
+
+def get_session_tool_result_cache(session_id: str) -> ToolResultCache:
+    """Return the tool result cache shared by the agent runs of a session."""
+    with _session_tool_result_caches_lock:
+        cache = _session_tool_result_caches.get(session_id)
+        if cache is None:
+            cache = _session_tool_result_caches[session_id] = ToolResultCache()
+        return cache
+
+
+def clear_session_tool_result_cache(session_id: str | None = None) -> None:
+    with _session_tool_result_caches_lock:
+        if session_id is None:
+            _session_tool_result_caches.clear()
+        else:
+            _session_tool_result_caches.pop(session_id, None)
+
+
+class CachedResultTool(BaseTool):
+    """Stands in for a tool whose result is already cached.
+
+    Running it through the executor keeps the usual tool start and end events for the cached call.
+    """
+
+    observation: Any = None
+
+    def _run(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ARG002
+        return self.observation
+
+    async def _arun(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ARG002
+        return self.observation
+
+
+class ConcurrentToolsAgentExecutor(AgentExecutor):
+    """Agent executor that bounds concurrent tool calls and reuses results of idempotent tools.
+
+    The tool calls of one model turn already run concurrently when the executor is used asynchronously;
+    `max_tool_concurrency` limits how many of them run at the same time. Calls to tools that declare
+    `idempotent` in their metadata are answered from `tool_result_cache` when the same call was already made.
+    """
+
+    max_tool_concurrency: int = DEFAULT_MAX_TOOL_CONCURRENCY
+    tool_result_cache: ToolResultCache | None = None
+    _tool_semaphore: asyncio.Semaphore | None = PrivateAttr(default=None)
+
+    def _get_tool_semaphore(self) -> asyncio.Semaphore:
+        if self._tool_semaphore is None:
+            self._tool_semaphore = asyncio.Semaphore(max(1, self.max_tool_concurrency))
+        return self._tool_semaphore
+
+    async def _aperform_agent_action(
+        self,
+        name_to_tool_map: dict[str, BaseTool],
+        color_mapping: dict[str, str],
+        agent_action: AgentAction,
+        run_manager: AsyncCallbackManagerForChainRun | None = None,
+    ) -> AgentStep:
+        tool = name_to_tool_map.get(agent_action.tool)
+        cache_key = None
+        if self.tool_result_cache is not None and tool is not None and is_idempotent_tool(tool):
+            cache_key = ToolResultCache.make_key(tool.name, agent_action.tool_input)
+            observation = self.tool_result_cache.get(cache_key)
+            if observation is not _MISSING:
+                cached_tool = CachedResultTool(
+                    name=tool.name,
+                    description=tool.description,
+                    return_direct=tool.return_direct,
+                    observation=observation,
+                )
+                return await super()._aperform_agent_action(
+                    {**name_to_tool_map, tool.name: cached_tool}, color_mapping, agent_action, run_manager
+                )
+
+        async with self._get_tool_semaphore():
+            step = await super()._aperform_agent_action(name_to_tool_map, color_mapping, agent_action, run_manager)
+        if cache_key is not None and self.tool_result_cache is not None:
+            self.tool_result_cache.set(cache_key, step.observation)
+        return step
@@ -1,11 +1,14 @@
 import asyncio
+import contextlib
 import os
+import time
 from collections.abc import Awaitable, Callable
 from contextlib import AsyncExitStack
 from typing import Any
 from urllib.parse import urlparse
 from uuid import UUID
 
+import anyio
 import httpx
 from httpx import codes as httpx_codes
 from loguru import logger
@@ -15,6 +18,7 @@ from pydantic import BaseModel, Field, create_model
 from sqlmodel import select
 
 from langflow.services.database.models import Flow
+from langflow.services.telemetry.event_loop_watchdog import require_main_loop
 
 HTTP_ERROR_STATUS_CODE = httpx_codes.BAD_REQUEST  # HTTP status code for client errors
 
@@ -331,3 +335,219 @@ class MCPSseClient:
 
         msg = f"Failed to connect after {self.max_retries} attempts. Last error: {last_error}"
         raise ConnectionError(msg)
+
+
+class MCPPooledSession:
+    """A shared MCP client session owned by `MCPSessionPool`.
+
+    The transport and `ClientSession` are opened and closed inside a dedicated owner task, since
+    the MCP transports use anyio task groups that must be exited by the task that entered them.
+    Any number of callers can use `call_tool` at the same time; requests are multiplexed over the
+    single session by their JSON-RPC ids.
+    """
+
+    def __init__(self, pool: "MCPSessionPool", key: tuple, connect: Callable[[], Awaitable[tuple[Any, list]]]):
+        self.key = key
+        self.tools: list = []
+        self.client: Any = None
+        self.loop = asyncio.get_running_loop()
+        self.last_used = time.monotonic()
+        self._pool = pool
+        self._connect = connect
+        self._last_checked = 0.0
+        self._in_flight = 0
+        self._lock = asyncio.Lock()
+        self._close_event: asyncio.Event | None = None
+        self._owner_task: asyncio.Task | None = None
+
+    @property
+    def session(self) -> ClientSession | None:
+        return self.client.session if self.client is not None else None
+
+    @property
+    def idle(self) -> bool:
+        return self._in_flight == 0 and time.monotonic() - self.last_used > self._pool.idle_timeout
+
+    async def ensure_connected(self) -> None:
+        """Make sure the session is usable, reconnecting with exponential backoff if it is not."""
+        async with self._lock:
+            if await self._is_healthy():
+                return
+            await self.close()
+            last_error: Exception | None = None
+            for attempt in range(self._pool.max_retries):
+                try:
+                    await self._open()
+                except Exception as e:  # noqa: BLE001
+                    last_error = e
+                    logger.warning(f"MCP connection attempt {attempt + 1} for {self.key[0]} failed: {e}")
+                else:
+                    return
+                if attempt < self._pool.max_retries - 1:
+                    await asyncio.sleep(min(self._pool.backoff_max, self._pool.backoff_base * 2**attempt))
+            msg = f"Failed to connect after {self._pool.max_retries} attempts. Last error: {last_error}"
+            raise ConnectionError(msg) from last_error
+
+    async def call_tool(self, name: str, arguments: dict | None = None):
+        """Call a tool on the pooled session, reconnecting once if the transport was closed."""
+        self._in_flight += 1
+        try:
+            await self.ensure_connected()
+            try:
+                return await self.session.call_tool(name, arguments=arguments)
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                logger.warning(f"MCP session for {self.key[0]} was closed, reconnecting")
+                self._last_checked = 0.0
+                await self.ensure_connected()
+                return await self.session.call_tool(name, arguments=arguments)
+        finally:
+            self._in_flight -= 1
+            self.last_used = time.monotonic()
+
+    async def close(self) -> None:
+        """Stop the owner task, which closes the session and its transport."""
+        if self._owner_task is None:
+            return
+        if self._close_event is not None:
+            self._close_event.set()
+        await asyncio.wait({self._owner_task}, timeout=self._pool.close_timeout)
+        if not self._owner_task.done():
+            self._owner_task.cancel()
+        self._owner_task = None
+        self.client = None
+
+    async def _is_healthy(self) -> bool:
+        if self.session is None or self._owner_task is None or self._owner_task.done():
+            return False
+        if time.monotonic() - self._last_checked < self._pool.ping_interval:
+            return True
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=self._pool.ping_timeout)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"MCP health ping for {self.key[0]} failed: {e}")
+            return False
+        self._last_checked = time.monotonic()
+        return True
+
+    async def _open(self) -> None:
+        ready: asyncio.Future = self.loop.create_future()
+        self._close_event = asyncio.Event()
+        self._owner_task = asyncio.create_task(self._own_session(ready, self._close_event))
+        self.client, self.tools = await ready
+        self._last_checked = time.monotonic()
+
+    async def _own_session(self, ready: asyncio.Future, close_event: asyncio.Event) -> None:
+        client = None
+        try:
+            client, tools = await self._connect()
+            ready.set_result((client, tools))
+            await close_event.wait()
+        except Exception as e:  # noqa: BLE001
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.debug(f"MCP session for {self.key[0]} ended: {e}")
+        finally:
+            if client is not None:
+                with contextlib.suppress(Exception):
+                    await client.exit_stack.aclose()
+
+
+class MCPSessionPool:
+    """Process-level pool of MCP client sessions keyed by their connection parameters.
+
+    Stdio sessions are keyed by command and env, SSE sessions by URL and headers. Sessions are
+    reused across component builds together with the tool list fetched when they connected,
+    health-checked with a ping when they have not been used for `ping_interval` seconds, and
+    closed after `idle_timeout` seconds without use.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_timeout: float = 300.0,
+        ping_interval: float = 30.0,
+        ping_timeout: float = 5.0,
+        close_timeout: float = 5.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+    ):
+        self.idle_timeout = idle_timeout
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.close_timeout = close_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._sessions: dict[tuple, MCPPooledSession] = {}
+
+    async def get_stdio_session(self, command: str, env: list[str] | None = None) -> MCPPooledSession:
+        env = list(env or [])
+
+        async def connect():
+            client = MCPStdioClient()
+            tools = await client.connect_to_server(command, env)
+            return client, tools
+
+        return await self._get_session(("stdio", command, tuple(sorted(env))), connect)
+
+    async def get_sse_session(self, url: str | None, headers: dict[str, str] | None = None) -> MCPPooledSession:
+        headers = dict(headers or {})
+
+        async def connect():
+            client = MCPSseClient()
+            # The pool retries with its own backoff
+            client.max_retries = 1
+            tools = await client.connect_to_server(url, headers)
+            return client, tools
+
+        return await self._get_session(("sse", url, tuple(sorted(headers.items()))), connect)
+
+    async def close(self) -> None:
+        """Close every pooled session that belongs to the running event loop."""
+        loop = asyncio.get_running_loop()
+        sessions = [session for session in self._sessions.values() if session.loop is loop]
+        for session in sessions:
+            self._sessions.pop(session.key, None)
+        await asyncio.gather(*(session.close() for session in sessions))
+
+    async def _get_session(self, key: tuple, connect: Callable[[], Awaitable[tuple[Any, list]]]) -> MCPPooledSession:
+        # Pooled sessions outlive the build, so they must belong to the main event loop
+        require_main_loop("The MCP session pool")
+        await self._close_idle_sessions(exclude=key)
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(key)
+        # Sessions are bound to the event loop that opened them
+        if session is None or session.loop is not loop:
+            session = MCPPooledSession(self, key, connect)
+            self._sessions[key] = session
+        await session.ensure_connected()
+        session.last_used = time.monotonic()
+        return session
+
+    async def _close_idle_sessions(self, exclude: tuple) -> None:
+        loop = asyncio.get_running_loop()
+        idle = [
+            session
+            for key, session in self._sessions.items()
+            if key != exclude and session.loop is loop and session.idle
+        ]
+        for session in idle:
+            self._sessions.pop(session.key, None)
+        await asyncio.gather(*(session.close() for session in idle))
+
+
+_mcp_session_pool: MCPSessionPool | None = None
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    global _mcp_session_pool  # noqa: PLW0603
+    if _mcp_session_pool is None:
+        _mcp_session_pool = MCPSessionPool()
+    return _mcp_session_pool
+
+
+async def close_mcp_session_pool() -> None:
+    if _mcp_session_pool is not None:
+        await _mcp_session_pool.close()
@@ -9,7 +9,7 @@ from langflow.custom.custom_component.component import _get_component_toolkit
 from langflow.field_typing import Tool
 from langflow.graph.graph.base import Graph
 from langflow.graph.vertex.base import Vertex
-from langflow.helpers.flow import get_flow_inputs
+from langflow.helpers.flow import get_flow_graph_template, get_flow_inputs
 from langflow.inputs.inputs import (
     DropdownInput,
     InputTypes,
@@ -111,11 +111,11 @@ class RunFlowBaseComponent(Component):
 
     async def get_graph(self, flow_name_selected: str | None = None) -> Graph:
         if flow_name_selected:
-            flow_data = await self.get_flow(flow_name_selected)
-            if flow_data:
-                return Graph.from_payload(flow_data.data["data"])
-            msg = "Flow not found"
-            raise ValueError(msg)
+            try:
+                return await get_flow_graph_template(str(self.user_id), flow_name=flow_name_selected)
+            except ValueError as e:
+                msg = "Flow not found"
+                raise ValueError(msg) from e
         # Ensure a Graph is always returned or an exception is raised
         msg = "No valid flow JSON or flow name selected."
         raise ValueError(msg)
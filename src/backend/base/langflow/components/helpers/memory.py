@@ -2,7 +2,7 @@ from langflow.custom import Component
 from langflow.helpers.data import data_to_text
 from langflow.inputs import HandleInput
 from langflow.io import DropdownInput, IntInput, MessageTextInput, MultilineInput, Output
-from langflow.memory import aget_messages
+from langflow.memory import aget_message_history, aget_messages
 from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
@@ -103,6 +103,15 @@ class MemoryComponent(Component):
             if sender:
                 expected_type = MESSAGE_SENDER_AI if sender == MESSAGE_SENDER_AI else MESSAGE_SENDER_USER
                 stored = [m for m in stored if m.type == expected_type]
+        elif session_id and n_messages:
+            # Fetch the latest messages only; the history page is ordered oldest first
+            page = await aget_message_history(
+                session_id,
+                sender=sender,
+                sender_name=sender_name,
+                limit=n_messages,
+            )
+            stored = page.messages[::-1] if order == "DESC" else page.messages
         else:
             stored = await aget_messages(
                 sender=sender,
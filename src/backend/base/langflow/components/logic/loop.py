@@ -1,5 +1,9 @@
+import asyncio
+
+from loguru import logger
+
 from langflow.custom import Component
-from langflow.io import DataInput, Output
+from langflow.io import BoolInput, DataInput, IntInput, Output
 from langflow.schema import Data
 
 
@@ -16,6 +20,24 @@ class LoopComponent(Component):
             display_name="Data",
             info="The initial list of Data objects to iterate over.",
         ),
+        BoolInput(
+            name="map_mode",
+            display_name="Map Mode",
+            info=(
+                "Run the loop body for all items concurrently, each on its own copy of the body components, "
+                "instead of one item per cycle. Results keep the order of the items: failed items are returned as Data "
+                "with an 'error' key and items whose body returned nothing as empty Data."
+            ),
+            value=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of items processed at the same time in map mode.",
+            value=4,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -58,6 +80,11 @@ class LoopComponent(Component):
 
     def item_output(self) -> Data:
         """Output the next item in the list or stop if done."""
+        if self.map_mode:
+            # The body runs inside done_output in map mode, never through the loop edge
+            self.stop("item")
+            return Data(text="")
+
         self.initialize_data()
         current_item = Data(text="")
 
@@ -77,8 +104,14 @@ class LoopComponent(Component):
         self.update_ctx({f"{self._id}_index": current_index + 1})
         return current_item
 
-    def done_output(self) -> Data:
+    async def done_output(self) -> Data:
         """Trigger the done output when iteration is complete."""
+        if self.map_mode:
+            aggregated = await self.map_items()
+            self.stop("item")
+            self.start("done")
+            return aggregated
+
         self.initialize_data()
 
         if self.evaluate_stop_loop():
@@ -109,3 +142,47 @@ class LoopComponent(Component):
             aggregated.append(self.item)
             self.update_ctx({f"{self._id}_aggregated": aggregated})
         return aggregated
+
+    async def map_items(self) -> list[Data]:
+        """Run the loop body once per item concurrently and return the results in input order."""
+        data_list = self._validate_data(self.data)
+        graph = self.graph
+        loop_id = self._vertex.id
+        body_ids = graph.get_loop_body_vertex_ids(loop_id, "item")
+        item_edges = [
+            edge for edge in graph.get_vertex_edges(loop_id, is_target=False) if edge.source_handle.name == "item"
+        ]
+        loop_back_edges = [
+            edge for edge in graph.get_vertex_edges(loop_id, is_source=False) if edge.source_id in body_ids
+        ]
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency or 1))
+
+        async def run_item(index: int, item: Data) -> Data | list:
+            async with semaphore:
+                try:
+                    input_values: dict[str, dict] = {}
+                    for edge in item_edges:
+                        input_values.setdefault(edge.target_id, {})[edge.target_param] = item
+                    body = graph.create_isolated_subgraph(body_ids, exclude=[loop_id], input_values=input_values)
+                    await body.process(fallback_to_env_vars=False)
+                    results = [
+                        body.get_vertex(edge.source_id).results.get(edge.source_handle.name) for edge in loop_back_edges
+                    ]
+                except Exception as e:  # noqa: BLE001
+                    logger.opt(exception=True).debug(f"Error processing item {index} in {self.display_name}")
+                    return Data(data={"error": str(e), "index": index})
+                if len(results) != 1:
+                    return results
+                # An empty Data keeps the item's place when the body returns nothing, so result i belongs to item i
+                return Data() if results[0] is None else results[0]
+
+        aggregated = list(await asyncio.gather(*(run_item(index, item) for index, item in enumerate(data_list))))
+        self.update_ctx(
+            {
+                f"{self._id}_data": data_list,
+                f"{self._id}_index": len(data_list) + 1,
+                f"{self._id}_aggregated": aggregated,
+                f"{self._id}_initialized": True,
+            }
+        )
+        return aggregated
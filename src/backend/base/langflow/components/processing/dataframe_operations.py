@@ -154,34 +154,37 @@ class DataFrameOperationsComponent(Component):
         return build_config
 
     def perform_operation(self) -> DataFrame:
-        dataframe_copy = self.df.copy()
+        # The operations return new frames, so the input is not copied: with Arrow storage, selecting columns
+        # or rows shares its buffers
+        dataframe = self.df
         operation = self.operation
 
         if operation == "Filter":
-            return self.filter_rows_by_value(dataframe_copy)
+            return self.filter_rows_by_value(dataframe)
         if operation == "Sort":
-            return self.sort_by_column(dataframe_copy)
+            return self.sort_by_column(dataframe)
         if operation == "Drop Column":
-            return self.drop_column(dataframe_copy)
+            return self.drop_column(dataframe)
         if operation == "Rename Column":
-            return self.rename_column(dataframe_copy)
+            return self.rename_column(dataframe)
         if operation == "Add Column":
-            return self.add_column(dataframe_copy)
+            return self.add_column(dataframe)
         if operation == "Select Columns":
-            return self.select_columns(dataframe_copy)
+            return self.select_columns(dataframe)
         if operation == "Head":
-            return self.head(dataframe_copy)
+            return self.head(dataframe)
         if operation == "Tail":
-            return self.tail(dataframe_copy)
+            return self.tail(dataframe)
         if operation == "Replace Value":
-            return self.replace_values(dataframe_copy)
+            return self.replace_values(dataframe)
         msg = f"Unsupported operation: {operation}"
 
         raise ValueError(msg)
 
     # Existing methods
     def filter_rows_by_value(self, df: DataFrame) -> DataFrame:
-        return DataFrame(df[df[self.column_name] == self.filter_value])
+        # Arrow-backed columns compare missing values to <NA> rather than False
+        return DataFrame(df[(df[self.column_name] == self.filter_value).fillna(value=False)])
 
     def sort_by_column(self, df: DataFrame) -> DataFrame:
         return DataFrame(df.sort_values(by=self.column_name, ascending=self.ascending))
@@ -193,8 +196,7 @@ class DataFrameOperationsComponent(Component):
         return DataFrame(df.rename(columns={self.column_name: self.new_column_name}))
 
     def add_column(self, df: DataFrame) -> DataFrame:
-        df[self.new_column_name] = [self.new_column_value] * len(df)
-        return DataFrame(df)
+        return DataFrame(df.assign(**{self.new_column_name: [self.new_column_value] * len(df)}))
 
     def select_columns(self, df: DataFrame) -> DataFrame:
         columns = [col.strip() for col in self.columns_to_select]
@@ -208,5 +210,5 @@ class DataFrameOperationsComponent(Component):
         return DataFrame(df.tail(self.num_rows))
 
     def replace_values(self, df: DataFrame) -> DataFrame:
-        df[self.column_name] = df[self.column_name].replace(self.replace_value, self.replacement_value)
-        return DataFrame(df)
+        replaced = df[self.column_name].replace(self.replace_value, self.replacement_value)
+        return DataFrame(df.assign(**{self.column_name: replaced}))
@@ -2,7 +2,7 @@ from langchain_text_splitters import CharacterTextSplitter
 
 from langflow.custom import Component
 from langflow.io import DropdownInput, HandleInput, IntInput, MessageTextInput, Output
-from langflow.schema import Data, DataFrame
+from langflow.schema import Data, DataBatch, DataFrame
 from langflow.utils.util import unescape_string
 
 
@@ -67,8 +67,8 @@ class SplitTextComponent(Component):
         Output(display_name="DataFrame", name="dataframe", method="as_dataframe"),
     ]
 
-    def _docs_to_data(self, docs) -> list[Data]:
-        return [Data(text=doc.page_content, data=doc.metadata) for doc in docs]
+    def _docs_to_data(self, docs) -> DataBatch:
+        return DataBatch.from_documents(docs)
 
     def _fix_separator(self, separator: str) -> str:
         """Fix common separator issues and convert to proper format."""
@@ -133,7 +133,9 @@ class SplitTextComponent(Component):
             raise TypeError(msg) from e
 
     def split_text(self) -> list[Data]:
-        return self._docs_to_data(self.split_text_base())
+        # Downstream components check for a list
+        return self._docs_to_data(self.split_text_base()).to_data_list()
 
     def as_dataframe(self) -> DataFrame:
-        return DataFrame(self.split_text())
+        # Built from the columns of the batch, without a Data object per chunk
+        return DataFrame(self._docs_to_data(self.split_text_base()))
@@ -4,11 +4,11 @@ from typing import Any
 from langchain_core.tools import StructuredTool
 
 from langflow.base.mcp.util import (
-    MCPSseClient,
-    MCPStdioClient,
+    MCPPooledSession,
     create_input_schema_from_json_schema,
     create_tool_coroutine,
     create_tool_func,
+    get_mcp_session_pool,
 )
 from langflow.custom import Component
 from langflow.inputs import DropdownInput, TableInput
@@ -59,8 +59,7 @@ def maybe_unflatten_dict(flat: dict[str, Any]) -> dict[str, Any]:
 
 class MCPToolsComponent(Component):
     schema_inputs: list[InputTypes] = []
-    stdio_client: MCPStdioClient = MCPStdioClient()
-    sse_client: MCPSseClient = MCPSseClient()
+    mcp_session: MCPPooledSession | None = None
     tools: list = []
     tool_names: list[str] = []
     _tool_cache: dict = {}  # Cache for tool objects
@@ -439,12 +438,14 @@ class MCPToolsComponent(Component):
             headers = self._process_headers(headers)
             await self._validate_connection_params(mode, command, url)
 
+            pool = get_mcp_session_pool()
             if mode == "Stdio":
-                if not self.stdio_client.session:
-                    self.tools = await self.stdio_client.connect_to_server(command, env)
-            elif mode == "SSE" and not self.sse_client.session:
+                self.mcp_session = await pool.get_stdio_session(command, env)
+                self.tools = self.mcp_session.tools
+            elif mode == "SSE":
                 try:
-                    self.tools = await self.sse_client.connect_to_server(url, headers)
+                    self.mcp_session = await pool.get_sse_session(url, headers)
+                    self.tools = self.mcp_session.tools
                 except ValueError as e:
                     # URL validation error
                     logger.error(f"SSE URL validation error: {e}")
@@ -482,17 +483,17 @@ class MCPToolsComponent(Component):
                         logger.warning(f"Empty schema for tool '{tool.name}', skipping")
                         continue
 
-                    client = self.stdio_client if self.mode == "Stdio" else self.sse_client
-                    if not client or not client.session:
+                    if not self.mcp_session or not self.mcp_session.session:
                         msg = f"Invalid client session for tool '{tool.name}'"
                         raise ValueError(msg)
 
+                    # The pooled session reconnects on its own, so the tools hold it rather than the raw session
                     tool_obj = StructuredTool(
                         name=tool.name,
                         description=tool.description or "",
                         args_schema=args_schema,
-                        func=create_tool_func(tool.name, args_schema, client.session),
-                        coroutine=create_tool_coroutine(tool.name, args_schema, client.session),
+                        func=create_tool_func(tool.name, args_schema, self.mcp_session),
+                        coroutine=create_tool_coroutine(tool.name, args_schema, self.mcp_session),
                         tags=[tool.name],
                     )
                     tool_list.append(tool_obj)
@@ -5,6 +5,7 @@ import asyncio
 import inspect
 from collections.abc import AsyncIterator, Iterator
 from copy import deepcopy
+from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
 from uuid import UUID
@@ -22,22 +23,31 @@ from langflow.base.tools.constants import (
     TOOLS_METADATA_INFO,
     TOOLS_METADATA_INPUT_NAME,
 )
+from langflow.custom.custom_component.output_execution import (
+    ASYNC_EXECUTION,
+    WORKER_LOOP_EXECUTION,
+    run_sync_output,
+)
 from langflow.custom.tree_visitor import RequiredInputsVisitor
 from langflow.exceptions.component import StreamingError
 from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_output
 from langflow.graph.state.model import create_state_model
 from langflow.graph.utils import has_chat_output
+from langflow.graph.vertex.profiling import profile_phase
 from langflow.helpers.custom import format_type
 from langflow.memory import astore_message, aupdate_messages, delete_message
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
+from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import ErrorMessage, Message
 from langflow.schema.properties import Source
 from langflow.schema.table import FieldParserType, TableOptions
+from langflow.services.deps import get_settings_service
+from langflow.services.telemetry.event_loop_watchdog import get_event_loop_watchdog
 from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
-from langflow.utils.async_helpers import run_until_complete
+from langflow.utils.async_helpers import MainLoopRequiredError, run_in_worker_loop, run_until_complete
 from langflow.utils.util import find_closest_match
 
 from .custom_component import CustomComponent
@@ -50,7 +60,6 @@ if TYPE_CHECKING:
     from langflow.graph.edge.schema import EdgeData
     from langflow.graph.vertex.base import Vertex
     from langflow.inputs.inputs import InputTypes
-    from langflow.schema.dataframe import DataFrame
     from langflow.schema.log import LoggableType
 
 
@@ -97,6 +106,8 @@ class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
+    sync_output_execution: ClassVar[str | None] = None
+    """Where synchronous output methods run: "inline", "thread" or "process". Defaults to the setting."""
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -106,6 +117,7 @@ class Component(CustomComponent):
         self._output_logs: dict[str, list[Log]] = {}
         self._current_output: str = ""
         self._metadata: dict = {}
+        self._output_execution: dict[str, str] = {}
         self._ctx: dict = {}
         self._code: str | None = None
         self._logs: list[Log] = []
@@ -909,6 +921,7 @@ class Component(CustomComponent):
     async def _build_without_tracing(self):
         return await self._build_results()
 
+    @profile_phase("build_results")
     async def build_results(self):
         """Build the results of the component."""
         if hasattr(self, "graph"):
@@ -940,6 +953,7 @@ class Component(CustomComponent):
 
     async def _build_results(self) -> tuple[dict, dict]:
         results, artifacts = {}, {}
+        self._output_execution = {}
 
         self._pre_run_setup_if_needed()
         self._handle_tool_mode()
@@ -982,10 +996,24 @@ class Component(CustomComponent):
 
         method = getattr(self, output.method)
         try:
-            result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
+            if not inspect.iscoroutinefunction(method):
+                result, execution = await run_sync_output(self, output.method)
+            elif self._vertex is not None and get_event_loop_watchdog().is_offloaded(self._vertex.vertex_type):
+                # This component type has blocked the event loop before, so keep it off the main loop
+                try:
+                    result = await run_in_worker_loop(method)
+                except MainLoopRequiredError:
+                    # It uses services bound to the main loop, where its later builds run
+                    get_event_loop_watchdog().keep_on_main_loop(self._vertex.vertex_type)
+                    raise
+                execution = WORKER_LOOP_EXECUTION
+            else:
+                result = await method()
+                execution = ASYNC_EXECUTION
         except TypeError as e:
             msg = f'Error running method "{output.method}": {e}'
             raise TypeError(msg) from e
+        self._output_execution[output.name] = execution
 
         if (
             self._vertex is not None
@@ -995,10 +1023,22 @@ class Component(CustomComponent):
         ):
             result.set_flow_id(self._vertex.graph.flow_id)
         result = output.apply_options(result)
+        if isinstance(result, DataFrame):
+            result = await self._apply_dataframe_storage(result)
         output.value = result
 
         return result
 
+    async def _apply_dataframe_storage(self, dataframe: DataFrame) -> DataFrame:
+        settings = get_settings_service().settings
+        if settings.dataframe_storage != "arrow":
+            return dataframe
+        spill_dir = Path(settings.config_dir) / "dataframes" if settings.config_dir else None
+        # Converting and spilling large frames blocks
+        return await asyncio.to_thread(
+            dataframe.to_arrow_backed, spill_threshold=settings.dataframe_spill_threshold, spill_dir=spill_dir
+        )
+
     def _build_artifact(self, result):
         custom_repr = self.custom_repr()
         if custom_repr is None and isinstance(result, dict | Data | str):
@@ -1278,6 +1318,7 @@ class Component(CustomComponent):
             and not isinstance(message, ErrorMessage)
         )
 
+    @profile_phase("send_message")
     async def send_message(self, message: Message, id_: str | None = None):
         if self._should_skip_message(message):
             return message
@@ -1311,6 +1352,7 @@ class Component(CustomComponent):
         self.status = stored_message
         return stored_message
 
+    @profile_phase("store_message")
     async def _store_message(self, message: Message) -> Message:
         flow_id: str | None = None
         if hasattr(self, "graph"):
@@ -1323,6 +1365,7 @@ class Component(CustomComponent):
         stored_message = stored_messages[0]
         return await Message.create(**stored_message.model_dump())
 
+    @profile_phase("emit_event")
     async def _send_message_event(self, message: Message, id_: str | None = None, category: str | None = None) -> None:
         if hasattr(self, "_event_manager") and self._event_manager:
             data_dict = message.data.copy() if hasattr(message, "data") else message.model_dump()
@@ -0,0 +1,122 @@
+"""Where the synchronous output methods of components run.
+
+Async output methods are awaited on the event loop. Synchronous ones would block it, so they run according to the
+component's `sync_output_execution` policy, or to the `sync_output_execution` setting if the component sets none:
+
+- `thread`: in the default thread pool. Blocking I/O no longer stalls the loop, but pure Python work still
+  competes with it for the GIL.
+- `process`: in a pool of worker processes. The component is re-created in the worker from its code and input
+  values, so only outputs that depend on nothing but their inputs should use it: events, logs and other side
+  effects are lost, except for the component status. Outputs whose inputs cannot be pickled run in a thread.
+- `inline`: on the event loop, for methods too quick to be worth the hop to a thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from langflow.services.deps import get_settings_service
+from langflow.utils import validate
+
+if TYPE_CHECKING:
+    from langflow.custom.custom_component.component import Component
+
+
+class OutputExecution(str, Enum):
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+ASYNC_EXECUTION = "async"
+"""Reported for async output methods, which are awaited on the event loop."""
+WORKER_LOOP_EXECUTION = "worker_loop"
+"""Reported for async output methods moved to an event loop in a worker thread by the event loop watchdog."""
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+
+
+def get_output_process_pool() -> ProcessPoolExecutor:
+    global _process_pool  # noqa: PLW0603
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Workers are spawned rather than forked: forking a process that runs an event loop and
+            # several threads can copy locks in a held state. A fresh interpreter has to import
+            # langflow.graph before langflow.custom, where the worker function lives.
+            _process_pool = ProcessPoolExecutor(
+                max_workers=get_settings_service().settings.output_process_pool_size,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=importlib.import_module,
+                initargs=("langflow.graph",),
+            )
+        return _process_pool
+
+
+def shutdown_output_process_pool() -> None:
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _component_class(code: str, class_name: str) -> type[Component]:
+    return validate.create_class(code, class_name)
+
+
+def _run_output_in_worker(payload: bytes) -> tuple[Any, Any]:
+    code, class_name, attributes, method_name = pickle.loads(payload)  # noqa: S301
+    component = _component_class(code, class_name)()
+    component._attributes.update(attributes)
+    result = getattr(component, method_name)()
+    return result, component.status
+
+
+def _submit_output_call(component: Component, method_name: str) -> Future | None:
+    # Pickling the inputs and starting worker processes both block, so this runs in a thread
+    try:
+        payload = pickle.dumps((component._code, type(component).__name__, component._attributes, method_name))
+    except (pickle.PicklingError, TypeError, AttributeError) as exc:
+        logger.debug(
+            f"Running {component.__class__.__name__}.{method_name} in a thread, its inputs can't be pickled: {exc}"
+        )
+        return None
+    return get_output_process_pool().submit(_run_output_in_worker, payload)
+
+
+def get_output_execution(component: Component) -> OutputExecution:
+    """Return the policy for the synchronous output methods of the component."""
+    policy = component.sync_output_execution or get_settings_service().settings.sync_output_execution
+    return OutputExecution(policy)
+
+
+async def run_sync_output(component: Component, method_name: str) -> tuple[Any, str]:
+    """Run a synchronous output method according to the component's policy.
+
+    Returns:
+        The result of the method and how it was run.
+    """
+    policy = get_output_execution(component)
+    method = getattr(component, method_name)
+    if policy == OutputExecution.INLINE:
+        return method(), policy.value
+    if policy == OutputExecution.PROCESS and component._code:
+        future = await asyncio.to_thread(_submit_output_call, component, method_name)
+        if future is not None:
+            result, status = await asyncio.wrap_future(future)
+            if status is not None:
+                component.status = status
+            return result, policy.value
+    return await asyncio.to_thread(method), OutputExecution.THREAD.value
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
 import time
@@ -12,13 +13,19 @@ from loguru import logger
 from typing_extensions import Protocol
 
 from langflow.schema.playground_events import create_event_by_type
+from langflow.services.telemetry.runtime_metrics import get_runtime_counters
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
 
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 class EventCallback(Protocol):
     def __call__(self, *, manager: EventManager, event_type: str, data: LoggableType): ...
 
@@ -31,6 +38,8 @@ class EventManager:
     def __init__(self, queue: asyncio.Queue):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        # Events sent from other threads are handed to the loop the queue is read from
+        self._loop = _running_loop()
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -66,6 +75,7 @@ class EventManager:
         self.events[name] = callback_
 
     def send_event(self, *, event_type: Literal["message", "error", "warning", "info", "token"], data: LoggableType):
+        get_runtime_counters().record_event(event_type)
         try:
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
                 data = create_event_by_type(event_type, **data)
@@ -77,7 +87,12 @@ class EventManager:
         json_data = {"event": event_type, "data": jsonable_data}
         event_id = f"{event_type}-{uuid.uuid4()}"
         str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        item = (event_id, str_data.encode("utf-8"), time.time())
+        loop = self._loop
+        if loop is not None and loop is not _running_loop() and loop.is_running():
+            loop.call_soon_threadsafe(self.queue.put_nowait, item)
+        else:
+            self.queue.put_nowait(item)
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -93,6 +108,7 @@ def create_default_event_manager(queue):
     manager.register_event("on_error", "error")
     manager.register_event("on_end", "end")
     manager.register_event("on_message", "add_message")
+    manager.register_event("on_message_delta", "message_delta")
     manager.register_event("on_remove_message", "remove_message")
     manager.register_event("on_end_vertex", "end_vertex")
     manager.register_event("on_build_start", "build_start")
@@ -103,6 +119,7 @@ def create_default_event_manager(queue):
 def create_stream_tokens_event_manager(queue):
     manager = EventManager(queue)
     manager.register_event("on_message", "add_message")
+    manager.register_event("on_message_delta", "message_delta")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
     return manager
@@ -20,7 +20,7 @@ from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
-from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from langflow.graph.graph.schema import GraphData, GraphDump, IncrementalBuild, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
 from langflow.graph.graph.state_model import create_state_model_from_graph
 from langflow.graph.graph.utils import (
@@ -132,6 +132,8 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        self.incremental_build: IncrementalBuild | None = None
+        self._reused_results: dict[str, dict[str, Any]] = {}
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -682,6 +684,8 @@ class Graph:
         return async_end_traces_func
 
     async def end_all_traces(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
+        # The run is over, so its state is no longer needed
+        self.state_manager.release_run(self._run_id)
         if not self.tracing_service:
             return
         self._end_time = datetime.now(timezone.utc)
@@ -844,23 +848,9 @@ class Graph:
         # of the vertices that are inputs
         # if the value is a list, we need to run multiple times
         vertex_outputs = []
-        if not isinstance(inputs, list):
-            inputs = [inputs]
-        elif not inputs:
-            inputs = [{}]
-        # Length of all should be the as inputs length
-        # just add empty lists to complete the length
-        if inputs_components is None:
-            inputs_components = []
-        for _ in range(len(inputs) - len(inputs_components)):
-            inputs_components.append([])
-        if types is None:
-            types = []
         if session_id:
             self.session_id = session_id
-        for _ in range(len(inputs) - len(types)):
-            types.append("chat")  # default to chat
-        for run_inputs, components, input_type in zip(inputs, inputs_components, types, strict=True):
+        for run_inputs, components, input_type in self._normalize_run_inputs(inputs, inputs_components, types):
             run_outputs = await self._run(
                 inputs=run_inputs,
                 input_components=components,
@@ -876,6 +866,110 @@ class Graph:
             vertex_outputs.append(run_output_object)
         return vertex_outputs
 
+    async def arun_batch(
+        self,
+        inputs: list[dict[str, str]],
+        *,
+        inputs_components: list[list[str]] | None = None,
+        types: list[InputType | None] | None = None,
+        outputs: list[str] | None = None,
+        session_id: str | None = None,
+        stream: bool = False,
+        fallback_to_env_vars: bool = False,
+        event_manager: EventManager | None = None,
+        max_concurrency: int = 4,
+        return_exceptions: bool = True,
+    ) -> list[RunOutputs | Exception]:
+        """Runs the graph once per input, concurrently, each on its own copy of the graph.
+
+        Unlike `arun`, which runs the inputs one after another on this instance, every input gets a fresh
+        copy made by `copy_for_run`, so runs do not share raw params, results or run state.
+
+        Args:
+            inputs (list[Dict[str, str]]): The input values for the graph, one run per item.
+            inputs_components (Optional[list[list[str]]], optional): Components to run for the inputs. Defaults to None.
+            types (Optional[list[Optional[InputType]]], optional): The types of the inputs. Defaults to None.
+            outputs (Optional[list[str]], optional): The outputs to retrieve from the graph. Defaults to None.
+            session_id (Optional[str], optional): The session ID for the graph. Defaults to None.
+            stream (bool, optional): Whether to stream the results or not. Defaults to False.
+            fallback_to_env_vars (bool, optional): Whether to fallback to environment variables. Defaults to False.
+            event_manager (EventManager | None): The event manager for the graph.
+            max_concurrency (int, optional): Maximum number of runs in flight at once. Defaults to 4.
+            return_exceptions (bool, optional): If True, a failed run puts its exception in the result list
+                instead of raising it. Defaults to True.
+
+        Returns:
+            list[RunOutputs | Exception]: One entry per input, in the same order as `inputs`.
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1. Got {max_concurrency}"
+            raise ValueError(msg)
+        if session_id:
+            self.session_id = session_id
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(run_inputs: dict[str, str], components: list[str], input_type: InputType | None):
+            async with semaphore:
+                graph = self.copy_for_run()
+                run_outputs = await graph._run(
+                    inputs=run_inputs,
+                    input_components=components,
+                    input_type=input_type,
+                    outputs=outputs or [],
+                    stream=stream,
+                    session_id=session_id or "",
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    event_manager=event_manager,
+                )
+                return RunOutputs(inputs=run_inputs, outputs=run_outputs)
+
+        runs = self._normalize_run_inputs(inputs, inputs_components, types)
+        results = await asyncio.gather(
+            *(run_one(*run) for run in runs),
+            return_exceptions=return_exceptions,
+        )
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"Batch run {index} failed: {result}")
+        return list(results)
+
+    def copy_for_run(self) -> Graph:
+        """Returns an unbuilt copy of the graph that can run independently of this instance.
+
+        The copy is rebuilt from the graph's node and edge data, so it shares the flow identity,
+        session and context of this graph but none of its vertices, components or run state.
+        """
+        graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=self.user_id,
+            context=dict(self.context),
+        )
+        graph.add_nodes_and_edges(copy.deepcopy(self._vertices), copy.deepcopy(self._edges))
+        graph.session_id = self.session_id
+        return graph
+
+    @staticmethod
+    def _normalize_run_inputs(
+        inputs: list[dict[str, str]] | dict[str, str],
+        inputs_components: list[list[str]] | None,
+        types: list[InputType | None] | None,
+    ) -> list[tuple[dict[str, str], list[str], InputType | None]]:
+        if not isinstance(inputs, list):
+            inputs = [inputs]
+        elif not inputs:
+            inputs = [{}]
+        # Length of all should be the as inputs length
+        # just add empty lists to complete the length
+        inputs_components = list(inputs_components or [])
+        for _ in range(len(inputs) - len(inputs_components)):
+            inputs_components.append([])
+        types = list(types or [])
+        for _ in range(len(inputs) - len(types)):
+            types.append("chat")  # default to chat
+        return list(zip(inputs, inputs_components, types, strict=True))
+
     def next_vertex_to_build(self):
         """Returns the next vertex to be built.
 
@@ -1012,6 +1106,8 @@ class Graph:
             "_is_output_vertices": self._is_output_vertices,
             "has_session_id_vertices": self.has_session_id_vertices,
             "_sorted_vertices_layers": self._sorted_vertices_layers,
+            "incremental_build": self.incremental_build,
+            "_reused_results": self._reused_results,
         }
 
     def __deepcopy__(self, memo):
@@ -1178,6 +1274,61 @@ class Graph:
         self.increment_update_count()
         return self
 
+    def reuse_unchanged_results(self, previous: Graph, always_build: Iterable[str] = ()) -> IncrementalBuild:
+        """Reuses the results of a previous build of the flow for the vertices that did not change since.
+
+        A vertex is reused when its data and edges are identical to the ones it had in the previous graph, it was
+        built there, and every vertex upstream of it is reused too. Inputs, outputs, vertices that take the session ID
+        or are part of a cycle, and vertices that routed a branch away in the previous build always run, because their
+        results depend on more than their data. A reused vertex skips its build, like a frozen vertex with a cached
+        result.
+
+        Args:
+            previous (Graph): The graph of the previous build, with its vertices built.
+            always_build (Iterable[str]): IDs of vertices to build even if they are unchanged.
+
+        Returns:
+            IncrementalBuild: The IDs of the reused vertices and of the vertices to build.
+        """
+        always_build = set(always_build)
+        changed = [vertex.id for vertex in self.vertices if not self._can_reuse(vertex, previous, always_build)]
+        # Everything downstream of a changed vertex is built again with the new results
+        to_build = set(changed)
+        queue = deque(changed)
+        while queue:
+            for successor_id in self.successor_map.get(queue.popleft(), []):
+                if successor_id not in to_build:
+                    to_build.add(successor_id)
+                    queue.append(successor_id)
+
+        reused = [vertex.id for vertex in self.vertices if vertex.id not in to_build]
+        self._reused_results = {
+            vertex_id: self._cached_build_result(previous.vertex_map[vertex_id]) for vertex_id in reused
+        }
+        self.incremental_build = IncrementalBuild(
+            reused=reused, rebuilt=[vertex.id for vertex in self.vertices if vertex.id in to_build]
+        )
+        return self.incremental_build
+
+    def _can_reuse(self, vertex: Vertex, previous: Graph, always_build: set[str]) -> bool:
+        previous_vertex = previous.vertex_map.get(vertex.id)
+        if (
+            previous_vertex is None
+            or not previous_vertex.built
+            or previous_vertex.result is None
+            or previous_vertex.state != VertexStates.ACTIVE
+        ):
+            return False
+        if vertex.id in always_build or vertex.is_input or vertex.is_output or vertex.has_session_id:
+            return False
+        if vertex.id in self.cycle_vertices or not self.vertex_data_is_identical(previous_vertex, vertex):
+            return False
+        return all(
+            previous.vertex_map[successor_id].state == VertexStates.ACTIVE
+            for successor_id in previous.successor_map.get(vertex.id, [])
+            if successor_id in previous.vertex_map
+        )
+
     def update_vertex_from_another(self, vertex: Vertex, other_vertex: Vertex) -> None:
         """Updates a vertex from another vertex.
 
@@ -1421,7 +1572,12 @@ class Graph:
         try:
             params = ""
             should_build = False
-            if not vertex.frozen:
+            # Only a fresh build gets a new profile; a cached result has none
+            vertex.profile = None
+            if vertex_id in self._reused_results:
+                # Unchanged since the previous build, see reuse_unchanged_results
+                should_build = not self._restore_build_result(vertex, self._reused_results.pop(vertex_id))
+            elif not vertex.frozen:
                 should_build = True
             else:
                 # Check the cache for the vertex
@@ -1433,22 +1589,7 @@ class Graph:
                     should_build = True
                 else:
                     try:
-                        cached_vertex_dict = cached_result["result"]
-                        # Now set update the vertex with the cached vertex
-                        vertex.built = cached_vertex_dict["built"]
-                        vertex.artifacts = cached_vertex_dict["artifacts"]
-                        vertex.built_object = cached_vertex_dict["built_object"]
-                        vertex.built_result = cached_vertex_dict["built_result"]
-                        vertex.full_data = cached_vertex_dict["full_data"]
-                        vertex.results = cached_vertex_dict["results"]
-                        try:
-                            vertex.finalize_build()
-
-                            if vertex.result is not None:
-                                vertex.result.used_frozen_result = True
-                        except Exception:  # noqa: BLE001
-                            logger.opt(exception=True).debug("Error finalizing build")
-                            should_build = True
+                        should_build = not self._restore_build_result(vertex, cached_result["result"])
                     except KeyError:
                         should_build = True
 
@@ -1461,16 +1602,7 @@ class Graph:
                     event_manager=event_manager,
                 )
                 if set_cache is not None:
-                    vertex_dict = {
-                        "built": vertex.built,
-                        "results": vertex.results,
-                        "artifacts": vertex.artifacts,
-                        "built_object": vertex.built_object,
-                        "built_result": vertex.built_result,
-                        "full_data": vertex.full_data,
-                    }
-
-                    await set_cache(key=vertex.id, data=vertex_dict)
+                    await set_cache(key=vertex.id, data=self._cached_build_result(vertex))
 
         except Exception as exc:
             if not isinstance(exc, ComponentBuildError):
@@ -1490,6 +1622,38 @@ class Graph:
             result_dict=result_dict, params=params, valid=valid, artifacts=artifacts, vertex=vertex
         )
 
+    @staticmethod
+    def _cached_build_result(vertex: Vertex) -> dict[str, Any]:
+        """Returns what _restore_build_result needs to set a build's results on a vertex."""
+        return {
+            "built": vertex.built,
+            "results": vertex.results,
+            "artifacts": vertex.artifacts,
+            "built_object": vertex.built_object,
+            "built_result": vertex.built_result,
+            "full_data": vertex.full_data,
+        }
+
+    @staticmethod
+    def _restore_build_result(vertex: Vertex, cached_vertex_dict: dict[str, Any]) -> bool:
+        """Sets the results of a previous build on a vertex. Returns False if the vertex has to be built instead."""
+        # Now set update the vertex with the cached vertex
+        vertex.built = cached_vertex_dict["built"]
+        vertex.artifacts = cached_vertex_dict["artifacts"]
+        vertex.built_object = cached_vertex_dict["built_object"]
+        vertex.built_result = cached_vertex_dict["built_result"]
+        vertex.full_data = cached_vertex_dict["full_data"]
+        vertex.results = cached_vertex_dict["results"]
+        try:
+            vertex.finalize_build()
+
+            if vertex.result is not None:
+                vertex.result.used_frozen_result = True
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error finalizing build")
+            return False
+        return True
+
     def get_vertex_edges(
         self,
         vertex_id: str,
@@ -1518,6 +1682,107 @@ class Graph:
                 vertices.append(vertex)
         return vertices
 
+    def get_loop_body_vertex_ids(self, loop_vertex_id: str, output_name: str) -> list[str]:
+        """Returns the IDs of the vertices that run once per item of a loop output.
+
+        Args:
+            loop_vertex_id (str): The ID of the loop vertex.
+            output_name (str): The name of the output that emits the items.
+
+        Returns:
+            list[str]: The vertices reachable from the output without going past the loop vertex.
+        """
+        to_visit = [
+            edge.target_id
+            for edge in self.get_vertex_edges(loop_vertex_id, is_target=False)
+            if edge.source_handle.name == output_name
+        ]
+        visited = {loop_vertex_id}
+        body_ids: list[str] = []
+        while to_visit:
+            vertex_id = to_visit.pop()
+            if vertex_id in visited:
+                continue
+            visited.add(vertex_id)
+            body_ids.append(vertex_id)
+            to_visit.extend(self.successor_map.get(vertex_id, []))
+        return body_ids
+
+    def create_isolated_subgraph(
+        self,
+        vertex_ids: Iterable[str],
+        *,
+        exclude: Iterable[str] = (),
+        input_values: dict[str, dict[str, Any]] | None = None,
+    ) -> Graph:
+        """Creates a standalone graph with fresh copies of the given vertices.
+
+        Edges coming from built vertices outside of the subgraph are replaced by the results
+        those vertices already produced. Unbuilt predecessors are copied into the subgraph so
+        it can run on its own, and edges from `exclude` vertices are dropped, their values being
+        expected in `input_values`. Running the subgraph never touches the state of this graph.
+
+        Args:
+            vertex_ids (Iterable[str]): The IDs of the vertices to copy.
+            exclude (Iterable[str]): Vertices that must not be copied, e.g. the loop driving the subgraph.
+            input_values (dict[str, dict[str, Any]] | None): Parameter values to set, keyed by vertex ID.
+
+        Returns:
+            Graph: The new graph. It shares this graph's flow, user and session but not its context.
+        """
+        excluded = set(exclude)
+        subgraph_ids = set(vertex_ids) - excluded
+        to_visit = list(subgraph_ids)
+        while to_visit:
+            vertex_id = to_visit.pop()
+            for predecessor_id in self.predecessor_map.get(vertex_id, []):
+                if predecessor_id in subgraph_ids or predecessor_id in excluded:
+                    continue
+                if not self.get_vertex(predecessor_id).built:
+                    subgraph_ids.add(predecessor_id)
+                    to_visit.append(predecessor_id)
+
+        params: dict[str, dict[str, Any]] = defaultdict(dict)
+        for edge in self.edges:
+            if edge.target_id not in subgraph_ids or edge.source_id in subgraph_ids or edge.source_id in excluded:
+                continue
+            if edge.target_param is None:
+                continue
+            source = self.get_vertex(edge.source_id)
+            target = self.get_vertex(edge.target_id)
+            source_handle = getattr(edge, "source_handle", None)
+            value = source.results.get(source_handle.name) if source_handle else source.built_object
+            field = target.data["node"]["template"].get(edge.target_param, {})
+            if isinstance(field, dict) and field.get("list"):
+                params[edge.target_id].setdefault(edge.target_param, []).append(value)
+            else:
+                params[edge.target_id][edge.target_param] = value
+        for vertex_id, values in (input_values or {}).items():
+            params[vertex_id].update(values)
+
+        nodes = [copy.deepcopy(node) for node in self._vertices if node.get("id") in subgraph_ids]
+        edges = [
+            copy.deepcopy(edge)
+            for edge in self._edges
+            if edge["source"] in subgraph_ids and edge["target"] in subgraph_ids
+        ]
+        subgraph = type(self).from_payload(
+            {"nodes": nodes, "edges": edges},
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            user_id=self.user_id,
+        )
+        subgraph.session_id = self.session_id
+        subgraph.context = dict(self.context)
+        # The subgraph runs as part of this graph's run, so it must not start its own traces
+        subgraph.tracing_service = None
+        for vertex in subgraph.vertices:
+            vertex_params = params.get(vertex.id, {})
+            if self.session_id and vertex.has_session_id:
+                vertex_params = {"session_id": self.session_id, **vertex_params}
+            vertex.update_raw_params(vertex_params, overwrite=True)
+        return subgraph
+
     async def process(
         self,
         *,
@@ -1925,7 +2190,6 @@ class Graph:
             cycle_vertices=self.cycle_vertices,
             stop_component_id=stop_component_id,
             start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
             in_degree_map=self.in_degree_map,
             successor_map=self.successor_map,
             predecessor_map=self.predecessor_map,
@@ -2065,13 +2329,3 @@ class Graph:
             predecessor_map[edge.target_id].append(edge.source_id)
             successor_map[edge.source_id].append(edge.target_id)
         return predecessor_map, successor_map
-
-    def __to_dict(self) -> dict[str, dict[str, list[str]]]:
-        """Converts the graph to a dictionary."""
-        result: dict = {}
-        for vertex in self.vertices:
-            vertex_id = vertex.id
-            sucessors = [i.id for i in self.get_all_successors(vertex)]
-            predecessors = [i.id for i in self.get_predecessors(vertex)]
-            result |= {vertex_id: {"successors": sucessors, "predecessors": predecessors}}
-        return result
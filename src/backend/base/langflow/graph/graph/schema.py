@@ -41,6 +41,11 @@ class VertexBuildResult(NamedTuple):
     vertex: Vertex
 
 
+class IncrementalBuild(NamedTuple):
+    reused: list[str]
+    rebuilt: list[str]
+
+
 class OutputConfigDict(TypedDict):
     cache: bool
 
@@ -31,8 +31,11 @@ class GraphStateManager:
     def get_state(self, key, run_id: str):
         return self.state_service.get_state(key, run_id)
 
-    def subscribe(self, key, observer: Callable) -> None:
-        self.state_service.subscribe(key, observer)
+    def subscribe(self, key, observer: Callable, run_id: str) -> None:
+        self.state_service.subscribe(key, observer, run_id)
 
-    def unsubscribe(self, key, observer: Callable) -> None:
-        self.state_service.unsubscribe(key, observer)
+    def unsubscribe(self, key, observer: Callable, run_id: str) -> None:
+        self.state_service.unsubscribe(key, observer, run_id)
+
+    def release_run(self, run_id: str) -> None:
+        self.state_service.release_run(run_id)
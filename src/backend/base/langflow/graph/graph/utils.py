@@ -1,6 +1,6 @@
 import copy
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import networkx as nx
@@ -521,6 +521,15 @@ def layered_topological_sort(
     cycle_counts = dict.fromkeys(vertices_ids, 0)
     current_layer = 0
 
+    # How many times each vertex is in the queue, so membership checks don't scan it
+    queued: dict[str, int] = defaultdict(int)
+    for vertex_id in queue:
+        queued[vertex_id] += 1
+
+    # The predecessors of each vertex that may still be added to the queue while its in-degree is positive.
+    # A scan drops the ones that never can again, so each list is walked about once rather than once per edge.
+    pending_predecessors: dict[str, list[str]] = {}
+
     # Process the first layer separately to avoid duplicates
     if queue:
         layers.append([])  # Start the first layer
@@ -528,6 +537,7 @@ def layered_topological_sort(
         layer_size = len(queue)
         for _ in range(layer_size):
             vertex_id = queue.popleft()
+            queued[vertex_id] -= 1
             if vertex_id not in first_layer_vertices:
                 first_layer_vertices.add(vertex_id)
                 visited.add(vertex_id)
@@ -545,19 +555,25 @@ def layered_topological_sort(
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0:
                     queue.append(neighbor)
+                    queued[neighbor] += 1
 
                 # if > 0 it might mean not all predecessors have added to the queue
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
-                    for predecessor in predecessor_map[neighbor]:
-                        if (
-                            predecessor not in queue
-                            and predecessor not in first_layer_vertices
-                            and (in_degree_map[predecessor] == 0 or predecessor in cycle_vertices)
-                        ):
+                    remaining = []
+                    for predecessor in pending_predecessors.get(neighbor, predecessor_map[neighbor]):
+                        # Queued vertices stay queued until the first layer is done
+                        if queued[predecessor] or predecessor in first_layer_vertices:
+                            continue
+                        if in_degree_map[predecessor] == 0 or predecessor in cycle_vertices:
                             queue.append(predecessor)
+                            queued[predecessor] += 1
+                        else:
+                            remaining.append(predecessor)
+                    pending_predecessors[neighbor] = remaining
 
         current_layer += 1  # Next layer
+        pending_predecessors = {}
 
     # Process remaining layers normally, allowing cycle vertices to appear multiple times
     while queue:
@@ -565,6 +581,7 @@ def layered_topological_sort(
         layer_size = len(queue)
         for _ in range(layer_size):
             vertex_id = queue.popleft()
+            queued[vertex_id] -= 1
             if vertex_id not in visited or (is_cyclic and cycle_counts[vertex_id] < MAX_CYCLE_APPEARANCES):
                 if vertex_id not in visited:
                     visited.add(vertex_id)
@@ -582,19 +599,27 @@ def layered_topological_sort(
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0 and neighbor not in visited:
                     queue.append(neighbor)
-                    # # If this is a cycle vertex, reset its in_degree to allow it to appear again
-                    # if neighbor in cycle_vertices and neighbor in visited:
-                    #     in_degree_map[neighbor] = len(predecessor_map[neighbor])
+                    queued[neighbor] += 1
 
                 # if > 0 it might mean not all predecessors have added to the queue
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
-                    for predecessor in predecessor_map[neighbor]:
-                        if predecessor not in queue and (
-                            predecessor not in visited
-                            or (is_cyclic and cycle_counts[predecessor] < MAX_CYCLE_APPEARANCES)
+                    remaining = []
+                    for predecessor in pending_predecessors.get(neighbor, predecessor_map[neighbor]):
+                        # Every dequeued vertex is visited, so without cycles a queued or visited
+                        # predecessor is never added again. With cycles, only one visited
+                        # MAX_CYCLE_APPEARANCES times is done.
+                        if queued[predecessor]:
+                            if is_cyclic:
+                                remaining.append(predecessor)
+                        elif predecessor not in visited or (
+                            is_cyclic and cycle_counts[predecessor] < MAX_CYCLE_APPEARANCES
                         ):
                             queue.append(predecessor)
+                            queued[predecessor] += 1
+                            if is_cyclic:
+                                remaining.append(predecessor)
+                    pending_predecessors[neighbor] = remaining
 
         current_layer += 1  # Next layer
 
@@ -863,17 +888,13 @@ def get_sorted_vertices(
             graph_dict=graph_dict,
         )
         # Then get all vertices that can reach any reachable vertex
-        connected_vertices = set()
-        for vertex in reachable_vertices:
-            connected_vertices.update(
-                filter_vertices_up_to_vertex(
-                    vertices_ids,
-                    vertex,
-                    get_vertex_predecessors=get_vertex_predecessors,
-                    get_vertex_successors=get_vertex_successors,
-                    graph_dict=graph_dict,
-                )
-            )
+        connected_vertices = _filter_vertices_up_to_vertices(
+            vertices_ids,
+            reachable_vertices,
+            get_vertex_predecessors=get_vertex_predecessors,
+            get_vertex_successors=get_vertex_successors,
+            graph_dict=graph_dict,
+        )
         vertices_ids = list(connected_vertices)
 
     # Get the layers
@@ -933,8 +954,26 @@ def filter_vertices_up_to_vertex(
     Returns:
         Set of vertex IDs that are predecessors of the given vertex
     """
+    return _filter_vertices_up_to_vertices(
+        vertices_ids,
+        [vertex_id],
+        get_vertex_predecessors=get_vertex_predecessors,
+        get_vertex_successors=get_vertex_successors,
+        graph_dict=graph_dict,
+    )
+
+
+def _filter_vertices_up_to_vertices(
+    vertices_ids: list[str],
+    target_ids: Iterable[str],
+    get_vertex_predecessors: Callable[[str], list[str]] | None = None,
+    get_vertex_successors: Callable[[str], list[str]] | None = None,
+    graph_dict: dict[str, Any] | None = None,
+) -> set[str]:
+    """Filter vertices up to any of the given vertices, with a single traversal of their predecessors."""
     vertices_set = set(vertices_ids)
-    if vertex_id not in vertices_set:
+    target_ids = [vertex_id for vertex_id in target_ids if vertex_id in vertices_set]
+    if not target_ids:
         return set()
 
     # Build predecessor map if not provided
@@ -947,16 +986,12 @@ def filter_vertices_up_to_vertex(
             return graph_dict[v]["predecessors"]
 
     # Build successor map if not provided
-    if get_vertex_successors is None:
-        if graph_dict is None:
-            return set()
-
-        def get_vertex_successors(v):
-            return graph_dict[v]["successors"]
+    if get_vertex_successors is None and graph_dict is None:
+        return set()
 
-    # Start with the target vertex
-    filtered_vertices = {vertex_id}
-    queue = deque([vertex_id])
+    # Start with the target vertices
+    filtered_vertices = set(target_ids)
+    queue = deque(target_ids)
 
     # Process vertices in breadth-first order
     while queue:
@@ -19,6 +19,8 @@ class ResultData(BaseModel):
     component_display_name: str | None = None
     component_id: str | None = None
     used_frozen_result: bool | None = False
+    output_execution: dict[str, str] | None = None
+    """How each output method ran: "async", "worker_loop", or the "inline", "thread" or "process" policy."""
 
     @field_serializer("results")
     def serialize_results(self, value):
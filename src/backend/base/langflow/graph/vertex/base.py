@@ -14,6 +14,7 @@ from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.schema import INPUT_COMPONENTS, OUTPUT_COMPONENTS, InterfaceComponentTypes, ResultData
 from langflow.graph.utils import UnbuiltObject, UnbuiltResult, log_transaction
 from langflow.graph.vertex.param_handler import ParameterHandler
+from langflow.graph.vertex.profiling import profile_phase, profile_vertex_build
 from langflow.interface import initialize
 from langflow.interface.listing import lazy_load_dict
 from langflow.schema.artifact import ArtifactType
@@ -31,6 +32,7 @@ if TYPE_CHECKING:
     from langflow.events.event_manager import EventManager
     from langflow.graph.edge.base import CycleEdge, Edge
     from langflow.graph.graph.base import Graph
+    from langflow.graph.vertex.profiling import VertexProfile
     from langflow.graph.vertex.schema import NodeData
     from langflow.services.tracing.schema import Log
 
@@ -101,6 +103,7 @@ class Vertex:
 
         self.use_result = False
         self.build_times: list[float] = []
+        self.profile: VertexProfile | None = None
         self.state = VertexStates.ACTIVE
         self.log_transaction_tasks: set[asyncio.Task] = set()
         self.output_names: list[str] = [
@@ -375,7 +378,8 @@ class Vertex:
     ) -> None:
         """Initiate the build process."""
         logger.debug(f"Building {self.display_name}")
-        await self._build_each_vertex_in_params_dict()
+        with profile_phase("params"):
+            await self._build_each_vertex_in_params_dict()
 
         if self.base_type is None:
             msg = f"Base type for vertex {self.display_name} not found"
@@ -456,6 +460,7 @@ class Vertex:
             messages=messages,
             component_display_name=self.display_name,
             component_id=self.id,
+            output_execution=getattr(self.custom_component, "_output_execution", None) or None,
         )
         self.set_result(result_dict)
 
@@ -709,7 +714,8 @@ class Vertex:
         from langflow.interface.components import ensure_component_loaded
         from langflow.services.deps import get_settings_service
 
-        if get_settings_service().settings.lazy_load_components:
+        settings = get_settings_service().settings
+        if settings.lazy_load_components:
             component_name = self.id.split("-")[0]
             await ensure_component_loaded(self.vertex_type, component_name, get_settings_service())
 
@@ -726,33 +732,35 @@ class Vertex:
                 # This means that the vertex has already been built
                 # and we are just getting the result for the requester
                 return await self.get_requester_result(requester)
-            self._reset()
-            # inject session_id if it is not None
-            if inputs is not None and "session" in inputs and inputs["session"] is not None and self.has_session_id:
-                session_id_value = self.get_value_from_template_dict("session_id")
-                if session_id_value == "":
-                    self.update_raw_params({"session_id": inputs["session"]}, overwrite=True)
-            if self._is_chat_input() and (inputs or files):
-                chat_input = {}
-                if (
-                    inputs
-                    and isinstance(inputs, dict)
-                    and "input_value" in inputs
-                    and inputs.get("input_value") is not None
-                ):
-                    chat_input.update({"input_value": inputs.get(INPUT_FIELD_NAME, "")})
-                if files:
-                    chat_input.update({"files": files})
-
-                self.update_raw_params(chat_input, overwrite=True)
-
-            # Run steps
-            for step in self.steps:
-                if step not in self.steps_ran:
-                    await step(user_id=user_id, event_manager=event_manager, **kwargs)
-                    self.steps_ran.append(step)
-
-            self.finalize_build()
+            with profile_vertex_build(self, enabled=settings.profile_vertex_builds):
+                with profile_phase("params"):
+                    self._reset()
+                # inject session_id if it is not None
+                if inputs is not None and "session" in inputs and inputs["session"] is not None and self.has_session_id:
+                    session_id_value = self.get_value_from_template_dict("session_id")
+                    if session_id_value == "":
+                        self.update_raw_params({"session_id": inputs["session"]}, overwrite=True)
+                if self._is_chat_input() and (inputs or files):
+                    chat_input = {}
+                    if (
+                        inputs
+                        and isinstance(inputs, dict)
+                        and "input_value" in inputs
+                        and inputs.get("input_value") is not None
+                    ):
+                        chat_input.update({"input_value": inputs.get(INPUT_FIELD_NAME, "")})
+                    if files:
+                        chat_input.update({"files": files})
+
+                    self.update_raw_params(chat_input, overwrite=True)
+
+                # Run steps
+                for step in self.steps:
+                    if step not in self.steps_ran:
+                        await step(user_id=user_id, event_manager=event_manager, **kwargs)
+                        self.steps_ran.append(step)
+
+                self.finalize_build()
 
         return await self.get_requester_result(requester)
 
@@ -0,0 +1,274 @@
+"""Per-phase timing of vertex builds.
+
+A `VertexProfile` is attached to the running task while a vertex builds. The build phases wrapped with
+`profile_phase` add their wall time, CPU time and net memory change to it. The memory change is the difference
+in memory traced by tracemalloc between the start and the end of the phase: memory freed during the phase
+lowers it, so it is negative when a phase frees more than it keeps. It is only measured while tracemalloc is
+tracing (for example with `PYTHONTRACEMALLOC=1`). When no profile is active, a phase costs one context
+variable lookup.
+
+Finished profiles are attached to the vertex, sent with the `end_vertex` event and aggregated into
+per-component histograms that the `/monitor/profiles` endpoint serves.
+
+Whether profiled or not, the vertex a task is building is registered so that the event loop watchdog can
+attribute a stall to it from its own thread, where the task's context variables cannot be read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from cachetools import LRUCache
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langflow.graph.vertex.base import Vertex
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+BUILD_PHASE = "build"
+WALL_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Upper bounds, in seconds, of the wall time histogram buckets. Slower phases go in a final overflow bucket."""
+
+
+@dataclass
+class PhaseTiming:
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    memory_delta_bytes: int | None = None
+    calls: int = 0
+
+    def add(self, wall_time: float, cpu_time: float, memory_delta_bytes: int | None) -> None:
+        self.wall_time += wall_time
+        self.cpu_time += cpu_time
+        if memory_delta_bytes is not None:
+            self.memory_delta_bytes = (self.memory_delta_bytes or 0) + memory_delta_bytes
+        self.calls += 1
+
+
+@dataclass
+class VertexProfile:
+    """Timings of the phases of one vertex build.
+
+    CPU time is process time, so it also counts other tasks that ran while the phase was awaiting.
+    """
+
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+
+    def add(self, phase: str, wall_time: float, cpu_time: float, memory_delta_bytes: int | None) -> None:
+        timing = self.phases.get(phase)
+        if timing is None:
+            timing = self.phases[phase] = PhaseTiming()
+        timing.add(wall_time, cpu_time, memory_delta_bytes)
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        return {
+            phase: {
+                "wall_time": timing.wall_time,
+                "cpu_time": timing.cpu_time,
+                "memory_delta_bytes": timing.memory_delta_bytes,
+                "calls": timing.calls,
+            }
+            for phase, timing in self.phases.items()
+        }
+
+
+vertex_profile_var: ContextVar[VertexProfile | None] = ContextVar("vertex_profile", default=None)
+
+_building_vertices: dict[asyncio.Task, Vertex] = {}
+
+
+def get_building_vertex(task: asyncio.Task | None) -> Vertex | None:
+    """Return the vertex the task is building, if any. Safe to call from any thread."""
+    if task is None:
+        return None
+    return _building_vertices.get(task)
+
+
+class profile_phase:  # noqa: N801
+    """Context manager and decorator that adds the time spent in a phase to the active vertex profile."""
+
+    __slots__ = ("_cpu", "_phase", "_profile", "_traced_memory", "_wall")
+
+    def __init__(self, phase: str):
+        self._phase = phase
+        self._profile: VertexProfile | None = None
+
+    def __enter__(self) -> None:
+        self._profile = vertex_profile_var.get()
+        if self._profile is None:
+            return
+        self._traced_memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        self._cpu = time.process_time()
+        self._wall = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        profile = self._profile
+        if profile is None:
+            return
+        wall_time = time.perf_counter() - self._wall
+        cpu_time = time.process_time() - self._cpu
+        memory_delta = None
+        if self._traced_memory is not None and tracemalloc.is_tracing():
+            memory_delta = tracemalloc.get_traced_memory()[0] - self._traced_memory
+        profile.add(self._phase, wall_time, cpu_time, memory_delta)
+        self._profile = None
+
+    def __call__(self, func: F) -> F:
+        phase = self._phase
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if vertex_profile_var.get() is None:
+                    return await func(*args, **kwargs)
+                with profile_phase(phase):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if vertex_profile_var.get() is None:
+                return func(*args, **kwargs)
+            with profile_phase(phase):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
+class profile_vertex_build:  # noqa: N801
+    """Profiles the build of a vertex and records it when the build ends.
+
+    With `enabled=False` nothing is measured and the vertex keeps no profile, but the running task is still
+    registered as building the vertex.
+    """
+
+    __slots__ = ("_enabled", "_phase", "_previous", "_profile", "_task", "_token", "_vertex")
+
+    def __init__(self, vertex: Vertex, *, enabled: bool = True):
+        self._vertex = vertex
+        self._enabled = enabled
+
+    def __enter__(self) -> VertexProfile | None:
+        self._task = asyncio.current_task()
+        if self._task is not None:
+            self._previous = _building_vertices.get(self._task)
+            _building_vertices[self._task] = self._vertex
+        if not self._enabled:
+            return None
+        self._profile = VertexProfile()
+        self._token: Token = vertex_profile_var.set(self._profile)
+        self._phase = profile_phase(BUILD_PHASE)
+        self._phase.__enter__()
+        return self._profile
+
+    def __exit__(self, *exc_info) -> None:
+        if self._task is not None:
+            if self._previous is None:
+                _building_vertices.pop(self._task, None)
+            else:
+                _building_vertices[self._task] = self._previous
+        if not self._enabled:
+            return
+        self._phase.__exit__(*exc_info)
+        vertex_profile_var.reset(self._token)
+        self._vertex.profile = self._profile
+        get_vertex_profile_stats().record(self._vertex.vertex_type, self._profile)
+
+
+class PhaseHistogram(BaseModel):
+    component: str
+    phase: str
+    count: int
+    wall_time_sum: float
+    cpu_time_sum: float
+    memory_delta_bytes_sum: int | None
+    buckets: dict[str, int]
+    """Number of phases whose wall time is at most the bucket bound, in seconds, cumulative like Prometheus."""
+
+
+@dataclass
+class _Histogram:
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(WALL_TIME_BUCKETS) + 1))
+    count: int = 0
+    wall_time_sum: float = 0.0
+    cpu_time_sum: float = 0.0
+    memory_delta_bytes_sum: int | None = None
+
+    def observe(self, timing: PhaseTiming) -> None:
+        self.bucket_counts[bisect_left(WALL_TIME_BUCKETS, timing.wall_time)] += 1
+        self.count += 1
+        self.wall_time_sum += timing.wall_time
+        self.cpu_time_sum += timing.cpu_time
+        if timing.memory_delta_bytes is not None:
+            self.memory_delta_bytes_sum = (self.memory_delta_bytes_sum or 0) + timing.memory_delta_bytes
+
+
+class VertexProfileStats:
+    """Wall time histograms and CPU and memory totals of the build phases, per component type."""
+
+    def __init__(self, max_components: int = 1024):
+        self._histograms: LRUCache = LRUCache(maxsize=max_components)
+        self._lock = threading.Lock()
+
+    def record(self, component: str, profile: VertexProfile) -> None:
+        with self._lock:
+            phases = self._histograms.get(component)
+            if phases is None:
+                phases = self._histograms[component] = {}
+            for phase, timing in profile.phases.items():
+                histogram = phases.get(phase)
+                if histogram is None:
+                    histogram = phases[phase] = _Histogram()
+                histogram.observe(timing)
+
+    def histograms(self, component: str | None = None) -> list[PhaseHistogram]:
+        with self._lock:
+            items = [
+                (name, phase, histogram)
+                for name, phases in self._histograms.items()
+                if component is None or name == component
+                for phase, histogram in phases.items()
+            ]
+            result = []
+            for name, phase, histogram in items:
+                bounds = [*(str(bound) for bound in WALL_TIME_BUCKETS), "+Inf"]
+                cumulative = 0
+                buckets = {}
+                for bound, bucket_count in zip(bounds, histogram.bucket_counts, strict=True):
+                    cumulative += bucket_count
+                    buckets[bound] = cumulative
+                result.append(
+                    PhaseHistogram(
+                        component=name,
+                        phase=phase,
+                        count=histogram.count,
+                        wall_time_sum=histogram.wall_time_sum,
+                        cpu_time_sum=histogram.cpu_time_sum,
+                        memory_delta_bytes_sum=histogram.memory_delta_bytes_sum,
+                        buckets=buckets,
+                    )
+                )
+            return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+_vertex_profile_stats = VertexProfileStats()
+
+
+def get_vertex_profile_stats() -> VertexProfileStats:
+    return _vertex_profile_stats
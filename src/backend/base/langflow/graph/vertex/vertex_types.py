@@ -198,6 +198,7 @@ class ComponentVertex(Vertex):
             messages=messages,
             component_display_name=self.display_name,
             component_id=self.id,
+            output_execution=getattr(self.custom_component, "_output_execution", None) or None,
         )
         self.set_result(result_dict)
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
+from cachetools import LRUCache
 from fastapi import HTTPException
 from loguru import logger
 from pydantic.v1 import BaseModel, Field, create_model
@@ -11,7 +14,7 @@ from sqlmodel import select
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.flow.model import FlowRead
-from langflow.services.deps import get_settings_service, session_scope
+from langflow.services.deps import get_settings_service, get_telemetry_service, session_scope
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -44,29 +47,94 @@ async def list_flows(*, user_id: str | None = None) -> list[Data]:
         raise ValueError(msg) from e
 
 
-async def load_flow(
-    user_id: str, flow_id: str | None = None, flow_name: str | None = None, tweaks: dict | None = None
+SUBFLOW_GRAPH_CACHE_SIZE = 128
+
+# (user_id, flow_id) -> (updated_at, template graph). The templates are never built; runs use copies of them.
+_flow_graph_templates: LRUCache = LRUCache(maxsize=SUBFLOW_GRAPH_CACHE_SIZE)
+_flow_graph_templates_lock = threading.Lock()
+
+
+async def get_flow_graph_template(
+    user_id: str | None, flow_id: str | UUID | None = None, flow_name: str | None = None
 ) -> Graph:
+    """Return the cached template graph of a flow, parsing it only when the flow has changed.
+
+    Templates are keyed by flow and `updated_at`, so an edited flow is parsed again on its next use.
+    The returned graph is shared: it must not be built or mutated. Use `load_flow` to get a graph to run.
+    """
     from langflow.graph.graph.base import Graph
-    from langflow.processing.process import process_tweaks
 
     if not flow_id and not flow_name:
         msg = "Flow ID or Flow Name is required"
         raise ValueError(msg)
-    if not flow_id and flow_name:
-        flow_id = await find_flow(flow_name, user_id)
-        if not flow_id:
-            msg = f"Flow {flow_name} not found"
-            raise ValueError(msg)
 
     async with session_scope() as session:
-        graph_data = flow.data if (flow := await session.get(Flow, flow_id)) else None
-    if not graph_data:
-        msg = f"Flow {flow_id} not found"
-        raise ValueError(msg)
+        stmt = select(Flow.id, Flow.updated_at)
+        if flow_id:
+            stmt = stmt.where(Flow.id == (UUID(flow_id) if isinstance(flow_id, str) else flow_id))
+        else:
+            uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+            stmt = stmt.where(Flow.name == flow_name).where(Flow.user_id == uuid_user_id)
+        header = (await session.exec(stmt)).first()
+        if header is None:
+            msg = f"Flow {flow_id or flow_name} not found"
+            raise ValueError(msg)
+        db_flow_id, updated_at = header
+
+        key = (str(user_id), str(db_flow_id))
+        with _flow_graph_templates_lock:
+            cached = _flow_graph_templates.get(key)
+        if cached is not None and updated_at is not None and cached[0] == updated_at:
+            return cached[1]
+
+        flow = await session.get(Flow, db_flow_id)
+        graph_data = flow.data if flow else None
+        if not flow or not graph_data:
+            msg = f"Flow {flow_id or flow_name} not found"
+            raise ValueError(msg)
+        updated_at = flow.updated_at
+
+    graph = Graph.from_payload(graph_data, flow_id=str(db_flow_id), user_id=user_id)
+    if updated_at is not None:
+        with _flow_graph_templates_lock:
+            _flow_graph_templates[key] = (updated_at, graph)
+    return graph
+
+
+def clear_flow_graph_templates() -> None:
+    with _flow_graph_templates_lock:
+        _flow_graph_templates.clear()
+
+
+async def load_flow(
+    user_id: str, flow_id: str | None = None, flow_name: str | None = None, tweaks: dict | None = None
+) -> Graph:
+    """Return a new, unbuilt graph of the flow with the tweaks applied.
+
+    The graph is copied from the flow's cached template, so the flow is only fetched and parsed again when it
+    has been updated. Tweaks are applied to the copy as parameter overrides.
+    """
+    from langflow.processing.process import process_tweaks_on_graph
+
+    template = await get_flow_graph_template(user_id, flow_id=flow_id, flow_name=flow_name)
+    graph = template.copy_for_run()
     if tweaks:
-        graph_data = process_tweaks(graph_data=graph_data, tweaks=tweaks)
-    return Graph.from_payload(graph_data, flow_id=flow_id, user_id=user_id)
+        process_tweaks_on_graph(graph, tweaks)
+    return graph
+
+
+def _record_subflow_durations(flow_id: str | None, build_seconds: float | None, run_seconds: float) -> None:
+    logger.debug(
+        f"Sub-flow {flow_id} prepared in {build_seconds or 0:.4f}s and ran in {run_seconds:.4f}s",
+    )
+    try:
+        ot = get_telemetry_service().ot
+        labels = {"flow_id": str(flow_id)}
+        if build_seconds is not None:
+            ot.observe_histogram("subflow_build_duration", build_seconds, labels)
+        ot.observe_histogram("subflow_run_duration", run_seconds, labels)
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug("Failed to record sub-flow durations")
 
 
 async def find_flow(flow_name: str, user_id: str) -> str | None:
@@ -87,12 +155,20 @@ async def run_flow(
     run_id: str | None = None,
     session_id: str | None = None,
     graph: Graph | None = None,
+    max_concurrency: int = 1,
 ) -> list[RunOutputs]:
+    from langflow.processing.process import process_tweaks_on_graph
+
     if user_id is None:
         msg = "Session is invalid"
         raise ValueError(msg)
+    build_seconds = None
     if graph is None:
+        build_start = time.perf_counter()
         graph = await load_flow(user_id, flow_id, flow_name, tweaks)
+        build_seconds = time.perf_counter() - build_start
+    elif tweaks:
+        process_tweaks_on_graph(graph, tweaks)
     if run_id:
         graph.set_run_id(UUID(run_id))
     if session_id:
@@ -123,13 +199,28 @@ async def run_flow(
 
     fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
 
-    return await graph.arun(
-        inputs_list,
-        outputs=outputs,
-        inputs_components=inputs_components,
-        types=types,
-        fallback_to_env_vars=fallback_to_env_vars,
-    )
+    run_start = time.perf_counter()
+    if max_concurrency > 1 and len(inputs_list) > 1:
+        batch_outputs = await graph.arun_batch(
+            inputs_list,
+            outputs=outputs,
+            inputs_components=inputs_components,
+            types=types,
+            fallback_to_env_vars=fallback_to_env_vars,
+            max_concurrency=max_concurrency,
+            return_exceptions=False,
+        )
+        run_outputs = cast("list[RunOutputs]", batch_outputs)
+    else:
+        run_outputs = await graph.arun(
+            inputs_list,
+            outputs=outputs,
+            inputs_components=inputs_components,
+            types=types,
+            fallback_to_env_vars=fallback_to_env_vars,
+        )
+    _record_subflow_durations(graph.flow_id, build_seconds, time.perf_counter() - run_start)
+    return run_outputs
 
 
 def generate_function_for_flow(
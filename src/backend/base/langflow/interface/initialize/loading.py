@@ -10,6 +10,7 @@ from loguru import logger
 from pydantic import PydanticDeprecatedSince20
 
 from langflow.custom.eval import eval_custom_component_code
+from langflow.graph.vertex.profiling import profile_phase
 from langflow.schema import Data
 from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.services.deps import get_tracing_service
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
     from langflow.graph.vertex.base import Vertex
 
 
+@profile_phase("instantiate")
 def instantiate_class(
     vertex: Vertex,
     user_id=None,
@@ -103,6 +105,7 @@ def convert_kwargs(params):
     return params
 
 
+@profile_phase("load_variables")
 async def update_params_with_load_from_db_fields(
     custom_component: CustomComponent,
     params,
@@ -3,7 +3,8 @@ import json
 import logging
 import os
 import sys
-from collections import deque
+from bisect import bisect_left
+from contextlib import suppress
 from pathlib import Path
 from threading import Lock, Semaphore
 from typing import TypedDict
@@ -26,6 +27,21 @@ DEFAULT_LOG_FORMAT = (
 )
 
 
+class _TimestampView:
+    """Sequence of the timestamps in a SizedLogBuffer, oldest first, for use with bisect."""
+
+    def __init__(self, log_buffer: "SizedLogBuffer"):
+        self._log_buffer = log_buffer
+        self._first_seq = log_buffer._first_seq
+        self._length = len(log_buffer)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> int:
+        return self._log_buffer._entry(self._first_seq + index)[0]
+
+
 class SizedLogBuffer:
     def __init__(
         self,
@@ -35,11 +51,19 @@ class SizedLogBuffer:
 
         The buffer can be overwritten by an env variable LANGFLOW_LOG_RETRIEVER_BUFFER_SIZE
         because the logger is initialized before the settings_service are loaded.
+
+        Entries live in a fixed-capacity ring and are numbered by a monotonic sequence number, so
+        streaming readers can follow a cursor and timestamp lookups can binary search the ring
+        (timestamps are non-decreasing in write order). Streaming readers wait for new entries on their
+        event loop, and writers wake them up from any thread.
         """
-        self.buffer: deque = deque()
+        self._entries: list[tuple[int, str] | None] = []
+        self._first_seq = 0
+        self._next_seq = 0
 
         self._max_readers = max_readers
         self._wlock = Lock()
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
         self._rsemaphore = Semaphore(max_readers)
         self._max = 0
 
@@ -47,62 +71,118 @@ class SizedLogBuffer:
         return self._wlock
 
     def write(self, message: str) -> None:
-        record = json.loads(message)
-        log_entry = record["text"]
-        epoch = int(record["record"]["time"]["timestamp"] * 1000)
+        record = getattr(message, "record", None)
+        if record is not None:
+            # A loguru message: the formatted text and the record are already at hand
+            log_entry = str(message)
+            epoch = int(record["time"].timestamp() * 1000)
+        else:
+            serialized = json.loads(message)
+            log_entry = serialized["text"]
+            epoch = int(serialized["record"]["time"]["timestamp"] * 1000)
         with self._wlock:
-            if len(self.buffer) >= self.max:
-                for _ in range(len(self.buffer) - self.max + 1):
-                    self.buffer.popleft()
-            self.buffer.append((epoch, log_entry))
+            self._resize(self.max)
+            if not self._entries:
+                return
+            if len(self) == len(self._entries):
+                self._first_seq += 1
+            self._entries[self._next_seq % len(self._entries)] = (epoch, log_entry)
+            self._next_seq += 1
+            waiters, self._waiters = self._waiters, set()
+        for loop, event in waiters:
+            with suppress(RuntimeError):  # The loop of a reader that went away was closed
+                loop.call_soon_threadsafe(event.set)
+
+    def _resize(self, capacity: int) -> None:
+        if capacity == len(self._entries):
+            return
+        first_seq = max(self._first_seq, self._next_seq - capacity)
+        entries: list[tuple[int, str] | None] = [None] * capacity
+        for seq in range(first_seq, self._next_seq):
+            entries[seq % capacity] = self._entry(seq)
+        self._entries = entries
+        self._first_seq = first_seq
+
+    def _entry(self, seq: int) -> tuple[int, str]:
+        entry = self._entries[seq % len(self._entries)]
+        if entry is None:
+            msg = f"Log entry {seq} is not in the buffer"
+            raise IndexError(msg)
+        return entry
+
+    def _slice(self, start: int, stop: int) -> list[tuple[int, str]]:
+        """Entries from the start-th to the stop-th oldest one. Callers hold the write lock."""
+        return [self._entry(self._first_seq + index) for index in range(start, stop)]
 
     def __len__(self) -> int:
-        return len(self.buffer)
+        return self._next_seq - self._first_seq
 
-    def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
-        rc = {}
+    @property
+    def buffer(self) -> list[tuple[int, str]]:
+        """A snapshot of the (timestamp, text) entries, oldest first."""
+        with self._wlock:
+            return self._slice(0, len(self))
+
+    @property
+    def next_seq(self) -> int:
+        """The sequence number the next written entry will get."""
+        return self._next_seq
 
+    def get_since(self, seq: int) -> tuple[list[tuple[int, str]], int]:
+        """Entries numbered `seq` and later, and the cursor to pass on the next call.
+
+        Entries that were already overwritten are skipped.
+        """
+        with self._wlock:
+            start = max(seq, self._first_seq) - self._first_seq
+            return self._slice(start, len(self)), self._next_seq
+
+    async def wait_for_entries(self, seq: int, timeout: float | None = None) -> bool:
+        """Wait until an entry numbered `seq` or later is written, or the timeout expires.
+
+        The wait doesn't take a thread: the writer sets an event on the reader's loop.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._wlock:
+            if self._next_seq > seq:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._wlock:
+                self._waiters.discard(waiter)
+        return True
+
+    def get_after_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                for ts, msg in self.buffer:
-                    if lines == 0:
-                        break
-                    if ts >= timestamp and lines > 0:
-                        rc[ts] = msg
-                        lines -= 1
+                start = bisect_left(_TimestampView(self), timestamp)
+                return dict(self._slice(start, min(start + max(lines, 0), len(self))))
         finally:
             self._rsemaphore.release()
 
-        return rc
-
     def get_before_timestamp(self, timestamp: int, lines: int = 5) -> dict[int, str]:
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            max_index = -1
-            for i, (ts, _) in enumerate(as_list):
-                if ts >= timestamp:
-                    max_index = i
-                    break
-            if max_index == -1:
-                return self.get_last_n(lines)
-            rc = {}
-            start_from = max(max_index - lines, 0)
-            for i, (ts, msg) in enumerate(as_list):
-                if start_from <= i < max_index:
-                    rc[ts] = msg
-            return rc
+                max_index = bisect_left(_TimestampView(self), timestamp)
+                if max_index < len(self):
+                    return dict(self._slice(max(max_index - lines, 0), max_index))
         finally:
             self._rsemaphore.release()
+        return self.get_last_n(lines)
 
     def get_last_n(self, last_idx: int) -> dict[int, str]:
         self._rsemaphore.acquire()
         try:
             with self._wlock:
-                as_list = list(self.buffer)
-            return dict(as_list[-last_idx:])
+                size = len(self)
+                start = size - last_idx if 0 < last_idx < size else 0
+                return dict(self._slice(start, size))
         finally:
             self._rsemaphore.release()
 
@@ -263,7 +343,8 @@ def configure(
             logger.exception("Error setting up log file")
 
     if log_buffer.enabled():
-        logger.add(sink=log_buffer.write, format="{time} {level} {message}", serialize=True)
+        # Not serialized: the sink takes the text and timestamp from the message instead of parsing JSON
+        logger.add(sink=log_buffer.write, format="{time} {level} {message}")
 
     logger.debug(f"Logger set up with log level: {log_level}")
 
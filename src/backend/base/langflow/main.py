@@ -22,7 +22,9 @@ from pydantic import PydanticDeprecatedSince20
 from pydantic_core import PydanticSerializationError
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
-from langflow.api import health_check_router, log_router, router
+from langflow.api import health_check_router, log_router, metrics_router, router
+from langflow.base.mcp.util import close_mcp_session_pool
+from langflow.custom.custom_component.output_execution import shutdown_output_process_pool
 from langflow.initial_setup.setup import (
     create_or_update_starter_projects,
     initialize_super_user_if_needed,
@@ -39,6 +41,8 @@ from langflow.services.deps import (
     get_settings_service,
     get_telemetry_service,
 )
+from langflow.services.telemetry.event_loop_watchdog import get_event_loop_watchdog
+from langflow.services.telemetry.runtime_metrics import get_event_loop_lag_monitor
 from langflow.services.utils import initialize_services, teardown_services
 
 if TYPE_CHECKING:
@@ -157,6 +161,16 @@ def get_lifespan(*, fix_migration=False, version=None):
             logger.debug(f"Starter projects updated in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             telemetry_service.start()
+            settings = get_settings_service().settings
+            if settings.runtime_metrics_enabled or settings.event_loop_watchdog_enabled:
+                lag_monitor = get_event_loop_lag_monitor()
+                lag_monitor.interval = settings.event_loop_lag_interval
+                lag_monitor.start()
+            if settings.event_loop_watchdog_enabled:
+                watchdog = get_event_loop_watchdog()
+                watchdog.threshold = settings.event_loop_stall_threshold
+                watchdog.offload = settings.offload_stalling_components
+                watchdog.start()
 
             current_time = asyncio.get_event_loop().time()
             logger.debug("Loading flows")
@@ -181,6 +195,10 @@ def get_lifespan(*, fix_migration=False, version=None):
             if sync_flows_from_fs_task:
                 sync_flows_from_fs_task.cancel()
                 await asyncio.wait([sync_flows_from_fs_task])
+            await close_mcp_session_pool()
+            await get_event_loop_watchdog().stop()
+            shutdown_output_process_pool()
+            await get_event_loop_lag_monitor().stop()
             await teardown_services()
             await logger.complete()
             temp_dir_cleanups = [asyncio.to_thread(temp_dir.cleanup) for temp_dir in temp_dirs]
@@ -285,6 +303,7 @@ def create_app():
     app.include_router(router)
     app.include_router(health_check_router)
     app.include_router(log_router)
+    app.include_router(metrics_router)
 
     @app.exception_handler(Exception)
     async def exception_handler(_request: Request, exc: Exception):
@@ -1,18 +1,27 @@
 import asyncio
+import bisect
 import json
+import threading
+import time
+from collections import defaultdict, deque
 from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from uuid import UUID
 
+from cachetools import LRUCache
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import and_, delete, or_
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.schema.message import Message
+from langflow.schema.properties import Properties
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_settings_service, get_telemetry_service, session_scope
+from langflow.services.telemetry.event_loop_watchdog import require_main_loop
 from langflow.utils.async_helpers import run_until_complete
 
 
@@ -35,8 +44,9 @@ def _get_variable_query(
     if flow_id:
         stmt = stmt.where(MessageTable.flow_id == flow_id)
     if order_by:
-        col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
-        stmt = stmt.order_by(col)
+        column = getattr(MessageTable, order_by)
+        # Messages stored in the same second are returned in the order they were stored in
+        stmt = stmt.order_by(column.desc() if order == "DESC" else column.asc(), col(MessageTable.sequence).asc())
     if limit:
         stmt = stmt.limit(limit)
     return stmt
@@ -93,12 +103,367 @@ async def aget_messages(
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
+    if batcher := get_message_write_batcher():
+        await batcher.wait_for_session(session_id)
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
         return [await Message.create(**d.model_dump()) for d in messages]
 
 
+@dataclass(frozen=True)
+class MessageHistoryCursor:
+    """Position of a message in a session's history, used to fetch the messages before it."""
+
+    timestamp: datetime
+    sequence: int
+    id: UUID
+
+
+@dataclass
+class MessageHistoryPage:
+    messages: list[Message]
+    """The messages of the page, oldest first."""
+    next_cursor: MessageHistoryCursor | None = None
+    """Cursor for the page of older messages, or None when there are none."""
+
+
+def _history_message(row: MessageTable | MessageRead) -> Message:
+    """Build a read-only Message from a stored row without revalidating its content.
+
+    Content blocks are kept as the stored dictionaries.
+    """
+    timestamp = row.timestamp
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.replace(tzinfo=timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+    properties = json.loads(row.properties) if isinstance(row.properties, str) else row.properties
+    fields = {
+        "id": row.id,
+        "text": row.text,
+        "sender": row.sender,
+        "sender_name": row.sender_name,
+        "session_id": row.session_id,
+        "flow_id": row.flow_id,
+        "timestamp": timestamp,
+        "files": list(row.files or []),
+        "error": row.error,
+        "edit": row.edit,
+        "properties": Properties.model_validate(properties or {}),
+        "category": row.category,
+        "content_blocks": [
+            json.loads(block) if isinstance(block, str) else block for block in row.content_blocks or []
+        ],
+    }
+    return Message.model_construct(data=dict(fields), **fields)
+
+
+async def aget_message_history(
+    session_id: str | UUID,
+    *,
+    flow_id: UUID | None = None,
+    sender: str | None = None,
+    sender_name: str | None = None,
+    limit: int = 100,
+    before: MessageHistoryCursor | None = None,
+) -> MessageHistoryPage:
+    """Retrieves the latest messages of a session, one page at a time.
+
+    The page holds up to `limit` of the most recent messages older than `before`, returned oldest first.
+    Pages are fetched with keyset pagination on (timestamp, sequence, id), so the database only reads the rows
+    of the page through the (session_id, timestamp, sequence) index. The latest page of an active session is served
+    from the message history cache when it holds enough messages. The messages are lightweight read-only
+    snapshots; use `aget_messages` for messages that will be modified.
+
+    Args:
+        session_id (str | UUID): The session ID associated with the messages.
+        flow_id (Optional[UUID]): The flow ID associated with the messages.
+        sender (Optional[str]): The sender of the messages (e.g., "Machine" or "User")
+        sender_name (Optional[str]): The name of the sender.
+        limit (int): The maximum number of messages in the page.
+        before (Optional[MessageHistoryCursor]): Only return messages before this position, usually the
+            `next_cursor` of the previous page.
+
+    Returns:
+        MessageHistoryPage: The messages and the cursor of the page of older messages.
+    """
+    if batcher := get_message_write_batcher():
+        await batcher.wait_for_session(session_id)
+    session_id = str(session_id)
+    cache = get_message_history_cache() if before is None and flow_id is None else None
+    if cache is not None:
+        cached = cache.get(session_id, sender=sender, sender_name=sender_name, limit=limit)
+        if cached is not None:
+            rows, next_cursor = cached
+            return MessageHistoryPage(messages=[_history_message(row) for row in rows], next_cursor=next_cursor)
+        # Unfiltered reads load the session's tail window, which later reads are served from
+        if sender or sender_name or limit > cache.max_messages:
+            cache = None
+
+    stmt = select(MessageTable).where(MessageTable.error == False)  # noqa: E712
+    stmt = stmt.where(MessageTable.session_id == session_id)
+    if flow_id:
+        stmt = stmt.where(MessageTable.flow_id == flow_id)
+    if sender:
+        stmt = stmt.where(MessageTable.sender == sender)
+    if sender_name:
+        stmt = stmt.where(MessageTable.sender_name == sender_name)
+    if before is not None:
+        stmt = stmt.where(
+            or_(
+                col(MessageTable.timestamp) < before.timestamp,
+                and_(
+                    col(MessageTable.timestamp) == before.timestamp,
+                    or_(
+                        col(MessageTable.sequence) < before.sequence,
+                        and_(col(MessageTable.sequence) == before.sequence, col(MessageTable.id) < before.id),
+                    ),
+                ),
+            )
+        )
+    # The sequence orders the messages stored in the same second, the id those stored before it existed
+    stmt = stmt.order_by(
+        col(MessageTable.timestamp).desc(), col(MessageTable.sequence).desc(), col(MessageTable.id).desc()
+    )
+    if cache is None:
+        async with session_scope() as session:
+            rows = list(await session.exec(stmt.limit(limit + 1)))
+    else:
+        cache.begin_load(session_id)
+        loaded: list[MessageTable] | None = None
+        try:
+            async with session_scope() as session:
+                loaded = list(await session.exec(stmt.limit(cache.max_messages + 1)))
+        finally:
+            if loaded is None:
+                cache.end_load(session_id)
+            else:
+                window = loaded[: cache.max_messages][::-1]
+                cache.end_load(session_id, window, complete=len(loaded) <= cache.max_messages)
+        rows = loaded[: limit + 1]
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _history_cursor(rows[-1])
+    return MessageHistoryPage(messages=[_history_message(row) for row in reversed(rows)], next_cursor=next_cursor)
+
+
+def _history_sort_key(row: MessageTable | MessageRead) -> tuple[datetime, int, UUID]:
+    # The order of history pages, so a window sorts messages stored in the same second as the database does
+    return row.timestamp, row.sequence, row.id
+
+
+def _history_cursor(row: MessageTable | MessageRead) -> MessageHistoryCursor:
+    return MessageHistoryCursor(timestamp=row.timestamp, sequence=row.sequence, id=row.id)
+
+
+@dataclass
+class _SessionWindow:
+    rows: list[MessageTable | MessageRead]
+    """The latest messages of the session, oldest first."""
+    sizes: list[int]
+    complete: bool
+    """Whether the window holds every message of the session."""
+    nbytes: int = 0
+
+
+class MessageHistoryCache:
+    """In-memory tail windows of the sessions whose history was read recently.
+
+    A window holds the latest `max_messages` messages of a session (fewer when they take more than
+    `max_bytes`) and knows whether those are all the messages of the session. Windows are loaded by history
+    reads, extended as messages of the session are added and kept up to date as they are updated, so the memory
+    reads of an active conversation don't query the database. A window is dropped when messages of its session
+    are deleted, moved to another session or reordered by an update, and the least recently read windows are
+    evicted once all windows together take more than `max_bytes`.
+
+    Only messages written through this process are seen; with several workers a session's window can miss
+    messages stored by another worker until it is evicted.
+    """
+
+    def __init__(self, max_messages: int, max_bytes: int):
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self._windows: LRUCache = LRUCache(maxsize=max_bytes, getsizeof=lambda window: window.nbytes)
+        self._loading: defaultdict[str, int] = defaultdict(int)
+        self._stale: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        session_id: str,
+        *,
+        sender: str | None = None,
+        sender_name: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[MessageTable | MessageRead], MessageHistoryCursor | None] | None:
+        """Return the latest `limit` matching messages and the cursor of the older ones, if the window has them."""
+        if limit <= 0:
+            return None
+        with self._lock:
+            window = self._windows.get(session_id)
+            if window is None:
+                return None
+            rows = [
+                row
+                for row in window.rows
+                if (not sender or row.sender == sender) and (not sender_name or row.sender_name == sender_name)
+            ]
+            complete = window.complete
+        if len(rows) > limit:
+            rows = rows[-limit:]
+            return rows, _history_cursor(rows[0])
+        if complete:
+            return rows, None
+        return None
+
+    def begin_load(self, session_id: str) -> None:
+        with self._lock:
+            self._loading[session_id] += 1
+
+    def end_load(
+        self, session_id: str, rows: list[MessageTable | MessageRead] | None = None, *, complete: bool = False
+    ) -> None:
+        """Store the window read from the database, unless the session changed while it was being read."""
+        with self._lock:
+            self._loading[session_id] -= 1
+            stale = session_id in self._stale
+            if not self._loading[session_id]:
+                del self._loading[session_id]
+                self._stale.discard(session_id)
+            if rows is None or stale:
+                return
+            window = _SessionWindow(rows=[], sizes=[], complete=complete)
+            for row in rows:
+                self._append(window, row)
+            self._store(session_id, window)
+
+    def extend(self, rows: Sequence[MessageTable | MessageRead]) -> None:
+        """Add newly stored messages to the windows of their sessions."""
+        with self._lock:
+            touched = {}
+            for row in rows:
+                session_id = str(row.session_id)
+                self._mark_stale(session_id)
+                window = self._windows.get(session_id)
+                if window is None or row.error:
+                    continue
+                self._insert(window, row)
+                touched[session_id] = window
+            for session_id, window in touched.items():
+                self._store(session_id, window)
+
+    def replace(self, rows: Sequence[MessageTable | MessageRead]) -> None:
+        """Replace updated messages in the windows of their sessions.
+
+        A window is dropped instead when the update changes which messages it holds or their order, like a
+        message that was moved to the session, became an error or got a new timestamp.
+        """
+        with self._lock:
+            for row in rows:
+                session_id = str(row.session_id)
+                self._mark_stale(session_id)
+                window = self._windows.get(session_id)
+                if window is None:
+                    continue
+                index = next((i for i in reversed(range(len(window.rows))) if window.rows[i].id == row.id), None)
+                if index is None:
+                    older = bool(window.rows) and _history_sort_key(row) < _history_sort_key(window.rows[0])
+                    if row.error or (older and not window.complete):
+                        # Not part of the window before or after the update
+                        continue
+                elif not row.error and _history_sort_key(row) == _history_sort_key(window.rows[index]):
+                    size = len(row.model_dump_json())
+                    window.rows[index] = row
+                    window.nbytes += size - window.sizes[index]
+                    window.sizes[index] = size
+                    self._trim(window)
+                    self._store(session_id, window)
+                    continue
+                del self._windows[session_id]
+
+    def invalidate(self, session_id: str | None = None, *, flow_id: str | UUID | None = None) -> None:
+        """Drop the window of a session, the windows holding messages of a flow, or every window."""
+        with self._lock:
+            if session_id is not None:
+                self._mark_stale(str(session_id))
+                self._windows.pop(str(session_id), None)
+                return
+            if flow_id is not None:
+                flow_id = str(flow_id)
+                for key, window in list(self._windows.items()):
+                    if any(str(row.flow_id) == flow_id for row in window.rows):
+                        del self._windows[key]
+                self._stale.update(self._loading)
+                return
+            self._windows.clear()
+            self._stale.update(self._loading)
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def _mark_stale(self, session_id: str) -> None:
+        if session_id in self._loading:
+            self._stale.add(session_id)
+
+    def _insert(self, window: _SessionWindow, row: MessageTable | MessageRead) -> None:
+        if not window.rows or _history_sort_key(row) >= _history_sort_key(window.rows[-1]):
+            self._append(window, row)
+            return
+        index = bisect.bisect_right(window.rows, _history_sort_key(row), key=_history_sort_key)
+        if index == 0 and not window.complete:
+            # Older than the window, so not part of the session's tail
+            return
+        size = len(row.model_dump_json())
+        window.rows.insert(index, row)
+        window.sizes.insert(index, size)
+        window.nbytes += size
+        self._trim(window)
+
+    def _append(self, window: _SessionWindow, row: MessageTable | MessageRead) -> None:
+        size = len(row.model_dump_json())
+        window.rows.append(row)
+        window.sizes.append(size)
+        window.nbytes += size
+        self._trim(window)
+
+    def _trim(self, window: _SessionWindow) -> None:
+        while window.rows and (len(window.rows) > self.max_messages or window.nbytes > self.max_bytes):
+            window.rows.pop(0)
+            window.nbytes -= window.sizes.pop(0)
+            window.complete = False
+
+    def _store(self, session_id: str, window: _SessionWindow) -> None:
+        # Setting the window again updates its size in the cache, evicting the least recently used windows
+        self._windows[session_id] = window
+
+
+_message_history_cache: MessageHistoryCache | None = None
+
+
+def get_message_history_cache() -> MessageHistoryCache | None:
+    """Return the message history cache, or None when `message_history_cache_size` is 0."""
+    global _message_history_cache  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if settings.message_history_cache_size <= 0:
+        return None
+    if (
+        _message_history_cache is None
+        or _message_history_cache.max_messages != settings.message_history_cache_size
+        or _message_history_cache.max_bytes != settings.message_history_cache_max_bytes
+    ):
+        _message_history_cache = MessageHistoryCache(
+            max_messages=settings.message_history_cache_size, max_bytes=settings.message_history_cache_max_bytes
+        )
+    return _message_history_cache
+
+
+def invalidate_message_history(session_id: str | None = None, *, flow_id: str | UUID | None = None) -> None:
+    """Drop cached history after messages were updated or deleted outside of the functions of this module."""
+    if cache := get_message_history_cache():
+        cache.invalidate(session_id, flow_id=flow_id)
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
     """DEPRECATED - Add a message to the monitor service.
 
@@ -107,8 +472,118 @@ def add_messages(messages: Message | list[Message], flow_id: str | UUID | None =
     return run_until_complete(aadd_messages(messages, flow_id=flow_id))
 
 
+class MessageWriteBatcher:
+    """Inserts the messages stored by concurrent callers together, in small bulk transactions.
+
+    The first queued message opens a window of `window` seconds; everything queued until then (up to
+    `max_batch_size` messages) is inserted in one transaction. Messages are written in the order they were
+    queued, and each caller only gets its stored messages back once they are committed. Readers can wait for
+    the pending writes of a session with `wait_for_session`.
+    """
+
+    def __init__(self, window: float, max_batch_size: int = 100):
+        self.window = window
+        self.max_batch_size = max(1, max_batch_size)
+        self.loop = asyncio.get_running_loop()
+        self._queue: deque[tuple[MessageTable, asyncio.Future, float]] = deque()
+        self._pending: defaultdict[str, set[asyncio.Future]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+
+    async def add(self, messages: list[MessageTable]) -> list[MessageRead]:
+        futures = []
+        for message in messages:
+            future = self.loop.create_future()
+            self._queue.append((message, future, time.perf_counter()))
+            self._pending[str(message.session_id)].add(future)
+            futures.append(future)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return list(await asyncio.gather(*futures))
+
+    async def wait_for_session(self, session_id: str | UUID | None = None) -> None:
+        """Wait until the queued messages of the session (or of every session) are written."""
+        if session_id is None:
+            futures = [future for futures in self._pending.values() for future in futures]
+        else:
+            futures = list(self._pending.get(str(session_id), ()))
+        if futures:
+            await asyncio.wait(futures)
+
+    async def _run(self) -> None:
+        try:
+            while self._queue:
+                await asyncio.sleep(self.window)
+                while self._queue:
+                    batch_size = min(self.max_batch_size, len(self._queue))
+                    await self._flush([self._queue.popleft() for _ in range(batch_size)])
+        finally:
+            self._task = None
+
+    async def _flush(self, batch: list[tuple[MessageTable, asyncio.Future, float]]) -> None:
+        outcome = "ok"
+        try:
+            async with session_scope() as session:
+                stored = await aadd_messagetables([message for message, _, _ in batch], session)
+        except Exception:  # noqa: BLE001
+            # Write the messages one by one so a single bad message does not fail the whole batch
+            outcome = "error"
+            for message, future, _ in batch:
+                try:
+                    async with session_scope() as session:
+                        (stored_message,) = await aadd_messagetables([message], session)
+                except Exception as e:  # noqa: BLE001
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(stored_message)
+        else:
+            for (_, future, _), stored_message in zip(batch, stored, strict=True):
+                if not future.done():
+                    future.set_result(stored_message)
+        finally:
+            for message, future, _ in batch:
+                session_futures = self._pending.get(str(message.session_id))
+                if session_futures is not None:
+                    session_futures.discard(future)
+                    if not session_futures:
+                        del self._pending[str(message.session_id)]
+            _record_message_write_batch(len(batch), time.perf_counter() - batch[0][2], outcome)
+
+
+def _record_message_write_batch(batch_size: int, seconds: float, outcome: str) -> None:
+    try:
+        ot = get_telemetry_service().ot
+        ot.observe_histogram("message_write_batch_size", batch_size, {"outcome": outcome})
+        ot.observe_histogram("message_write_flush_duration", seconds, {"outcome": outcome})
+    except Exception:  # noqa: BLE001
+        logger.opt(exception=True).debug("Failed to record message write batch metrics")
+
+
+_message_write_batcher: MessageWriteBatcher | None = None
+
+
+def get_message_write_batcher() -> MessageWriteBatcher | None:
+    """Return the message write batcher of the running event loop, or None when batching is disabled."""
+    global _message_write_batcher  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if settings.message_write_batch_window <= 0:
+        return None
+    require_main_loop("The message write batcher")
+    loop = asyncio.get_running_loop()
+    if _message_write_batcher is None or _message_write_batcher.loop is not loop:
+        _message_write_batcher = MessageWriteBatcher(
+            window=settings.message_write_batch_window, max_batch_size=settings.message_write_batch_size
+        )
+    return _message_write_batcher
+
+
 async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
-    """Add a message to the monitor service."""
+    """Add a message to the monitor service.
+
+    Unless `message_write_batch_window` is 0, the messages are inserted together with the ones stored
+    concurrently by other callers.
+    """
     if not isinstance(messages, list):
         messages = [messages]
 
@@ -119,8 +594,11 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
 
     try:
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
-        async with session_scope() as session:
-            messages_models = await aadd_messagetables(messages_models, session)
+        if batcher := get_message_write_batcher():
+            messages_models = await batcher.add(messages_models)
+        else:
+            async with session_scope() as session:
+                messages_models = await aadd_messagetables(messages_models, session)
         return [await Message.create(**message.model_dump()) for message in messages_models]
     except Exception as e:
         logger.exception(e)
@@ -136,6 +614,7 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
         for message in messages:
             msg = await session.get(MessageTable, message.id)
             if msg:
+                previous_session_id = msg.session_id
                 msg = msg.sqlmodel_update(message.model_dump(exclude_unset=True, exclude_none=True))
                 # Convert flow_id to UUID if it's a string preventing error when saving to database
                 if msg.flow_id and isinstance(msg.flow_id, str):
@@ -144,11 +623,17 @@ async def aupdate_messages(messages: Message | list[Message]) -> list[Message]:
                 await session.commit()
                 await session.refresh(msg)
                 updated_messages.append(msg)
+                if previous_session_id != msg.session_id:
+                    invalidate_message_history(previous_session_id)
             else:
                 error_message = f"Message with id {message.id} not found"
                 logger.warning(error_message)
                 raise ValueError(error_message)
-        return [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+        stored_messages = [MessageRead.model_validate(message, from_attributes=True) for message in updated_messages]
+        # Streamed and agent messages are updated as they grow, so they are replaced in the cached history
+        if cache := get_message_history_cache():
+            cache.replace(stored_messages)
+        return stored_messages
 
 
 async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession):
@@ -179,7 +664,10 @@ async def aadd_messagetables(messages: list[MessageTable], session: AsyncSession
         msg.category = msg.category or ""
         new_messages.append(msg)
 
-    return [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    stored_messages = [MessageRead.model_validate(message, from_attributes=True) for message in new_messages]
+    if cache := get_message_history_cache():
+        cache.extend(stored_messages)
+    return stored_messages
 
 
 def delete_messages(session_id: str) -> None:
@@ -206,6 +694,7 @@ async def adelete_messages(session_id: str) -> None:
             .execution_options(synchronize_session="fetch")
         )
         await session.exec(stmt)
+    invalidate_message_history(session_id)
 
 
 async def delete_message(id_: str) -> None:
@@ -219,6 +708,7 @@ async def delete_message(id_: str) -> None:
         if message:
             await session.delete(message)
             await session.commit()
+            invalidate_message_history(message.session_id)
 
 
 def store_message(
@@ -295,16 +785,17 @@ class LCBuiltinChatMemory(BaseChatMessageHistory):
 
     @property
     def messages(self) -> list[BaseMessage]:
-        messages = get_messages(
-            session_id=self.session_id,
-        )
-        return [m.to_lc_message() for m in messages if not m.error]  # Exclude error messages
+        return run_until_complete(self.aget_messages())
 
     async def aget_messages(self) -> list[BaseMessage]:
-        messages = await aget_messages(
-            session_id=self.session_id,
-        )
-        return [m.to_lc_message() for m in messages if not m.error]  # Exclude error messages
+        # Error messages are excluded from the history; the latest page usually comes from the history cache
+        page = await aget_message_history(self.session_id)
+        messages = page.messages
+        while page.next_cursor is not None:
+            page = await aget_message_history(self.session_id, before=page.next_cursor)
+            messages = page.messages + messages
+        # Newest first, the default order of aget_messages
+        return [m.to_lc_message() for m in reversed(messages)]
 
     def add_messages(self, messages: Sequence[BaseMessage]) -> None:
         for lc_message in messages:
@@ -32,8 +32,13 @@ async def run_graph_internal(
     inputs: list[InputValueRequest] | None = None,
     outputs: list[str] | None = None,
     event_manager: EventManager | None = None,
+    max_concurrency: int = 1,
 ) -> tuple[list[RunOutputs], str]:
-    """Run the graph and generate the result."""
+    """Run the graph and generate the result.
+
+    When `max_concurrency` is greater than one and there are several inputs, the inputs run
+    concurrently on isolated copies of the graph instead of one after another.
+    """
     inputs = inputs or []
     effective_session_id = session_id or flow_id
     components = []
@@ -49,6 +54,20 @@ async def run_graph_internal(
 
     fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
     graph.session_id = effective_session_id
+    if max_concurrency > 1 and len(inputs_list) > 1:
+        batch_outputs = await graph.arun_batch(
+            inputs=inputs_list,
+            inputs_components=components,
+            types=types,
+            outputs=outputs or [],
+            stream=stream,
+            session_id=effective_session_id or "",
+            fallback_to_env_vars=fallback_to_env_vars,
+            event_manager=event_manager,
+            max_concurrency=max_concurrency,
+            return_exceptions=False,
+        )
+        return cast("list[RunOutputs]", batch_outputs), effective_session_id
     run_outputs = await graph.arun(
         inputs=inputs_list,
         inputs_components=components,
@@ -158,12 +177,6 @@ def apply_tweaks(node: dict[str, Any], node_tweaks: dict[str, Any]) -> None:
                 template_data[tweak_name][key] = tweak_value
 
 
-def apply_tweaks_on_vertex(vertex: Vertex, node_tweaks: dict[str, Any]) -> None:
-    for tweak_name, tweak_value in node_tweaks.items():
-        if tweak_name and tweak_value and tweak_name in vertex.params:
-            vertex.params[tweak_name] = tweak_value
-
-
 def process_tweaks(
     graph_data: dict[str, Any], tweaks: Tweaks | dict[str, dict[str, Any]], *, stream: bool = False
 ) -> dict[str, Any]:
@@ -199,12 +212,18 @@ def process_tweaks(
     return graph_data
 
 
-def process_tweaks_on_graph(graph: Graph, tweaks: dict[str, dict[str, Any]]):
+def process_tweaks_on_graph(graph: Graph, tweaks: Tweaks | dict[str, dict[str, Any]], *, stream: bool = False) -> Graph:
+    """Apply tweaks to an unbuilt graph as per-run parameter overrides.
+
+    The tweaks follow the same rules as `process_tweaks`, but they are applied to the templates of the graph's
+    vertices and the vertex parameters are rebuilt in place, so the graph does not have to be re-created from
+    its JSON payload.
+    """
+    nodes = [vertex.full_data for vertex in graph.vertices]
+    process_tweaks({"nodes": nodes}, tweaks, stream=stream)
     for vertex in graph.vertices:
-        if isinstance(vertex, Vertex) and isinstance(vertex.id, str):
-            node_id = vertex.id
-            if node_tweaks := tweaks.get(node_id):
-                apply_tweaks_on_vertex(vertex, node_tweaks)
+        if isinstance(vertex, Vertex):
+            vertex.build_params()
         else:
             logger.warning("Each node should be a Vertex with an 'id' attribute of type str")
 
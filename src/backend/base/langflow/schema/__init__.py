@@ -1,6 +1,7 @@
 from .data import Data
+from .data_batch import DataBatch
 from .dataframe import DataFrame
 from .dotdict import dotdict
 from .message import Message
 
-__all__ = ["Data", "DataFrame", "Message", "dotdict"]
+__all__ = ["Data", "DataBatch", "DataFrame", "Message", "dotdict"]
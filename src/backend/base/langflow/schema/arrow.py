@@ -0,0 +1,82 @@
+"""Apache Arrow storage for DataFrames.
+
+An Arrow-backed frame keeps each column in a `pandas.ArrowDtype` array. Arrow arrays are immutable, so slicing a
+frame, selecting some of its columns or concatenating frames shares their buffers instead of copying them. A frame
+can also be spilled: written to an Arrow IPC file and memory-mapped, so its pages live in the file system cache
+rather than on the heap.
+
+pyarrow is an optional dependency, only imported when a frame is converted.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pandas as pd
+from loguru import logger
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_SPILL_DIR = Path(tempfile.gettempdir()) / "langflow-dataframes"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        msg = "Arrow-backed DataFrames require the pyarrow package. Please install it with: pip install pyarrow"
+        raise ImportError(msg) from exc
+    return pa
+
+
+def is_arrow_backed(df: pd.DataFrame) -> bool:
+    """Returns True if every column of the frame is stored in an Arrow array."""
+    return len(df.columns) > 0 and all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+def to_arrow_table(df: pd.DataFrame, *, preserve_index: bool | None = None) -> pa.Table:
+    """Converts a frame to an Arrow table, without copying the columns that are already Arrow arrays."""
+    pa = _import_pyarrow()
+    return pa.Table.from_pandas(df, preserve_index=preserve_index)
+
+
+def from_arrow_table(table: pa.Table) -> pd.DataFrame:
+    """Converts an Arrow table to an Arrow-backed frame that wraps the table's arrays."""
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def to_arrow_backed(df: pd.DataFrame) -> pd.DataFrame:
+    """Returns an Arrow-backed version of the frame, or the frame itself if Arrow can't hold its columns."""
+    if is_arrow_backed(df) or not len(df.columns):
+        return df
+    pa = _import_pyarrow()
+    try:
+        return from_arrow_table(to_arrow_table(df))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as exc:
+        # Columns mixing types, like dictionaries and strings, have no Arrow type
+        logger.debug(f"Keeping the DataFrame in pandas storage: {exc}")
+        return df
+
+
+def spill_to_ipc(df: pd.DataFrame, directory: Path | None = None) -> pd.DataFrame:
+    """Writes the frame to an Arrow IPC file and returns a frame backed by a memory map of the file.
+
+    The file is removed once mapped. The mapping keeps its pages until the last array that references it is freed,
+    except on Windows, where an open file can't be removed and stays in the directory.
+    """
+    pa = _import_pyarrow()
+    table = to_arrow_table(df)
+    directory = directory or DEFAULT_SPILL_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{uuid4()}.arrow"
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    mapped = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    with contextlib.suppress(OSError):
+        path.unlink()
+    return from_arrow_table(mapped)
@@ -9,6 +9,7 @@ from langflow.schema.data import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.encoders import CUSTOM_ENCODERS
 from langflow.schema.message import Message
+from langflow.serialization.constants import MAX_ITEMS_LENGTH
 from langflow.serialization.serialization import serialize
 
 
@@ -68,7 +69,11 @@ def post_process_raw(raw, artifact_type: str):
     if artifact_type == ArtifactType.STREAM.value:
         raw = ""
     elif artifact_type == ArtifactType.ARRAY.value:
-        raw = raw.to_dict(orient="records") if isinstance(raw, DataFrame) else _to_list_of_dicts(raw)
+        if isinstance(raw, DataFrame):
+            # Like serialize(), preview the first rows rather than converting the whole frame
+            raw = raw.head(MAX_ITEMS_LENGTH).to_dict(orient="records")
+        else:
+            raw = _to_list_of_dicts(raw)
     elif artifact_type == ArtifactType.UNKNOWN.value and raw is not None:
         if isinstance(raw, BaseModel | dict):
             try:
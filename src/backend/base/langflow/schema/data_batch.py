@@ -0,0 +1,173 @@
+"""A batch of records that behaves like a sequence of `Data`.
+
+Components that emit many small records, like text chunks, pay for a Pydantic model and a payload dict per record
+when they build a `list[Data]`. A `DataBatch` stores one list per key instead and only creates `Data` objects when
+an item is accessed, so a batch that ends up in a DataFrame or in storage never creates them at all.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+from langflow.schema.data import Data
+
+if TYPE_CHECKING:
+    from langchain_core.documents import Document
+
+
+class _Missing:
+    def __repr__(self):
+        return "<missing>"
+
+    def __reduce__(self):
+        # Unpickle to the module's instance, which the columns are checked against
+        return "_MISSING"
+
+
+_MISSING = _Missing()
+"""Fills the columns of records that lack the key, so absent keys stay absent when a record is rebuilt."""
+
+
+class DataBatch(Sequence[Data]):
+    """A column-oriented batch of records, compatible with `list[Data]` for reading.
+
+    Args:
+        columns: A dictionary of equally long lists, one per key.
+        text_key: The text key of the `Data` objects created from the batch.
+        default_value: The default value of the `Data` objects created from the batch.
+
+    Examples:
+        >>> batch = DataBatch.from_records([{"text": "a", "page": 1}, {"text": "b", "page": 2}])
+        >>> batch[1].get_text()
+        'b'
+        >>> batch.column("page")
+        [1, 2]
+    """
+
+    __slots__ = ("_columns", "_length", "default_value", "text_key")
+
+    def __init__(
+        self,
+        columns: Mapping[str, Sequence[Any]] | None = None,
+        *,
+        text_key: str = "text",
+        default_value: str | None = "",
+    ):
+        self._columns = {key: list(values) for key, values in (columns or {}).items()}
+        lengths = {len(values) for values in self._columns.values()}
+        if len(lengths) > 1:
+            msg = "All columns of a DataBatch must have the same length"
+            raise ValueError(msg)
+        self._length = lengths.pop() if lengths else 0
+        self.text_key = text_key
+        self.default_value = default_value
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Mapping[str, Any] | Data], *, text_key: str = "text", default_value: str | None = ""
+    ) -> DataBatch:
+        """Creates a batch from dictionaries or Data objects."""
+        batch = cls(text_key=text_key, default_value=default_value)
+        batch.extend(records)
+        return batch
+
+    @classmethod
+    def from_documents(
+        cls, documents: Iterable[Document], *, text_key: str = "text", default_value: str | None = ""
+    ) -> DataBatch:
+        """Creates a batch with the metadata and page content of each Document.
+
+        As with `Data.from_document`, a metadata key named like the text key takes precedence over the content.
+        """
+        batch = cls(text_key=text_key, default_value=default_value)
+        for document in documents:
+            record = dict(document.metadata)
+            record.setdefault(text_key, document.page_content)
+            batch.append(record)
+        return batch
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self._columns)
+
+    def append(self, record: Mapping[str, Any] | Data) -> None:
+        """Appends a record to the batch, adding columns for its new keys."""
+        if isinstance(record, Data):
+            record = record.data
+        for key in record:
+            if key not in self._columns:
+                self._columns[key] = [_MISSING] * self._length
+        for key, values in self._columns.items():
+            values.append(record.get(key, _MISSING))
+        self._length += 1
+
+    def extend(self, records: Iterable[Mapping[str, Any] | Data]) -> None:
+        for record in records:
+            self.append(record)
+
+    def record(self, index: int) -> dict[str, Any]:
+        """Returns the payload of a record as a new dictionary."""
+        index = range(self._length)[index]
+        return {key: values[index] for key, values in self._columns.items() if values[index] is not _MISSING}
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Yields the payload of each record as a new dictionary."""
+        if not self._columns:
+            for _ in range(self._length):
+                yield {}
+            return
+        keys = list(self._columns)
+        for row in zip(*self._columns.values(), strict=True):
+            yield {key: value for key, value in zip(keys, row, strict=True) if value is not _MISSING}
+
+    def column(self, key: str) -> list[Any]:
+        """Returns the values of a key, with None for the records that lack it."""
+        return [None if value is _MISSING else value for value in self._columns[key]]
+
+    def to_columns(self) -> dict[str, list[Any]]:
+        """Returns a dictionary of lists, with None for missing values, ready for `pandas.DataFrame`."""
+        return {key: self.column(key) for key in self._columns}
+
+    def to_data_list(self) -> list[Data]:
+        """Materializes every record as a Data object."""
+        return list(self)
+
+    def _to_data(self, record: dict[str, Any]) -> Data:
+        return Data(data=record, text_key=self.text_key, default_value=self.default_value)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Data: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> DataBatch: ...
+
+    def __getitem__(self, index: int | slice) -> Data | DataBatch:
+        if isinstance(index, slice):
+            if not self._columns:
+                rows = len(range(self._length)[index])
+                return DataBatch.from_records([{}] * rows, text_key=self.text_key, default_value=self.default_value)
+            columns = {key: values[index] for key, values in self._columns.items()}
+            return DataBatch(columns, text_key=self.text_key, default_value=self.default_value)
+        return self._to_data(self.record(index))
+
+    def __iter__(self) -> Iterator[Data]:
+        for record in self.records():
+            yield self._to_data(record)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DataBatch):
+            return len(self) == len(other) and all(
+                mine == theirs for mine, theirs in zip(self.records(), other.records(), strict=True)
+            )
+        if isinstance(other, list | tuple):
+            return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"DataBatch(rows={self._length}, keys={self.keys})"
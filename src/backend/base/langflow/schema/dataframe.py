@@ -1,10 +1,13 @@
+from pathlib import Path
 from typing import cast
 
 import pandas as pd
 from langchain_core.documents import Document
 from pandas import DataFrame as pandas_DataFrame
 
+from langflow.schema.arrow import from_arrow_table, is_arrow_backed, spill_to_ipc, to_arrow_backed, to_arrow_table
 from langflow.schema.data import Data
+from langflow.schema.data_batch import DataBatch
 
 
 class DataFrame(pandas_DataFrame):
@@ -17,6 +20,7 @@ class DataFrame(pandas_DataFrame):
         data: Input data in various formats:
             - List[Data]: List of Data objects
             - List[Dict]: List of dictionaries
+            - DataBatch: Batch of records, read column by column
             - Dict: Dictionary of arrays/lists
             - pandas.DataFrame: Existing DataFrame
             - Any format supported by pandas.DataFrame
@@ -35,7 +39,7 @@ class DataFrame(pandas_DataFrame):
 
     def __init__(
         self,
-        data: list[dict] | list[Data] | pd.DataFrame | None = None,
+        data: list[dict] | list[Data] | DataBatch | pd.DataFrame | None = None,
         text_key: str = "text",
         default_value: str = "",
         **kwargs,
@@ -57,6 +61,8 @@ class DataFrame(pandas_DataFrame):
                 msg = "List items must be either all Data objects or all dictionaries"
                 raise ValueError(msg)
             self._update(data, **kwargs)
+        elif isinstance(data, DataBatch):
+            self._update(data.to_columns(), **kwargs)
         elif isinstance(data, dict | pd.DataFrame):  # Fixed type check syntax
             self._update(data, **kwargs)
 
@@ -91,6 +97,11 @@ class DataFrame(pandas_DataFrame):
         # suggested change: [Data(**row) for row in list_of_dicts]
         return [Data(data=row) for row in list_of_dicts]
 
+    def to_data_batch(self) -> DataBatch:
+        """Converts the DataFrame to a DataBatch without creating a Data object per row."""
+        columns = {column: values.tolist() for column, values in self.items()}
+        return DataBatch(columns, text_key=self._text_key, default_value=self._default_value)
+
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
 
@@ -104,29 +115,66 @@ class DataFrame(pandas_DataFrame):
             >>> dataset = DataFrame([{"name": "John"}])
             >>> dataset = dataset.add_row({"name": "Jane"})
         """
-        if isinstance(data, Data):
-            data = data.data
-        new_df = self._constructor([data])
-        return cast("DataFrame", pd.concat([self, new_df], ignore_index=True))
+        return self.add_rows([data])
 
-    def add_rows(self, data: list[dict | Data]) -> "DataFrame":
+    def add_rows(self, data: list[dict | Data] | DataBatch | pd.DataFrame) -> "DataFrame":
         """Adds multiple rows to the dataset.
 
+        The rows are converted to a frame at once. If the DataFrame is Arrow-backed, so are the new rows, and the
+        result shares the Arrow buffers of both.
+
         Args:
-            data: List of Data objects or dictionaries to add as new rows
+            data: List of Data objects or dictionaries, a DataBatch or a DataFrame to add as new rows
 
         Returns:
             DataFrame: A new DataFrame with the added rows
         """
-        processed_data = []
-        for item in data:
-            if isinstance(item, Data):
-                processed_data.append(item.data)
-            else:
-                processed_data.append(item)
-        new_df = self._constructor(processed_data)
+        if isinstance(data, list):
+            data = [item.data if isinstance(item, Data) else item for item in data]
+        new_df = data if isinstance(data, pd.DataFrame) else self._constructor(data)
+        if self.is_arrow_backed:
+            new_df = to_arrow_backed(new_df)
         return cast("DataFrame", pd.concat([self, new_df], ignore_index=True))
 
+    @property
+    def is_arrow_backed(self) -> bool:
+        """Whether every column is stored in an Apache Arrow array."""
+        return is_arrow_backed(self)
+
+    @classmethod
+    def from_arrow(cls, table, text_key: str = "text", default_value: str = "") -> "DataFrame":
+        """Creates an Arrow-backed DataFrame that wraps the arrays of a pyarrow Table without copying them."""
+        return cls(from_arrow_table(table), text_key=text_key, default_value=default_value)
+
+    def to_arrow(self):
+        """Converts the DataFrame to a pyarrow Table, without copying the columns that are Arrow arrays."""
+        return to_arrow_table(self, preserve_index=False)
+
+    def to_arrow_backed(self, spill_threshold: int | None = None, spill_dir: Path | None = None) -> "DataFrame":
+        """Returns a DataFrame with the same rows whose columns are Apache Arrow arrays.
+
+        Slicing the result or selecting some of its columns shares its buffers instead of copying them. Columns
+        that Arrow can't hold, like ones mixing dictionaries and strings, leave the DataFrame in pandas storage.
+        Requires pyarrow.
+
+        Args:
+            spill_threshold: Size in bytes above which the rows are written to an Arrow IPC file and memory-mapped.
+            spill_dir: The directory of the spill files. Defaults to a directory in the system's temp directory.
+
+        Returns:
+            DataFrame: The Arrow-backed DataFrame, or this one if it already is.
+        """
+        frame = to_arrow_backed(self)
+        if (
+            spill_threshold is not None
+            and is_arrow_backed(frame)
+            and frame.memory_usage(index=False).sum() > spill_threshold
+        ):
+            frame = spill_to_ipc(frame, spill_dir)
+        if frame is self:
+            return self
+        return DataFrame(frame, text_key=self._text_key, default_value=self._default_value)
+
     @property
     def _constructor(self):
         def _c(*args, **kwargs):
@@ -1,10 +1,15 @@
+from __future__ import annotations
+
 import base64
+import mimetypes
 from pathlib import Path
+from typing import BinaryIO
 
 from PIL import Image as PILImage
 from pydantic import BaseModel
 
 from langflow.services.deps import get_storage_service
+from langflow.utils.image import convert_image_to_base64
 
 IMAGE_ENDPOINT = "/files/images/"
 
@@ -18,11 +23,41 @@ def is_image_file(file_path) -> bool:
     return True
 
 
-def get_file_paths(files: list[str]):
+def detect_image_format(file: str | Path | BinaryIO) -> str | None:
+    """Return the format of an image file, e.g. "PNG", or None when the file is not an image.
+
+    File objects are read from their current position, which is restored afterwards.
+    """
+    position = file.tell() if hasattr(file, "tell") else None
+    try:
+        with PILImage.open(file) as img:
+            img.verify()  # Verify that it is, in fact, an image
+            return img.format
+    except (OSError, SyntaxError):
+        return None
+    finally:
+        if position is not None:
+            file.seek(position)  # type: ignore[union-attr]
+
+
+def with_image_extension(file_name: str, image_format: str | None) -> str:
+    """Add the extension of its image format to a file name that doesn't already have a matching one.
+
+    The extension is how the type of a stored file is recognized after the upload, e.g. by `create_data_url`
+    and the image download endpoint, so files don't have to be opened again to find out.
+    """
+    mime_type = PILImage.MIME.get(image_format.upper()) if image_format else None
+    if not mime_type or mimetypes.guess_type(file_name)[0] == mime_type:
+        return file_name
+    extension = mimetypes.guess_extension(mime_type)
+    return f"{file_name}{extension}" if extension else file_name
+
+
+def get_file_paths(files: list[str | Image]):
     storage_service = get_storage_service()
     file_paths = []
     for file in files:
-        file_path = Path(file)
+        file_path = Path(file.path if isinstance(file, Image) else file)  # type: ignore[arg-type]
         flow_id, file_name = str(file_path.parent), file_path.name
         file_paths.append(storage_service.build_full_path(flow_id=flow_id, file_name=file_name))
     return file_paths
@@ -53,8 +88,7 @@ class Image(BaseModel):
 
     def to_base64(self):
         if self.path:
-            files = get_files([self.path], convert_to_base64=True)
-            return files[0]
+            return convert_image_to_base64(get_file_paths([self.path])[0])
         msg = "Image path is not set."
         raise ValueError(msg)
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import json
 import re
 import traceback
@@ -20,7 +19,7 @@ from langflow.base.prompts.utils import dict_values_to_string
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import ErrorContent
 from langflow.schema.data import Data
-from langflow.schema.image import Image, get_file_paths, is_image_file
+from langflow.schema.image import Image, get_file_paths
 from langflow.schema.properties import Properties, Source
 from langflow.schema.validators import timestamp_to_str, timestamp_to_str_validator
 from langflow.utils.constants import (
@@ -106,13 +105,9 @@ class Message(Data):
         return value
 
     def model_post_init(self, /, _context: Any) -> None:
-        new_files: list[Any] = []
-        for file in self.files or []:
-            if is_image_file(file):
-                new_files.append(Image(path=file))
-            else:
-                new_files.append(file)
-        self.files = new_files
+        # Files are kept as given: their type is known from the extension set at upload time, so building a
+        # message never opens them
+        self.files = list(self.files or [])
         if "timestamp" not in self.data:
             self.data["timestamp"] = self.timestamp
 
@@ -270,9 +265,7 @@ class Message(Data):
 
     @classmethod
     async def create(cls, **kwargs):
-        """If files are present, create the message in a separate thread as is_image_file is blocking."""
-        if "files" in kwargs:
-            return await asyncio.to_thread(cls, **kwargs)
+        """Kept for backwards compatibility; building a message no longer touches its files."""
         return cls(**kwargs)
 
 
@@ -8,6 +8,7 @@ from typing_extensions import TypedDict
 from langflow.schema.data import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.schema.message import Message
+from langflow.serialization.constants import MAX_ITEMS_LENGTH
 from langflow.serialization.serialization import serialize
 
 INPUT_FIELD_NAME = "input_value"
@@ -109,7 +110,8 @@ def build_output_logs(vertex, result) -> dict:
 
             case LogType.ARRAY:
                 if isinstance(message, DataFrame):
-                    message = message.to_dict(orient="records")
+                    # Like serialize(), preview the first rows rather than converting the whole frame
+                    message = message.head(MAX_ITEMS_LENGTH).to_dict(orient="records")
                 message = [serialize(item) for item in message]
         name = output.get("name", f"output_{index}")
         outputs |= {name: OutputValue(message=message, type=type_).model_dump()}
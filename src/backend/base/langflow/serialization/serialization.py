@@ -1,4 +1,4 @@
-from collections.abc import AsyncIterator, Generator, Iterator
+from collections.abc import AsyncIterator, Generator, Iterator, Sequence
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, cast
@@ -86,6 +86,26 @@ def _serialize_dict(obj: dict, max_length: int | None, max_items: int | None) ->
     return {k: serialize(v, max_length, max_items) for k, v in obj.items()}
 
 
+def _serialize_sequence(obj: Sequence, max_length: int | None, max_items: int | None) -> Any:
+    """Serialize the payloads of a DataBatch like a list of Data, without creating the Data objects."""
+    # langflow.schema imports this module
+    from langflow.schema.data_batch import DataBatch
+
+    if not isinstance(obj, DataBatch):
+        return _serialize_instance(obj, max_length, max_items)
+
+    def dump(record: dict) -> dict:
+        # The same shape as the model dump of a Data object
+        return {"text_key": obj.text_key, "data": record, "default_value": obj.default_value}
+
+    if max_items is not None and len(obj) > max_items:
+        items: list = [dump(obj.record(index)) for index in range(max_items)]
+        items.append(f"... [truncated {len(obj) - max_items} items]")
+    else:
+        items = [dump(record) for record in obj.records()]
+    return [serialize(item, max_length, max_items) for item in items]
+
+
 def _serialize_list_tuple(obj: list | tuple, max_length: int | None, max_items: int | None) -> list:
     """Truncate long lists and process items recursively."""
     if max_items is not None and len(obj) > max_items:
@@ -191,6 +211,8 @@ def _serialize_dispatcher(obj: Any, max_length: int | None, max_items: int | Non
             return _serialize_series(obj, max_length, max_items)
         case list() | tuple():
             return _serialize_list_tuple(obj, max_length, max_items)
+        case Sequence():
+            return _serialize_sequence(obj, max_length, max_items)
         case object() if _is_numpy_type(obj):
             return _serialize_numpy_type(obj, max_length, max_items)
         case object() if not isinstance(obj, type):  # Match any instance that's not a class
@@ -0,0 +1,190 @@
+"""Encoding of the values stored by external caches.
+
+An encoded value starts with two bytes: the serializer that wrote the payload and the compression applied to it.
+Data, Message and DataFrame values, and values made only of JSON types, have their own serializers, which are faster
+and smaller than pickling them. Any other value is pickled, and values that pickle can't handle, like instances of
+classes defined in component code, are pickled with dill.
+
+Values written with dill before the codec existed start with the pickle protocol opcode, and are still read.
+"""
+
+from __future__ import annotations
+
+import math
+import pickle
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal
+
+import dill
+import orjson
+from loguru import logger
+
+if TYPE_CHECKING:
+    from langflow.schema.data import Data
+    from langflow.schema.dataframe import DataFrame
+    from langflow.schema.message import Message
+
+CompressionType = Literal["none", "zstd", "lz4"]
+
+PICKLE, DILL, JSON, DATA, MESSAGE, DATAFRAME = range(6)
+COMPRESSIONS: dict[str, int] = {"none": 0, "zstd": 1, "lz4": 2}
+LEGACY_PICKLE_PREFIX = pickle.PROTO[0]
+DATAFRAME_METADATA_KEY = b"langflow"
+
+
+@cache
+def _schema_types() -> tuple[type[Data], type[Message], type[DataFrame]]:
+    # Imported on first use, as the schema modules import the services
+    from langflow.schema.data import Data
+    from langflow.schema.dataframe import DataFrame
+    from langflow.schema.message import Message
+
+    return Data, Message, DataFrame
+
+
+def _is_json(value: Any) -> bool:
+    """Returns True if the value is made of types that a JSON round trip gives back unchanged."""
+    if value is None or isinstance(value, str | bool | int):
+        return True
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if type(value) is list:
+        return all(_is_json(item) for item in value)
+    if type(value) is dict:
+        return all(isinstance(key, str) and _is_json(item) for key, item in value.items())
+    return False
+
+
+def _encode_dataframe(value: DataFrame) -> bytes:
+    from langflow.schema.arrow import _import_pyarrow, is_arrow_backed, to_arrow_table
+
+    pa = _import_pyarrow()
+    arrow_backed = is_arrow_backed(value)
+    if not arrow_backed:
+        for column, dtype in value.dtypes.items():
+            # Arrow reads lists back as numpy arrays, so object columns are only stored if they hold text
+            if dtype == "object" and not value[column].map(lambda item: item is None or isinstance(item, str)).all():
+                msg = f"Column {column!r} holds values other than text"
+                raise TypeError(msg)
+    table = to_arrow_table(value)
+    metadata = {
+        "text_key": value.text_key,
+        "default_value": value.default_value,
+        "arrow_backed": arrow_backed,
+    }
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), DATAFRAME_METADATA_KEY: orjson.dumps(metadata)}
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _decode_dataframe(payload: bytes) -> DataFrame:
+    from langflow.schema.arrow import _import_pyarrow, from_arrow_table
+
+    pa = _import_pyarrow()
+    table = pa.ipc.open_stream(payload).read_all()
+    metadata = orjson.loads(table.schema.metadata[DATAFRAME_METADATA_KEY])
+    frame = from_arrow_table(table) if metadata["arrow_backed"] else table.to_pandas()
+    return _schema_types()[2](frame, text_key=metadata["text_key"], default_value=metadata["default_value"])
+
+
+def _compressor(compression: str):
+    """Returns the functions that compress and decompress with the algorithm."""
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            msg = "zstd compression requires the zstandard package. Please install it with: pip install zstandard"
+            raise ImportError(msg) from exc
+        return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+    if compression == "lz4":
+        try:
+            import lz4.frame
+        except ImportError as exc:
+            msg = "lz4 compression requires the lz4 package. Please install it with: pip install lz4"
+            raise ImportError(msg) from exc
+        return lz4.frame.compress, lz4.frame.decompress
+    msg = f"Unknown compression: {compression}. Expected one of {list(COMPRESSIONS)}"
+    raise ValueError(msg)
+
+
+class CacheCodec:
+    """Encodes cached values to bytes and decodes them back.
+
+    Args:
+        compression: The compression of payloads larger than `compression_threshold` bytes.
+        compression_threshold: The size in bytes above which payloads are compressed.
+    """
+
+    def __init__(self, compression: CompressionType = "none", compression_threshold: int = 16 * 1024) -> None:
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._compress = _compressor(compression)[0] if compression != "none" else None
+        self._decompressors: dict[int, Any] = {}
+
+    def encode(self, value: Any) -> bytes:
+        serializer, payload = self._serialize(value)
+        compression = COMPRESSIONS["none"]
+        if self._compress is not None and len(payload) > self.compression_threshold:
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                compression, payload = COMPRESSIONS[self.compression], compressed
+        return bytes((serializer, compression)) + payload
+
+    def decode(self, encoded: bytes) -> Any:
+        if encoded[0] == LEGACY_PICKLE_PREFIX:
+            return dill.loads(encoded)
+        serializer, compression = encoded[0], encoded[1]
+        payload = encoded[2:]
+        if compression:
+            payload = self._decompressor(compression)(payload)
+        return self._deserialize(serializer, payload)
+
+    def _decompressor(self, compression: int):
+        if compression not in self._decompressors:
+            name = next(name for name, value in COMPRESSIONS.items() if value == compression)
+            self._decompressors[compression] = _compressor(name)[1]
+        return self._decompressors[compression]
+
+    @staticmethod
+    def _serialize(value: Any) -> tuple[int, bytes]:
+        value_type = type(value)
+        data_type, message_type, dataframe_type = _schema_types()
+        try:
+            if value_type is data_type and _is_json(value.data) and _is_json(value.default_value):
+                fields = {"text_key": value.text_key, "data": value.data, "default_value": value.default_value}
+                return DATA, orjson.dumps(fields)
+            if value_type is message_type and _is_json(value.data):
+                return MESSAGE, value.model_dump_json().encode()
+            if value_type is dataframe_type:
+                return DATAFRAME, _encode_dataframe(value)
+            if _is_json(value):
+                return JSON, orjson.dumps(value)
+        except Exception as exc:  # noqa: BLE001
+            # Like a frame whose columns Arrow can't hold or an integer too large for JSON
+            logger.debug(f"Pickling a {value_type.__name__} value for the cache: {exc}")
+        try:
+            return PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return DILL, dill.dumps(value, recurse=True)
+
+    @staticmethod
+    def _deserialize(serializer: int, payload: bytes) -> Any:
+        if serializer == JSON:
+            return orjson.loads(payload)
+        data_type, message_type, _ = _schema_types()
+        if serializer == DATA:
+            return data_type(**orjson.loads(payload))
+        if serializer == MESSAGE:
+            return message_type.model_validate_json(payload)
+        if serializer == DATAFRAME:
+            return _decode_dataframe(payload)
+        if serializer == PICKLE:
+            return pickle.loads(payload)
+        if serializer == DILL:
+            return dill.loads(payload)
+        msg = f"Unknown cache serializer: {serializer}"
+        raise ValueError(msg)
@@ -8,6 +8,7 @@ from loguru import logger
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
 from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.telemetry.runtime_metrics import get_runtime_counters
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
@@ -26,9 +27,11 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
     async def get(self, key, lock: asyncio.Lock | None = None):
         if not lock:
             async with self.lock:
-                return await asyncio.to_thread(self._get, key)
+                value = await asyncio.to_thread(self._get, key)
         else:
-            return await asyncio.to_thread(self._get, key)
+            value = await asyncio.to_thread(self._get, key)
+        get_runtime_counters().record_cache_lookup("service", hit=value is not CACHE_MISS)
+        return value
 
     def _get(self, key):
         item = self.cache.get(key, default=None)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from typing_extensions import override
 
 from langflow.logging.logger import logger
+from langflow.services.cache.codec import CacheCodec
 from langflow.services.cache.disk import AsyncDiskCache
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
 from langflow.services.factory import ServiceFactory
@@ -30,6 +31,10 @@ class CacheServiceFactory(ServiceFactory):
                 db=settings_service.settings.redis_db,
                 url=settings_service.settings.redis_url,
                 expiration_time=settings_service.settings.redis_cache_expire,
+                codec=CacheCodec(
+                    compression=settings_service.settings.redis_cache_compression,
+                    compression_threshold=settings_service.settings.redis_cache_compression_threshold,
+                ),
             )
 
         if settings_service.settings.cache_type == "memory":
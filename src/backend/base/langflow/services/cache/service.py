@@ -5,7 +5,6 @@ import time
 from collections import OrderedDict
 from typing import Generic, Union
 
-import dill
 from loguru import logger
 from typing_extensions import override
 
@@ -16,7 +15,9 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.codec import CacheCodec
 from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.telemetry.runtime_metrics import get_runtime_counters
 
 
 class ThreadingInMemoryCache(CacheService, Generic[LockType]):
@@ -66,7 +67,9 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
             The value associated with the key, or CACHE_MISS if the key is not found or the item has expired.
         """
         with lock or self._lock:
-            return self._get_without_lock(key)
+            value = self._get_without_lock(key)
+        get_runtime_counters().record_cache_lookup("service", hit=value is not CACHE_MISS)
+        return value
 
     def _get_without_lock(self, key):
         """Retrieve an item from the cache without acquiring the lock."""
@@ -178,7 +181,10 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):
 class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
     """A Redis-based cache implementation.
 
-    This cache supports setting an expiration time for cached items.
+    This cache supports setting an expiration time for cached items. Values are encoded by a `CacheCodec` and
+    stored in Redis hashes, so `get` reads any value with one HGETALL. Dictionaries with string keys get one
+    encoded value per field, so `upsert` updates their fields on the server without reading them. Other values
+    are stored whole in the `VALUE_FIELD` field, which no string key can be.
 
     Attributes:
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
@@ -196,7 +202,18 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60) -> None:
+    VALUE_FIELD = b"\xff"
+    """The field of values stored whole. It isn't valid UTF-8, so it can't be the key of a dictionary."""
+
+    def __init__(
+        self,
+        host="localhost",
+        port=6379,
+        db=0,
+        url=None,
+        expiration_time=60 * 60,
+        codec: CacheCodec | None = None,
+    ) -> None:
         """Initialize a new RedisCache instance.
 
         Args:
@@ -206,6 +223,8 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             url (str, optional): Redis URL.
             expiration_time (int, optional): Time in seconds after which a
                 cached item expires. Default is 1 hour.
+            codec (CacheCodec, optional): The codec of the cached values.
+                Default is a codec without compression.
         """
         try:
             from redis.asyncio import StrictRedis
@@ -224,6 +243,7 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         else:
             self._client = StrictRedis(host=host, port=port, db=db)
         self.expiration_time = expiration_time
+        self.codec = codec or CacheCodec()
 
     async def is_connected(self) -> bool:
         """Check if the Redis client is connected."""
@@ -237,30 +257,57 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             return False
         return True
 
+    @staticmethod
+    def _is_hash(value) -> bool:
+        """Returns True if the value is stored as a Redis hash."""
+        return type(value) is dict and bool(value) and all(isinstance(field, str) for field in value)
+
+    def _encode_fields(self, value) -> dict[str | bytes, bytes]:
+        """Returns the fields of the hash the value is stored in."""
+        if self._is_hash(value):
+            return {field: self.codec.encode(item) for field, item in value.items()}
+        return {self.VALUE_FIELD: self.codec.encode(value)}
+
     @override
     async def get(self, key, lock=None):
         if key is None:
             return CACHE_MISS
-        value = await self._client.get(str(key))
-        return dill.loads(value) if value else CACHE_MISS
+        from redis.exceptions import ResponseError
+
+        try:
+            fields = await self._client.hgetall(str(key))
+        except ResponseError as exc:
+            # The key holds a string, like a value cached before every value was stored in a hash
+            if "WRONGTYPE" not in str(exc):
+                raise
+            value = await self._client.get(str(key))
+            fields = {self.VALUE_FIELD: value} if value else {}
+        get_runtime_counters().record_cache_lookup("service", hit=bool(fields))
+        if not fields:
+            return CACHE_MISS
+        if self.VALUE_FIELD in fields:
+            return self.codec.decode(fields[self.VALUE_FIELD])
+        return {field.decode(): self.codec.decode(item) for field, item in fields.items()}
 
     @override
     async def set(self, key, value, lock=None) -> None:
         try:
-            if pickled := dill.dumps(value, recurse=True):
-                result = await self._client.setex(str(key), self.expiration_time, pickled)
-                if not result:
-                    msg = "RedisCache could not set the value."
-                    raise ValueError(msg)
+            fields = self._encode_fields(value)
         except pickle.PicklingError as exc:
             msg = "RedisCache only accepts values that can be pickled. "
             raise TypeError(msg) from exc
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(str(key))
+            pipe.hset(str(key), mapping=fields)
+            pipe.expire(str(key), self.expiration_time)
+            await pipe.execute()
 
     @override
     async def upsert(self, key, value, lock=None) -> None:
         """Inserts or updates a value in the cache.
 
-        If the existing value and the new value are both dictionaries, they are merged.
+        If the existing value and the new value are both dictionaries, they are merged. Dictionaries with string
+        keys are merged on the server, in one atomic transaction.
 
         Args:
             key: The key of the item.
@@ -269,6 +316,28 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         """
         if key is None:
             return
+        if self._is_hash(value):
+            from redis.exceptions import ResponseError
+
+            try:
+                async with self._client.pipeline(transaction=True) as pipe:
+                    pipe.hget(str(key), self.VALUE_FIELD)
+                    pipe.hset(str(key), mapping=self._encode_fields(value))
+                    pipe.hdel(str(key), self.VALUE_FIELD)
+                    pipe.expire(str(key), self.expiration_time)
+                    replaced, *_ = await pipe.execute()
+            except ResponseError as exc:
+                # The key holds a string, like a value cached before every value was stored in a hash
+                if "WRONGTYPE" not in str(exc):
+                    raise
+            else:
+                if replaced is None:
+                    return
+                # The key held a value stored whole, which is merged too if it is a dictionary with other keys
+                replaced = self.codec.decode(replaced)
+                if isinstance(replaced, dict):
+                    await self.set(key, {**replaced, **value})
+                return
         existing_value = await self.get(key)
         if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
             existing_value.update(value)
@@ -306,7 +375,9 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
 
     async def get(self, key, lock: asyncio.Lock | None = None):
         async with lock or self.lock:
-            return await self._get(key)
+            value = await self._get(key)
+        get_runtime_counters().record_cache_lookup("service", hit=value is not CACHE_MISS)
+        return value
 
     async def _get(self, key):
         item = self.cache.get(key, None)
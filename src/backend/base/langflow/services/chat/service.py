@@ -6,6 +6,7 @@ from typing import Any
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
 from langflow.services.deps import get_cache_service
+from langflow.services.telemetry.runtime_metrics import cache_layer
 
 
 class ChatService(Service):
@@ -51,9 +52,11 @@ class ChatService(Service):
         Returns:
             Any: The cached data.
         """
-        if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
-        return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
+        # The cache service counts the lookup, under the chat layer
+        with cache_layer("chat"):
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+            return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
         """Clear the cache for a client.
@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from langflow.memory import invalidate_message_history
 from langflow.services.database.models.message.model import MessageTable, MessageUpdate
 from langflow.services.deps import session_scope
 from langflow.utils.async_helpers import run_until_complete
@@ -18,7 +19,8 @@ async def _update_message(message_id: UUID | str, message: MessageUpdate | dict)
         session.add(db_message)
         await session.commit()
         await session.refresh(db_message)
-        return db_message
+    invalidate_message_history(db_message.session_id)
+    return db_message
 
 
 def update_message(message_id: UUID | str, message: MessageUpdate | dict):
@@ -1,10 +1,12 @@
 import json
+import threading
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Annotated
 from uuid import UUID, uuid4
 
 from pydantic import field_serializer, field_validator
-from sqlalchemy import Text
+from sqlalchemy import BigInteger, Index, Text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from langflow.schema.content_block import ContentBlock
@@ -14,6 +16,22 @@ from langflow.schema.validators import str_to_timestamp_validator
 if TYPE_CHECKING:
     from langflow.schema.message import Message
 
+_sequence_lock = threading.Lock()
+_last_sequence = 0
+
+
+def next_message_sequence() -> int:
+    """Return the insertion sequence of a new message.
+
+    Timestamps only have a one-second resolution, so messages stored in the same second are ordered by this
+    number: the current time in nanoseconds, raised when needed so each message gets a greater one than the
+    message created before it.
+    """
+    global _last_sequence  # noqa: PLW0603
+    with _sequence_lock:
+        _last_sequence = max(time.time_ns(), _last_sequence + 1)
+        return _last_sequence
+
 
 class MessageBase(SQLModel):
     timestamp: Annotated[datetime, str_to_timestamp_validator] = Field(
@@ -111,7 +129,14 @@ class MessageBase(SQLModel):
 
 class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
     __tablename__ = "message"
+    __table_args__ = (
+        Index("ix_message_session_id_timestamp_sequence", "session_id", "timestamp", "sequence"),
+        Index("ix_message_flow_id_timestamp", "flow_id", "timestamp"),
+    )
     id: UUID = Field(default_factory=uuid4, primary_key=True)
+    sequence: int = Field(
+        default_factory=next_message_sequence, sa_column=Column(BigInteger, nullable=False, server_default="0")
+    )
     flow_id: UUID | None = Field(default=None)
     files: list[str] = Field(sa_column=Column(JSON))
     properties: Properties = Field(default_factory=lambda: Properties().model_dump(), sa_column=Column(JSON))  # type: ignore[assignment]
@@ -178,6 +203,7 @@ class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
 
 class MessageRead(MessageBase):
     id: UUID
+    sequence: int = 0
     flow_id: UUID | None = Field()
 
 
@@ -29,6 +29,7 @@ from langflow.services.database import models
 from langflow.services.database.models.user.crud import get_user_by_username
 from langflow.services.database.utils import Result, TableResults
 from langflow.services.deps import get_settings_service
+from langflow.services.telemetry.event_loop_watchdog import require_main_loop
 from langflow.services.utils import teardown_superuser
 
 if TYPE_CHECKING:
@@ -182,6 +183,8 @@ class DatabaseService(Service):
 
     @asynccontextmanager
     async def with_session(self):
+        # The engine's connections belong to the main event loop
+        require_main_loop("The database")
         async with AsyncSession(self.engine, expire_on_commit=False) as session:
             # Start of Selection
             try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from typing import NamedTuple
 
 from loguru import logger
 
@@ -8,6 +9,15 @@ from langflow.events.event_manager import EventManager, create_default_event_man
 from langflow.services.base import Service
 
 
+class JobQueueStats(NamedTuple):
+    jobs: int
+    """Jobs that have an event queue."""
+    active_builds: int
+    """Jobs whose build task is still running."""
+    queued_events: int
+    """Events waiting in the job queues to be sent to clients."""
+
+
 class JobQueueNotFoundError(Exception):
     """Exception raised when a job queue is not found."""
 
@@ -209,6 +219,15 @@ class JobQueueService(Service):
         except KeyError as exc:
             raise JobQueueNotFoundError(job_id) from exc
 
+    def get_stats(self) -> JobQueueStats:
+        """Return the number of jobs, running builds and queued events, for the runtime metrics."""
+        queues = list(self._queues.values())
+        return JobQueueStats(
+            jobs=len(queues),
+            active_builds=sum(1 for _, _, task, _ in queues if task is not None and not task.done()),
+            queued_events=sum(queue.qsize() for queue, _, _, _ in queues),
+        )
+
     async def cleanup_job(self, job_id: str) -> None:
         """Clean up and release resources for a specific job.
 
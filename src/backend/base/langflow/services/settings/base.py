@@ -120,12 +120,25 @@ class Settings(BaseSettings):
     - pool_recycle: Seconds before connections are recycled (prevents timeouts)
     - echo: Enable SQL query logging (development only)
     """
+    message_write_batch_window: float = 0.005
+    """Seconds to wait for more chat messages before inserting them together in one transaction.
+    Set to 0 to insert every message in its own transaction as soon as it is stored."""
+    message_write_batch_size: int = 100
+    """The maximum number of chat messages inserted in one transaction."""
+    message_history_cache_size: int = 100
+    """The number of latest messages kept in memory for each session whose history was read recently, so that
+    chat memory reads don't query the database. Set to 0 to disable the message history cache."""
+    message_history_cache_max_bytes: int = 32 * 1024 * 1024
+    """The maximum size, in bytes of serialized messages, of the message history cache."""
 
     # cache configuration
     cache_type: Literal["async", "redis", "memory", "disk"] = "async"
     """The cache type can be 'async' or 'redis'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    incremental_builds: bool = False
+    """If set to True, a playground build reuses the results of the previous build of the flow for the components
+    that did not change, and whose upstream components did not change either."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
@@ -133,6 +146,29 @@ class Settings(BaseSettings):
     """If set to True, Langflow will expose Prometheus metrics."""
     prometheus_port: int = 9090
     """The port on which Langflow will expose Prometheus metrics. 9090 is the default port."""
+    runtime_metrics_enabled: bool = False
+    """If set to True, Langflow will serve runtime metrics of the engine on `/metrics` in the Prometheus format."""
+    event_loop_lag_interval: float = 0.5
+    """Interval, in seconds, at which the event loop lag is measured while runtime metrics are enabled."""
+    event_loop_watchdog_enabled: bool = False
+    """If set to True, calls that block the event loop are logged with their stack and the component being built."""
+    event_loop_stall_threshold: float = 1.0
+    """Seconds the event loop may miss its heartbeat before the watchdog reports a stall."""
+    sync_output_execution: Literal["inline", "thread", "process"] = "thread"
+    """Where synchronous component output methods run, unless the component chooses: on the event loop ("inline"),
+    in a thread ("thread") or in a pool of worker processes ("process")."""
+    output_process_pool_size: int | None = None
+    """Number of worker processes for outputs that run in a process. Defaults to the number of CPUs."""
+    dataframe_storage: Literal["pandas", "arrow"] = "pandas"
+    """How the DataFrame outputs of components store their columns: as pandas arrays ("pandas") or as Apache Arrow
+    arrays ("arrow"), which share their buffers when frames are sliced or projected. "arrow" requires pyarrow."""
+    dataframe_spill_threshold: int | None = None
+    """Size in bytes above which Arrow-backed DataFrame outputs are written to an Arrow IPC file in the config
+    directory and memory-mapped. If not set, they stay in memory."""
+    offload_stalling_components: bool = False
+    """Debug mode. If set to True, the async outputs of component types that stalled the event loop run on their own
+    event loop in a worker thread from then on. Requires the event loop watchdog. Component types that use the
+    database, store messages or use MCP sessions stay on the main event loop."""
 
     remove_api_keys: bool = False
     components_path: list[str] = []
@@ -146,6 +182,10 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: str | None = None
     redis_cache_expire: int = 3600
+    redis_cache_compression: Literal["none", "zstd", "lz4"] = "none"
+    """The compression of values cached in Redis. zstd and lz4 require the zstandard and lz4 packages."""
+    redis_cache_compression_threshold: int = 16 * 1024
+    """The size in bytes above which values cached in Redis are compressed."""
 
     # Sentry
     sentry_dsn: str | None = None
@@ -214,6 +254,15 @@ class Settings(BaseSettings):
     """The maximum file size for the upload in MB."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    tracing_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+    """The fraction of graph runs that are sent to the tracers. 1.0 traces every run."""
+    tracing_queue_size: int = 1000
+    """The maximum number of pending trace events per run. New component traces are dropped when it is full."""
+    run_state_ttl: int = 3600
+    """Seconds after which the state of a run that did not end, like a run whose client went away, is released if the
+    run does not use it."""
+    profile_vertex_builds: bool = True
+    """If set to False, the time spent in each phase of a component build is not measured."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
@@ -1,5 +1,8 @@
+import time
+import zlib
 from collections import defaultdict
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from threading import Lock
 
 from loguru import logger
@@ -7,6 +10,8 @@ from loguru import logger
 from langflow.services.base import Service
 from langflow.services.settings.service import SettingsService
 
+LOCK_SHARDS = 64
+
 
 class StateService(Service):
     name = "state_service"
@@ -20,64 +25,140 @@ class StateService(Service):
     def get_state(self, key, run_id: str):
         raise NotImplementedError
 
-    def subscribe(self, key, observer: Callable) -> None:
+    def subscribe(self, key, observer: Callable, run_id: str) -> None:
+        raise NotImplementedError
+
+    def unsubscribe(self, key, observer: Callable, run_id: str) -> None:
         raise NotImplementedError
 
-    def unsubscribe(self, key, observer: Callable) -> None:
+    def notify_observers(self, key, new_state, run_id: str) -> None:
         raise NotImplementedError
 
-    def notify_observers(self, key, new_state) -> None:
+    def release_run(self, run_id: str) -> None:
         raise NotImplementedError
 
 
+@dataclass
+class RunState:
+    """The states of a run and the observers of their keys."""
+
+    states: dict = field(default_factory=dict)
+    observers: dict[str, list[Callable]] = field(default_factory=lambda: defaultdict(list))
+    last_used: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _Shard:
+    lock: Lock = field(default_factory=Lock)
+    runs: dict[str, RunState] = field(default_factory=dict)
+    next_sweep: float = 0.0
+
+
 class InMemoryStateService(StateService):
+    """Keeps the state of each run in memory until the run ends.
+
+    Runs are spread over shards by their ID, and each shard has its own lock, so concurrent runs rarely wait for each
+    other. The state of a run is released by `release_run` when the run ends, or once it has not been used for
+    `run_state_ttl` seconds, for runs that never end.
+    """
+
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
-        self.states: dict[str, dict] = {}
-        self.observers: dict[str, list[Callable]] = defaultdict(list)
-        self.lock = Lock()
+        self._shards = [_Shard() for _ in range(LOCK_SHARDS)]
+
+    @property
+    def ttl(self) -> float:
+        return self.settings_service.settings.run_state_ttl
+
+    def _shard(self, run_id: str) -> _Shard:
+        # crc32 rather than hash, which is randomized per process for strings
+        return self._shards[zlib.crc32(str(run_id).encode()) % LOCK_SHARDS]
+
+    def _run_state(self, shard: _Shard, run_id: str) -> RunState:
+        """Returns the state of the run, creating it if needed. Must be called with the shard's lock held."""
+        now = time.monotonic()
+        run_state = shard.runs.get(run_id)
+        if run_state is None:
+            if now >= shard.next_sweep:
+                self._sweep(shard, now)
+            run_state = shard.runs[run_id] = RunState()
+        run_state.last_used = now
+        return run_state
+
+    def _sweep(self, shard: _Shard, now: float) -> None:
+        expired = [run_id for run_id, run_state in shard.runs.items() if now - run_state.last_used > self.ttl]
+        for run_id in expired:
+            del shard.runs[run_id]
+        if expired:
+            logger.debug(f"Released the state of {len(expired)} runs unused for {self.ttl} seconds")
+        shard.next_sweep = now + self.ttl
+
+    @property
+    def run_count(self) -> int:
+        """The number of runs that hold state."""
+        return sum(len(shard.runs) for shard in self._shards)
 
     def append_state(self, key, new_state, run_id: str) -> None:
-        with self.lock:
-            if run_id not in self.states:
-                self.states[run_id] = {}
-            if key not in self.states[run_id]:
-                self.states[run_id][key] = []
-            elif not isinstance(self.states[run_id][key], list):
-                self.states[run_id][key] = [self.states[run_id][key]]
-            self.states[run_id][key].append(new_state)
-            self.notify_append_observers(key, new_state)
+        shard = self._shard(run_id)
+        with shard.lock:
+            run_state = self._run_state(shard, run_id)
+            if key not in run_state.states:
+                run_state.states[key] = []
+            elif not isinstance(run_state.states[key], list):
+                run_state.states[key] = [run_state.states[key]]
+            run_state.states[key].append(new_state)
+            observers = list(run_state.observers.get(key, ()))
+        # Observers are called without the lock, so they can read the state
+        self._notify(observers, key, new_state, append=True)
 
     def update_state(self, key, new_state, run_id: str) -> None:
-        with self.lock:
-            if run_id not in self.states:
-                self.states[run_id] = {}
-            self.states[run_id][key] = new_state
-            self.notify_observers(key, new_state)
+        shard = self._shard(run_id)
+        with shard.lock:
+            run_state = self._run_state(shard, run_id)
+            run_state.states[key] = new_state
+            observers = list(run_state.observers.get(key, ()))
+        self._notify(observers, key, new_state, append=False)
 
     def get_state(self, key, run_id: str):
-        with self.lock:
-            return self.states.get(run_id, {}).get(key, "")
-
-    def subscribe(self, key, observer: Callable) -> None:
-        with self.lock:
-            if observer not in self.observers[key]:
-                self.observers[key].append(observer)
-
-    def notify_observers(self, key, new_state) -> None:
-        for callback in self.observers[key]:
-            callback(key, new_state, append=False)
-
-    def notify_append_observers(self, key, new_state) -> None:
-        for callback in self.observers[key]:
+        shard = self._shard(run_id)
+        with shard.lock:
+            run_state = shard.runs.get(run_id)
+            if run_state is None:
+                return ""
+            run_state.last_used = time.monotonic()
+            return run_state.states.get(key, "")
+
+    def subscribe(self, key, observer: Callable, run_id: str) -> None:
+        shard = self._shard(run_id)
+        with shard.lock:
+            observers = self._run_state(shard, run_id).observers[key]
+            if observer not in observers:
+                observers.append(observer)
+
+    def unsubscribe(self, key, observer: Callable, run_id: str) -> None:
+        shard = self._shard(run_id)
+        with shard.lock:
+            run_state = shard.runs.get(run_id)
+            if run_state is not None and observer in run_state.observers.get(key, ()):
+                run_state.observers[key].remove(observer)
+
+    def notify_observers(self, key, new_state, run_id: str) -> None:
+        shard = self._shard(run_id)
+        with shard.lock:
+            run_state = shard.runs.get(run_id)
+            observers = list(run_state.observers.get(key, ())) if run_state is not None else []
+        self._notify(observers, key, new_state, append=False)
+
+    @staticmethod
+    def _notify(observers: list[Callable], key, new_state, *, append: bool) -> None:
+        for callback in observers:
             try:
-                callback(key, new_state, append=True)
+                callback(key, new_state, append=append)
             except Exception:  # noqa: BLE001
                 logger.exception(f"Error in observer {callback} for key {key}")
-                logger.warning("Callbacks not implemented yet")
 
-    def unsubscribe(self, key, observer: Callable) -> None:
-        with self.lock:
-            if observer in self.observers[key]:
-                # Use list.remove() since observers[key] is a list
-                self.observers[key].remove(observer)
+    def release_run(self, run_id: str) -> None:
+        """Releases the states and observers of a run."""
+        shard = self._shard(run_id)
+        with shard.lock:
+            shard.runs.pop(run_id, None)
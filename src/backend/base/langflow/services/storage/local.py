@@ -1,8 +1,10 @@
+from collections.abc import AsyncIterable, AsyncIterator
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
 
 
 class LocalStorageService(StorageService):
@@ -42,6 +44,80 @@ class LocalStorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
             raise
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file in the local storage one chunk at a time.
+
+        The chunks are written to a temporary file next to the target, which replaces the target once the
+        stream is complete, so readers never see a partially written file.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file, in chunks.
+
+        Returns:
+            The size of the saved file in bytes.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = folder_path / f".{file_name}.part"
+
+        size = 0
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    size += len(chunk)
+            await partial_path.replace(file_path)
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            await partial_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return size
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Return an iterator over the bytes of a file in the local storage, read one chunk at a time.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be read.
+            start: The offset of the first byte to read.
+            end: The offset after the last byte to read, or None to read up to the end of the file.
+            chunk_size: The maximum size of the chunks.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        async def stream() -> AsyncIterator[bytes]:
+            async with async_open(str(file_path), "rb") as f:
+                f.seek(start)
+                remaining = end - start if end is not None else None
+                while remaining is None or remaining > 0:
+                    chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                    if not chunk:
+                        break
+                    if remaining is not None:
+                        remaining -= len(chunk)
+                    yield chunk
+
+        return stream()
+
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
 
@@ -1,8 +1,14 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
+
+# S3 requires every part of a multipart upload but the last one to be at least 5 MiB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
 
 
 class S3StorageService(StorageService):
@@ -15,11 +21,11 @@ class S3StorageService(StorageService):
         self.s3_client = boto3.client("s3")
         self.set_ready()
 
-    async def save_file(self, folder: str, file_name: str, data) -> None:
+    async def save_file(self, flow_id: str, file_name: str, data) -> None:
         """Save a file to the S3 bucket.
 
         Args:
-            folder: The folder in the bucket to save the file.
+            flow_id: The identifier of the flow, whose folder in the bucket the file is saved in.
             file_name: The name of the file to be saved.
             data: The byte content of the file.
 
@@ -27,20 +33,131 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file saving.
         """
         try:
-            self.s3_client.put_object(Bucket=self.bucket, Key=f"{folder}/{file_name}", Body=data)
-            logger.info(f"File {file_name} saved successfully in folder {folder}.")
+            self.s3_client.put_object(Bucket=self.bucket, Key=f"{flow_id}/{file_name}", Body=data)
+            logger.info(f"File {file_name} saved successfully in folder {flow_id}.")
         except NoCredentialsError:
             logger.exception("Credentials not available for AWS S3.")
             raise
         except ClientError:
-            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            logger.exception(f"Error saving file {file_name} in folder {flow_id}")
             raise
 
-    async def get_file(self, folder: str, file_name: str):
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file to the S3 bucket with a multipart upload, one part at a time.
+
+        Files smaller than a part are uploaded with a single request. A failed multipart upload is aborted so
+        that S3 doesn't keep its parts.
+
+        Args:
+            flow_id: The identifier of the flow, whose folder in the bucket the file is saved in.
+            file_name: The name of the file to be saved.
+            chunks: The byte content of the file, in chunks.
+
+        Returns:
+            The size of the saved file in bytes.
+        """
+        key = f"{flow_id}/{file_name}"
+        buffer = bytearray()
+        upload_id = None
+        parts: list[dict] = []
+        size = 0
+
+        async def upload_part(body: bytes) -> None:
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                while len(buffer) >= MULTIPART_PART_SIZE:
+                    if upload_id is None:
+                        response = await asyncio.to_thread(
+                            self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key
+                        )
+                        upload_id = response["UploadId"]
+                    await upload_part(bytes(buffer[:MULTIPART_PART_SIZE]))
+                    del buffer[:MULTIPART_PART_SIZE]
+
+            if upload_id is None:
+                await asyncio.to_thread(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+            else:
+                if buffer:
+                    await upload_part(bytes(buffer))
+                await asyncio.to_thread(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in folder {flow_id}")
+            if upload_id is not None:
+                await asyncio.to_thread(
+                    self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+                )
+            raise
+        logger.info(f"File {file_name} saved successfully in folder {flow_id}.")
+        return size
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Return an iterator over the bytes of a file in the S3 bucket.
+
+        Only the requested byte range is fetched, with a ranged GET, and the response body is read one chunk
+        at a time.
+
+        Args:
+            flow_id: The identifier of the flow, whose folder in the bucket holds the file.
+            file_name: The name of the file to be read.
+            start: The offset of the first byte to read.
+            end: The offset after the last byte to read, or None to read up to the end of the file.
+            chunk_size: The maximum size of the chunks.
+        """
+        body = None
+        if end is None or end > start:
+            request = {"Bucket": self.bucket, "Key": f"{flow_id}/{file_name}"}
+            if start or end is not None:
+                request["Range"] = f"bytes={start}-{end - 1 if end is not None else ''}"
+            try:
+                response = await asyncio.to_thread(self.s3_client.get_object, **request)
+            except ClientError:
+                logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
+                raise
+            body = response["Body"]
+
+        async def stream() -> AsyncIterator[bytes]:
+            if body is None:
+                return
+            try:
+                while chunk := await asyncio.to_thread(body.read, chunk_size):
+                    yield chunk
+            finally:
+                body.close()
+
+        return stream()
+
+    async def get_file(self, flow_id: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
         Args:
-            folder: The folder in the bucket where the file is stored.
+            flow_id: The identifier of the flow, whose folder in the bucket holds the file.
             file_name: The name of the file to be retrieved.
 
         Returns:
@@ -50,18 +167,18 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file retrieval.
         """
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            logger.info(f"File {file_name} retrieved successfully from folder {folder}.")
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=f"{flow_id}/{file_name}")
+            logger.info(f"File {file_name} retrieved successfully from folder {flow_id}.")
             return response["Body"].read()
         except ClientError:
-            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
             raise
 
-    async def list_files(self, folder: str):
+    async def list_files(self, flow_id: str):
         """List all files in a specified folder of the S3 bucket.
 
         Args:
-            folder: The folder in the bucket to list files from.
+            flow_id: The identifier of the flow, whose folder in the bucket is listed.
 
         Returns:
             A list of file names.
@@ -70,30 +187,30 @@ class S3StorageService(StorageService):
             Exception: If an error occurs during file listing.
         """
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=folder)
+            response = self.s3_client.list_objects_v2(Bucket=self.bucket, Prefix=flow_id)
         except ClientError:
-            logger.exception(f"Error listing files in folder {folder}")
+            logger.exception(f"Error listing files in folder {flow_id}")
             raise
 
-        files = [item["Key"] for item in response.get("Contents", []) if "/" not in item["Key"][len(folder) :]]
-        logger.info(f"{len(files)} files listed in folder {folder}.")
+        files = [item["Key"] for item in response.get("Contents", []) if "/" not in item["Key"][len(flow_id) :]]
+        logger.info(f"{len(files)} files listed in folder {flow_id}.")
         return files
 
-    async def delete_file(self, folder: str, file_name: str) -> None:
+    async def delete_file(self, flow_id: str, file_name: str) -> None:
         """Delete a file from the S3 bucket.
 
         Args:
-            folder: The folder in the bucket where the file is stored.
+            flow_id: The identifier of the flow, whose folder in the bucket holds the file.
             file_name: The name of the file to be deleted.
 
         Raises:
             Exception: If an error occurs during file deletion.
         """
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=f"{folder}/{file_name}")
-            logger.info(f"File {file_name} deleted successfully from folder {folder}.")
+            self.s3_client.delete_object(Bucket=self.bucket, Key=f"{flow_id}/{file_name}")
+            logger.info(f"File {file_name} deleted successfully from folder {flow_id}.")
         except ClientError:
-            logger.exception(f"Error deleting file {file_name} from folder {folder}")
+            logger.exception(f"Error deleting file {file_name} from folder {flow_id}")
             raise
 
     async def teardown(self) -> None:
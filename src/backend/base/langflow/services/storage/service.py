@@ -8,10 +8,15 @@ import anyio
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 class StorageService(Service):
     name = "storage_service"
 
@@ -35,6 +40,37 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def save_file_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file written as a stream of chunks and return its size in bytes.
+
+        Storages that can't write a file incrementally collect the chunks and call `save_file`.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data)
+        return len(data)
+
+    async def get_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Return an iterator over the bytes of a file, from `start` up to (not including) `end`.
+
+        Missing files raise when the stream is requested, not while it is iterated. Storages that can't read
+        a file incrementally read it with `get_file` and slice it.
+        """
+        data = memoryview(await self.get_file(flow_id, file_name))[start:end]
+
+        async def stream() -> AsyncIterator[bytes]:
+            for offset in range(0, len(data), chunk_size):
+                yield bytes(data[offset : offset + chunk_size])
+
+        return stream()
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from loguru import logger
 from sqlmodel import col, delete, select
 
+from langflow.memory import invalidate_message_history
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.transactions.model import TransactionTable
 from langflow.services.database.models.vertex_builds.model import VertexBuildTable
@@ -45,6 +46,9 @@ async def cleanup_orphaned_records() -> None:
 
                     # Delete all orphaned records in a single query
                     await session.exec(delete(table).where(col(table.flow_id).in_(orphaned_flow_ids)))
+                    if table is MessageTable:
+                        for flow_id in orphaned_flow_ids:
+                            invalidate_message_history(flow_id=flow_id)
 
                     # Clean up any associated storage files
                     storage_service: StorageService = get_storage_service()
@@ -0,0 +1,165 @@
+"""Detection of calls that block the event loop, attributed to the component being built.
+
+The watchdog runs in its own thread and follows the heartbeat of the `EventLoopLagMonitor`. When the loop
+misses a heartbeat by more than the threshold, the loop is stuck in a synchronous call: the watchdog captures
+the stack of the loop thread and looks up the vertex that the current task is building. The stall is logged
+with that stack and counted per component type in the runtime metrics.
+
+With `offload` set, the component types seen stalling the loop are remembered and the async outputs of their
+later builds run on an event loop of their own, in a worker thread. The database engine, the message write batcher
+and the MCP session pool are bound to the main loop, so component types seen using them are never offloaded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from langflow.services.telemetry.runtime_metrics import (
+    EventLoopLagMonitor,
+    get_event_loop_lag_monitor,
+    get_runtime_counters,
+)
+from langflow.utils.async_helpers import MainLoopRequiredError, in_worker_loop
+
+UNKNOWN_COMPONENT = "unknown"
+MAX_STACK_FRAMES = 30
+
+
+@dataclass
+class EventLoopStall:
+    duration: float
+    """Seconds since the last heartbeat when the stall was detected. The stall may go on for longer."""
+    component: str
+    vertex_id: str | None
+    stack: list[str] = field(default_factory=list)
+
+
+class EventLoopWatchdog:
+    """Watches the heartbeat of the event loop from a thread and reports what blocks it."""
+
+    def __init__(self, monitor: EventLoopLagMonitor, threshold: float = 1.0, *, offload: bool = False):
+        self.monitor = monitor
+        self.threshold = threshold
+        self.offload = offload
+        self.offloaded_components: set[str] = set()
+        self.main_loop_components: set[str] = set()
+        """Component types that use services bound to the main event loop, which are never offloaded."""
+        self._reported_beat: float | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start watching. The lag monitor must be running for the watchdog to see heartbeats."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="langflow-event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        await asyncio.to_thread(self._thread.join)
+        self._thread = None
+
+    def _watch(self) -> None:
+        # Poll often enough to catch a stall shortly after it crosses the threshold
+        while not self._stop.wait(min(self.threshold, self.monitor.interval) / 2):
+            try:
+                self.check()
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Error checking the event loop heartbeat")
+
+    def check(self, now: float | None = None) -> EventLoopStall | None:
+        """Report a stall if the loop has missed its heartbeat by more than the threshold.
+
+        A stall is reported once, however long it lasts.
+        """
+        last_beat = self.monitor.last_beat
+        if last_beat is None or last_beat == self._reported_beat:
+            return None
+        duration = (time.monotonic() if now is None else now) - last_beat
+        if duration <= self.monitor.interval + self.threshold:
+            return None
+        self._reported_beat = last_beat
+        stall = self._capture(duration)
+        self._report(stall)
+        return stall
+
+    def _capture(self, duration: float) -> EventLoopStall:
+        from langflow.graph.vertex.profiling import get_building_vertex
+
+        loop = self.monitor.loop
+        vertex = get_building_vertex(asyncio.current_task(loop)) if loop is not None else None
+        frame = sys._current_frames().get(self.monitor.loop_thread_id)
+        stack = traceback.format_stack(frame, limit=MAX_STACK_FRAMES) if frame is not None else []
+        return EventLoopStall(
+            duration=duration,
+            component=vertex.vertex_type if vertex is not None else UNKNOWN_COMPONENT,
+            vertex_id=vertex.id if vertex is not None else None,
+            stack=stack,
+        )
+
+    def _report(self, stall: EventLoopStall) -> None:
+        get_runtime_counters().record_stall(stall.component)
+        building = f" while building {stall.vertex_id} ({stall.component})" if stall.vertex_id else ""
+        logger.warning(
+            f"Event loop blocked for more than {stall.duration:.2f}s{building}. Blocking call:\n{''.join(stall.stack)}"
+        )
+        if (
+            self.offload
+            and stall.component != UNKNOWN_COMPONENT
+            and stall.component not in self.offloaded_components
+            and stall.component not in self.main_loop_components
+        ):
+            self.offloaded_components.add(stall.component)
+            logger.warning(f"Outputs of {stall.component} components will run in a worker thread")
+
+    def is_offloaded(self, component: str) -> bool:
+        return component in self.offloaded_components and component not in self.main_loop_components
+
+    def keep_on_main_loop(self, component: str) -> None:
+        """Never offload the component type, as it uses services bound to the main event loop."""
+        if component in self.main_loop_components:
+            return
+        self.main_loop_components.add(component)
+        if component in self.offloaded_components:
+            logger.warning(f"Outputs of {component} components will run on the main event loop again")
+
+
+_event_loop_watchdog = EventLoopWatchdog(get_event_loop_lag_monitor())
+
+
+def get_event_loop_watchdog() -> EventLoopWatchdog:
+    return _event_loop_watchdog
+
+
+def require_main_loop(service: str) -> None:
+    """Mark the use of a service bound to the main event loop.
+
+    The component being built is kept on the main loop from then on.
+
+    Args:
+        service: The name of the service, for the error message.
+
+    Raises:
+        MainLoopRequiredError: If called from a worker event loop, where the service can't be used.
+    """
+    if in_worker_loop():
+        msg = f"{service} can't be used from a worker event loop, it is bound to the main one"
+        raise MainLoopRequiredError(msg)
+    if not _event_loop_watchdog.offload:
+        return
+    from langflow.graph.vertex.profiling import get_building_vertex
+
+    vertex = get_building_vertex(asyncio.current_task())
+    if vertex is not None:
+        _event_loop_watchdog.keep_on_main_loop(vertex.vertex_type)
@@ -140,6 +140,34 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="subflow_build_duration",
+            description="Time spent preparing the graph of a sub-flow before running it",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"flow_id": mandatory_label},
+        )
+        self._add_metric(
+            name="subflow_run_duration",
+            description="Time spent running the graph of a sub-flow",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"flow_id": mandatory_label},
+        )
+        self._add_metric(
+            name="message_write_batch_size",
+            description="The number of chat messages inserted in one batched transaction",
+            unit="",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"outcome": mandatory_label},
+        )
+        self._add_metric(
+            name="message_write_flush_duration",
+            description="Time spent writing a batch of chat messages, from its first message being queued",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"outcome": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
@@ -0,0 +1,275 @@
+"""Runtime metrics of this Langflow process, in the Prometheus text format.
+
+The hot paths only bump in-process counters (events sent, cache lookups) or keep the state they already had
+(build jobs, the database pool, vertex profiles). Everything else is read when `/metrics` is scraped. Labels
+are limited to event types, cache layers, pool states and component types, so the number of series stays small.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from prometheus_client import CollectorRegistry, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+from prometheus_client.registry import Collector
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from prometheus_client import Metric
+
+_cache_layer: ContextVar[str | None] = ContextVar("cache_layer", default=None)
+
+EVENT_LOOP_LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds, in seconds, of the event loop lag histogram buckets."""
+
+
+def _cumulative_buckets(bounds: tuple[float, ...], bucket_counts: list[int]) -> list[tuple[str, int]]:
+    buckets = []
+    cumulative = 0
+    for bound, bucket_count in zip([*(str(bound) for bound in bounds), "+Inf"], bucket_counts, strict=True):
+        cumulative += bucket_count
+        buckets.append((bound, cumulative))
+    return buckets
+
+
+class RuntimeCounters:
+    """Counters bumped on the hot paths: events sent to clients, cache lookups and event loop stalls."""
+
+    def __init__(self) -> None:
+        self._events: Counter[str] = Counter()
+        self._cache_lookups: Counter[tuple[str, str]] = Counter()
+        self._stalls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record_event(self, event_type: str) -> None:
+        with self._lock:
+            self._events[event_type] += 1
+
+    def record_cache_lookup(self, cache: str, *, hit: bool) -> None:
+        cache = _cache_layer.get() or cache
+        with self._lock:
+            self._cache_lookups[cache, "hit" if hit else "miss"] += 1
+
+    def record_stall(self, component: str) -> None:
+        with self._lock:
+            self._stalls[component] += 1
+
+    def events(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._events)
+
+    def cache_lookups(self) -> dict[tuple[str, str], int]:
+        with self._lock:
+            return dict(self._cache_lookups)
+
+    def stalls(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stalls)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._cache_lookups.clear()
+            self._stalls.clear()
+
+
+@contextlib.contextmanager
+def cache_layer(cache: str) -> Iterator[None]:
+    """Counts the cache lookups made inside the block under `cache` instead of the layer that makes them.
+
+    A service that looks values up through the cache service uses it to label its lookups, which are then
+    counted once instead of once by each layer.
+    """
+    token = _cache_layer.set(cache)
+    try:
+        yield
+    finally:
+        _cache_layer.reset(token)
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop resumes a task that sleeps for a fixed interval.
+
+    Each wake-up is also a heartbeat: `last_beat` is the `time.monotonic()` of the latest one, so other threads
+    can tell that the loop is blocked before the sleeping task is resumed.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.last_lag = 0.0
+        self.last_beat: float | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.loop_thread_id: int | None = None
+        self._bucket_counts = [0] * (len(EVENT_LOOP_LAG_BUCKETS) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+        try:
+            while True:
+                start = self.last_beat = time.monotonic()
+                await asyncio.sleep(self.interval)
+                self.observe(max(time.monotonic() - start - self.interval, 0.0))
+        finally:
+            self.last_beat = None
+
+    def observe(self, lag: float) -> None:
+        with self._lock:
+            self.last_lag = lag
+            self._bucket_counts[bisect_left(EVENT_LOOP_LAG_BUCKETS, lag)] += 1
+            self._count += 1
+            self._sum += lag
+
+    def histogram(self) -> tuple[list[tuple[str, int]], float]:
+        """Cumulative buckets and sum of the observed lags."""
+        with self._lock:
+            return _cumulative_buckets(EVENT_LOOP_LAG_BUCKETS, self._bucket_counts), self._sum
+
+
+class RuntimeMetricsCollector(Collector):
+    """Reads the state of the engine's services when the metrics are scraped."""
+
+    def collect(self) -> Iterator[Metric]:
+        for collect in (
+            self._collect_build_jobs,
+            self._collect_counters,
+            self._collect_database_pool,
+            self._collect_vertex_builds,
+            self._collect_event_loop_lag,
+        ):
+            try:
+                yield from collect()
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug(f"Error collecting runtime metrics in {collect.__name__}")
+
+    @staticmethod
+    def _collect_build_jobs() -> Iterator[Metric]:
+        from langflow.services.deps import get_queue_service
+
+        stats = get_queue_service().get_stats()
+        yield GaugeMetricFamily("langflow_build_jobs", "Build jobs that have an event queue", value=stats.jobs)
+        yield GaugeMetricFamily(
+            "langflow_build_jobs_active", "Build jobs whose build task is still running", value=stats.active_builds
+        )
+        yield GaugeMetricFamily(
+            "langflow_build_job_queue_depth",
+            "Build events waiting to be sent to clients, over all jobs",
+            value=stats.queued_events,
+        )
+
+    @staticmethod
+    def _collect_counters() -> Iterator[Metric]:
+        counters = get_runtime_counters()
+        events = CounterMetricFamily("langflow_events", "Events sent to clients by event managers", labels=["event"])
+        for event_type, count in sorted(counters.events().items()):
+            events.add_metric([event_type], count)
+        yield events
+        lookups = CounterMetricFamily(
+            "langflow_cache_lookups", "Cache lookups by cache layer and result", labels=["cache", "result"]
+        )
+        for (cache, result), count in sorted(counters.cache_lookups().items()):
+            lookups.add_metric([cache, result], count)
+        yield lookups
+
+    @staticmethod
+    def _collect_database_pool() -> Iterator[Metric]:
+        from langflow.services.deps import get_db_service
+
+        pool = get_db_service().engine.sync_engine.pool
+        # Only queue pools keep these numbers; SQLite's static and null pools have nothing to report
+        if not all(hasattr(pool, attribute) for attribute in ("size", "checkedout", "checkedin", "overflow")):
+            return
+        yield GaugeMetricFamily("langflow_db_pool_size", "Connections the database pool keeps open", value=pool.size())
+        connections = GaugeMetricFamily(
+            "langflow_db_pool_connections", "Database pool connections by state", labels=["state"]
+        )
+        connections.add_metric(["checked_out"], pool.checkedout())
+        connections.add_metric(["idle"], pool.checkedin())
+        connections.add_metric(["overflow"], max(pool.overflow(), 0))
+        yield connections
+
+    @staticmethod
+    def _collect_vertex_builds() -> Iterator[Metric]:
+        from langflow.graph.vertex.profiling import BUILD_PHASE, get_vertex_profile_stats
+
+        builds = HistogramMetricFamily(
+            "langflow_vertex_build_duration_seconds",
+            "Wall time of vertex builds by component type",
+            labels=["component"],
+        )
+        for histogram in get_vertex_profile_stats().histograms():
+            if histogram.phase == BUILD_PHASE:
+                builds.add_metric(
+                    [histogram.component], buckets=list(histogram.buckets.items()), sum_value=histogram.wall_time_sum
+                )
+        yield builds
+
+    @staticmethod
+    def _collect_event_loop_lag() -> Iterator[Metric]:
+        monitor = get_event_loop_lag_monitor()
+        buckets, lag_sum = monitor.histogram()
+        yield GaugeMetricFamily(
+            "langflow_event_loop_lag_seconds", "Latest measured event loop lag", value=monitor.last_lag
+        )
+        lag = HistogramMetricFamily("langflow_event_loop_lag_observed_seconds", "Measured event loop lags")
+        lag.add_metric([], buckets=buckets, sum_value=lag_sum)
+        yield lag
+        stalls = CounterMetricFamily(
+            "langflow_event_loop_stalls",
+            "Event loop stalls detected by the watchdog, by the component type being built",
+            labels=["component"],
+        )
+        for component, count in sorted(get_runtime_counters().stalls().items()):
+            stalls.add_metric([component], count)
+        yield stalls
+
+
+_runtime_counters = RuntimeCounters()
+_event_loop_lag_monitor = EventLoopLagMonitor()
+_registry: CollectorRegistry | None = None
+
+
+def get_runtime_counters() -> RuntimeCounters:
+    return _runtime_counters
+
+
+def get_event_loop_lag_monitor() -> EventLoopLagMonitor:
+    return _event_loop_lag_monitor
+
+
+def generate_runtime_metrics() -> bytes:
+    """The runtime metrics in the Prometheus text exposition format."""
+    global _registry  # noqa: PLW0603
+    if _registry is None:
+        _registry = CollectorRegistry(auto_describe=False)
+        _registry.register(RuntimeMetricsCollector())
+    return generate_latest(_registry)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import os
+import random
 from collections import defaultdict
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -12,6 +13,7 @@ from loguru import logger
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
@@ -53,6 +55,9 @@ def _get_opik_tracer():
     return OpikTracer
 
 
+TRACE_EXPORT_BATCH_SIZE = 100
+"""The maximum number of queued trace events handed to the tracers in one worker thread call."""
+
 trace_context_var: ContextVar[TraceContext | None] = ContextVar("trace_context", default=None)
 component_context_var: ContextVar[ComponentTraceContext | None] = ContextVar("component_trace_context", default=None)
 
@@ -65,6 +70,7 @@ class TraceContext:
         project_name: str | None,
         user_id: str | None,
         session_id: str | None,
+        max_queue_size: int = 0,
     ):
         self.run_id: UUID | None = run_id
         self.run_name: str | None = run_name
@@ -75,9 +81,14 @@ class TraceContext:
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
 
-        self.traces_queue: asyncio.Queue = asyncio.Queue()
+        self.traces_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
         self.running = False
         self.worker_task: asyncio.Task | None = None
+        self.dropped_traces = 0
+
+    @property
+    def ready_tracers(self) -> list[BaseTracer]:
+        return [tracer for tracer in self.tracers.values() if tracer.ready]
 
 
 class ComponentTraceContext:
@@ -99,6 +110,7 @@ class ComponentTraceContext:
         self.outputs: dict[str, dict] = defaultdict(dict)
         self.outputs_metadata: dict[str, dict] = defaultdict(dict)
         self.logs: dict[str, list[Log | dict[Any, Any]]] = defaultdict(list)
+        self.queued = False
 
 
 class TracingService(Service):
@@ -112,6 +124,11 @@ class TracingService(Service):
             - get_langchain_callbacks
         3. end_tracers: end the trace for a graph run
 
+    Component traces are queued per run and handed to the tracers in batches on a worker thread, so
+    exporters that do network I/O never block the event loop. The queue is bounded by `tracing_queue_size`:
+    when it is full, new component traces are dropped (the end of an already queued trace waits for room),
+    and `tracing_sample_rate` controls which runs are traced at all.
+
     check context var in public methods.
     """
 
@@ -121,15 +138,25 @@ class TracingService(Service):
         self.settings_service = settings_service
         self.deactivated = self.settings_service.settings.deactivate_tracing
 
-    async def _trace_worker(self, trace_context: TraceContext) -> None:
-        while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
+    @staticmethod
+    def _process_trace_batch(batch: list[tuple[Callable, tuple]]) -> None:
+        for trace_func, args in batch:
             try:
                 trace_func(*args)
             except Exception:  # noqa: BLE001
                 logger.exception("Error processing trace_func")
+
+    async def _trace_worker(self, trace_context: TraceContext) -> None:
+        queue = trace_context.traces_queue
+        while trace_context.running or not queue.empty():
+            batch = [await queue.get()]
+            while len(batch) < TRACE_EXPORT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._process_trace_batch, batch)
             finally:
-                trace_context.traces_queue.task_done()
+                for _ in batch:
+                    queue.task_done()
 
     async def _start(self, trace_context: TraceContext) -> None:
         if trace_context.running:
@@ -193,6 +220,10 @@ class TracingService(Service):
             session_id=trace_context.session_id,
         )
 
+    def _should_sample(self) -> bool:
+        sample_rate = self.settings_service.settings.tracing_sample_rate
+        return sample_rate >= 1 or random.random() < sample_rate  # noqa: S311
+
     async def start_tracers(
         self,
         run_id: UUID,
@@ -206,13 +237,24 @@ class TracingService(Service):
         - create a trace context
         - start a worker for this trace context
         - initialize the tracers
+
+        Runs left out by `tracing_sample_rate` still get a trace context, but no tracers.
         """
         if self.deactivated:
             return
         try:
             project_name = project_name or os.getenv("LANGCHAIN_PROJECT", "Langflow")
-            trace_context = TraceContext(run_id, run_name, project_name, user_id, session_id)
+            trace_context = TraceContext(
+                run_id,
+                run_name,
+                project_name,
+                user_id,
+                session_id,
+                max_queue_size=self.settings_service.settings.tracing_queue_size,
+            )
             trace_context_var.set(trace_context)
+            if not self._should_sample():
+                return
             await self._start(trace_context)
             self._initialize_langsmith_tracer(trace_context)
             self._initialize_langwatch_tracer(trace_context)
@@ -225,12 +267,20 @@ class TracingService(Service):
     async def _stop(self, trace_context: TraceContext) -> None:
         try:
             trace_context.running = False
-            # check the qeue is empty
-            if not trace_context.traces_queue.empty():
-                await trace_context.traces_queue.join()
+            # An empty queue doesn't mean the traces were exported: the worker may still be running the last batch,
+            # so wait until every trace is done. This returns at once when nothing is pending.
+            await trace_context.traces_queue.join()
             if trace_context.worker_task:
+                # The worker is now idle, waiting for a trace that won't come
                 trace_context.worker_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await trace_context.worker_task
                 trace_context.worker_task = None
+            if trace_context.dropped_traces:
+                logger.warning(
+                    f"Dropped {trace_context.dropped_traces} component traces of run {trace_context.run_id} "
+                    "because the trace queue was full"
+                )
 
         except Exception:  # noqa: BLE001
             logger.exception("Error stopping tracing service")
@@ -253,7 +303,7 @@ class TracingService(Service):
         """End the trace for a graph run.
 
         - stop worker for current trace_context
-        - call end for all the tracers
+        - call end for all the tracers, off the event loop
         """
         if self.deactivated:
             return
@@ -262,15 +312,16 @@ class TracingService(Service):
             msg = "called end_tracers but no trace context found"
             raise RuntimeError(msg)
         await self._stop(trace_context)
-        self._end_all_tracers(trace_context, outputs, error)
+        if trace_context.ready_tracers:
+            await asyncio.to_thread(self._end_all_tracers, trace_context, outputs, error)
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
-        inputs = inputs.copy()
-        for key in inputs:
-            if "api_key" in key:
-                inputs[key] = "*****"  # avoid logging api_keys for security reasons
-        return inputs
+        # avoid logging api_keys for security reasons, and only copy the inputs when there is one to hide
+        secret_keys = [key for key in inputs if "api_key" in key]
+        if not secret_keys:
+            return inputs
+        return {**inputs, **dict.fromkeys(secret_keys, "*****")}
 
     def _start_component_traces(
         self,
@@ -345,18 +396,27 @@ class TracingService(Service):
             msg = "called trace_component but no trace context found"
             raise RuntimeError(msg)
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        if trace_context.ready_tracers:
+            try:
+                trace_context.traces_queue.put_nowait(
+                    (self._start_component_traces, (component_trace_context, trace_context))
+                )
+                component_trace_context.queued = True
+            except asyncio.QueueFull:
+                trace_context.dropped_traces += 1
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            if component_trace_context.queued:
+                await trace_context.traces_queue.put(
+                    (self._end_component_traces, (component_trace_context, trace_context, e))
+                )
             raise
         else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
-            )
+            if component_trace_context.queued:
+                await trace_context.traces_queue.put(
+                    (self._end_component_traces, (component_trace_context, trace_context, None))
+                )
 
     @property
     def project_name(self):
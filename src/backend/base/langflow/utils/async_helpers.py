@@ -1,5 +1,8 @@
 import asyncio
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+_in_worker_loop: ContextVar[bool] = ContextVar("in_worker_loop", default=False)
 
 if hasattr(asyncio, "timeout"):
 
@@ -26,3 +29,28 @@ def run_until_complete(coro):
         # If there's no event loop, create a new one and run the coroutine
         return asyncio.run(coro)
     return loop.run_until_complete(coro)
+
+
+class MainLoopRequiredError(RuntimeError):
+    """Raised when a service bound to the main event loop is used from a worker event loop."""
+
+
+def in_worker_loop() -> bool:
+    """Return True if the running code was started by `run_in_worker_loop`."""
+    return _in_worker_loop.get()
+
+
+def _run_worker_loop(func):
+    # Set in the worker thread's copy of the caller's context, so the caller is not affected
+    _in_worker_loop.set(True)
+    return asyncio.run(func())
+
+
+async def run_in_worker_loop(func):
+    """Await `func()` on a new event loop in a worker thread, keeping the caller's loop free.
+
+    The coroutine sees the caller's context variables. Objects bound to the caller's loop,
+    like futures or queues, must not be awaited from it, and services bound to it raise
+    `MainLoopRequiredError` when used from the worker loop.
+    """
+    return await asyncio.to_thread(_run_worker_loop, func)
@@ -1,11 +1,28 @@
 import base64
 import mimetypes
+import threading
 from pathlib import Path
 
+from cachetools import LRUCache
+
+ENCODED_IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Base64 payloads of recently encoded images, keyed by path, modification time and size
+_encoded_images: LRUCache = LRUCache(maxsize=ENCODED_IMAGE_CACHE_MAX_BYTES, getsizeof=len)
+_encoded_images_lock = threading.Lock()
+
+
+def clear_encoded_image_cache() -> None:
+    with _encoded_images_lock:
+        _encoded_images.clear()
+
 
 def convert_image_to_base64(image_path: str | Path) -> str:
     """Convert an image file to a base64 encoded string.
 
+    Encoded images are cached while they fit in `ENCODED_IMAGE_CACHE_MAX_BYTES`, so an image sent with every
+    turn of a conversation is only read and encoded again after the file changes.
+
     Args:
         image_path (str | Path): Path to the image file.
 
@@ -31,12 +48,23 @@ def convert_image_to_base64(image_path: str | Path) -> str:
         msg = f"Path is not a file: {image_path}"
         raise ValueError(msg)
 
+    stat = image_path.stat()
+    key = (str(image_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _encoded_images_lock:
+        encoded = _encoded_images.get(key)
+    if encoded is not None:
+        return encoded
+
     try:
         with image_path.open("rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+            encoded = base64.b64encode(image_file.read()).decode("utf-8")
     except OSError as e:
         msg = f"Error reading image file: {e}"
         raise OSError(msg) from e
+    if len(encoded) <= ENCODED_IMAGE_CACHE_MAX_BYTES:
+        with _encoded_images_lock:
+            _encoded_images[key] = encoded
+    return encoded
 
 
 def create_data_url(image_path: str | Path, mime_type: str | None = None) -> str:
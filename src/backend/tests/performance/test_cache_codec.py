@@ -0,0 +1,88 @@
+import time
+
+import dill
+import pandas as pd
+import pytest
+from langflow.schema.data import Data
+from langflow.schema.dataframe import DataFrame
+from langflow.schema.message import Message
+from langflow.services.cache.codec import CacheCodec
+
+ROUNDS = 20
+
+
+def _vertex_result() -> dict:
+    """A result like the ones cached for built vertices: a message, the chunks it was made of and some metadata."""
+    chunks = [{"text": f"chunk {index} " * 50, "source": f"file {index % 10}.txt"} for index in range(500)]
+    return {
+        "message": Message(text="\n".join(f"answer {index} " * 50 for index in range(50)), sender="Machine"),
+        "data": Data(data={"text": "summary " * 500, "sources": [f"file {index}.txt" for index in range(10)]}),
+        "chunks": chunks,
+        "built": True,
+    }
+
+
+def _dataframe() -> DataFrame:
+    return DataFrame(pd.DataFrame({"text": [f"row {index} of the table" for index in range(100_000)], "score": 0.5}))
+
+
+def _measure(encode, decode, value) -> tuple[int, float, float]:
+    """Returns the size of the encoded value and the best encode and decode times."""
+    encode_time = decode_time = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        encoded = encode(value)
+        encode_time = min(encode_time, time.perf_counter() - start)
+        start = time.perf_counter()
+        decode(encoded)
+        decode_time = min(decode_time, time.perf_counter() - start)
+    size = sum(map(len, encoded.values())) if isinstance(encoded, dict) else len(encoded)
+    return size, encode_time, decode_time
+
+
+def _compare(value, codec: CacheCodec) -> tuple[tuple[int, float, float], tuple[int, float, float], str]:
+    """Measures dill and the codec on the value, and returns their results and a report of them."""
+    dill_result = _measure(lambda value: dill.dumps(value, recurse=True), dill.loads, value)
+    if isinstance(value, dict):
+        # Encoded field by field, as RedisCache stores dictionaries in hashes
+        codec_result = _measure(
+            lambda value: {field: codec.encode(item) for field, item in value.items()},
+            lambda fields: {field: codec.decode(item) for field, item in fields.items()},
+            value,
+        )
+    else:
+        codec_result = _measure(codec.encode, codec.decode, value)
+    report = ", ".join(
+        f"{name} {size / 1024:.0f}KiB encoded in {encode * 1000:.2f}ms and decoded in {decode * 1000:.2f}ms"
+        for name, (size, encode, decode) in (("dill", dill_result), ("codec", codec_result))
+    )
+    return dill_result, codec_result, report
+
+
+@pytest.mark.benchmark
+def test_vertex_result_encodes_faster_than_dill():
+    (dill_size, dill_encode, dill_decode), (size, encode, decode), report = _compare(_vertex_result(), CacheCodec())
+
+    # Without compression, JSON is about the size of a pickle, and decodes about as fast
+    assert size < dill_size * 1.1, report
+    assert encode < dill_encode / 2, report
+    assert decode < dill_decode * 3, report
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(("compression", "module"), [("zstd", "zstandard"), ("lz4", "lz4")])
+def test_compression_shrinks_vertex_result(compression, module):
+    pytest.importorskip(module)
+    (dill_size, _, _), (size, _, _), report = _compare(_vertex_result(), CacheCodec(compression=compression))
+
+    assert size < dill_size / 4, report
+
+
+@pytest.mark.benchmark
+def test_dataframe_encodes_faster_than_dill():
+    pytest.importorskip("pyarrow")
+    (_, dill_encode, dill_decode), (_, encode, decode), report = _compare(_dataframe(), CacheCodec())
+
+    assert encode < dill_encode / 2, report
+    # Reading text columns back into pandas creates their Python strings, as unpickling does
+    assert decode < dill_decode * 3, report
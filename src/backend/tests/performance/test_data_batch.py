@@ -0,0 +1,62 @@
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+from langchain_core.documents import Document
+from langflow.schema.data import Data
+from langflow.schema.data_batch import DataBatch
+from langflow.schema.dataframe import DataFrame
+
+N_CHUNKS = 100_000
+
+
+@pytest.fixture(scope="module")
+def documents():
+    return [
+        Document(page_content=f"chunk {i} " * 20, metadata={"source": "file.txt", "chunk": i}) for i in range(N_CHUNKS)
+    ]
+
+
+def _data_list(documents: list[Document]) -> list[Data]:
+    # What chunking components build without a batch
+    return [Data(text=doc.page_content, data=doc.metadata) for doc in documents]
+
+
+def _measure(build: Callable[[], object]) -> tuple[float, int]:
+    """Returns the time to build the result and the memory it retains."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = build()
+        elapsed = time.perf_counter() - start
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+
+@pytest.mark.benchmark
+def test_data_batch_construction_and_memory(documents):
+    """A batch of chunks is built faster and retains less memory than a list of Data."""
+    list_time, list_memory = _measure(lambda: _data_list(documents))
+    batch_time, batch_memory = _measure(lambda: DataBatch.from_documents(documents))
+
+    report = (
+        f"list[Data]: {list_time:.3f}s {list_memory / 2**20:.1f}MiB, "
+        f"DataBatch: {batch_time:.3f}s {batch_memory / 2**20:.1f}MiB"
+    )
+    assert batch_time < list_time, report
+    assert batch_memory < list_memory / 2, report
+
+
+@pytest.mark.benchmark
+def test_data_batch_to_dataframe(documents):
+    """Chunks reach a DataFrame faster through a batch than through a list of Data."""
+    list_time, _ = _measure(lambda: DataFrame(_data_list(documents)))
+    batch_time, _ = _measure(lambda: DataFrame(DataBatch.from_documents(documents)))
+
+    assert batch_time < list_time, f"list[Data]: {list_time:.3f}s, DataBatch: {batch_time:.3f}s"
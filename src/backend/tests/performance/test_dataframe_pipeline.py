@@ -0,0 +1,88 @@
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+from langflow.components.processing.dataframe_operations import DataFrameOperationsComponent
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.io import Output
+from langflow.schema import DataFrame
+from langflow.services.deps import get_settings_service
+
+N_ROWS = 1_000_000
+N_CATEGORIES = 10
+
+
+class TableComponent(Component):
+    outputs = [Output(display_name="DataFrame", name="dataframe", method="build_dataframe")]
+
+    def build_dataframe(self) -> DataFrame:
+        rng = np.random.default_rng(0)
+        return DataFrame(
+            pd.DataFrame(
+                {
+                    "id": np.arange(N_ROWS),
+                    "category": [f"category {i % N_CATEGORIES}" for i in range(N_ROWS)],
+                    "text": [f"row {i} of the table" for i in range(N_ROWS)],
+                    "score": rng.random(N_ROWS),
+                }
+            )
+        )
+
+
+def _pipeline() -> tuple[Graph, DataFrameOperationsComponent]:
+    table = TableComponent(_id="table")
+    select = DataFrameOperationsComponent(_id="select")
+    select.set(df=table.build_dataframe, operation="Select Columns", columns_to_select=["id", "category", "text"])
+    tail = DataFrameOperationsComponent(_id="tail")
+    tail.set(df=select.perform_operation, operation="Tail", num_rows=N_ROWS // 2)
+    filter_rows = DataFrameOperationsComponent(_id="filter")
+    filter_rows.set(df=tail.perform_operation, operation="Filter", column_name="category", filter_value="category 3")
+    rename = DataFrameOperationsComponent(_id="rename")
+    rename.set(df=filter_rows.perform_operation, operation="Rename Column", column_name="text", new_column_name="chunk")
+    return Graph(table, rename), rename
+
+
+async def _run(monkeypatch, storage: str) -> tuple[float, int, DataFrame]:
+    """Runs the pipeline and returns the time of the operations and the memory their outputs and the source retain.
+
+    Memory counts both the Python heap, where pandas keeps its arrays and strings, and the Arrow memory pool.
+    """
+    pa = pytest.importorskip("pyarrow")
+    monkeypatch.setattr(get_settings_service().settings, "dataframe_storage", storage)
+    graph, last = _pipeline()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        python_memory, arrow_memory = tracemalloc.get_traced_memory()[0], pa.total_allocated_bytes()
+        steps = aiter(graph.async_start())
+        await anext(steps)  # The source
+        start = time.perf_counter()
+        async for _ in steps:
+            pass
+        elapsed = time.perf_counter() - start
+        retained = tracemalloc.get_traced_memory()[0] - python_memory + pa.total_allocated_bytes() - arrow_memory
+    finally:
+        tracemalloc.stop()
+    return elapsed, retained, last._outputs_map["output"].value
+
+
+@pytest.mark.benchmark
+async def test_dataframe_pipeline_storage(monkeypatch):
+    """A 1M-row frame goes through select, tail, filter and rename components in each storage."""
+    pytest.importorskip("pyarrow")
+    pandas_time, pandas_memory, pandas_result = await _run(monkeypatch, "pandas")
+    arrow_time, arrow_memory, arrow_result = await _run(monkeypatch, "arrow")
+
+    assert arrow_result.is_arrow_backed
+    assert len(arrow_result) == len(pandas_result) == N_ROWS // 2 // N_CATEGORIES
+    assert arrow_result["chunk"].tolist() == pandas_result["chunk"].tolist()
+    report = (
+        f"pandas: {pandas_time:.3f}s {pandas_memory / 2**20:.1f}MiB, "
+        f"arrow: {arrow_time:.3f}s {arrow_memory / 2**20:.1f}MiB"
+    )
+    # Arrow stores strings compactly, and the operations share the buffers of their input
+    assert arrow_memory < pandas_memory / 2, report
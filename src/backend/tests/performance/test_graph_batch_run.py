@@ -0,0 +1,39 @@
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+
+N_INPUTS = 20
+
+
+@pytest.fixture
+def graph():
+    chat_input = ChatInput(_id="ChatInput-bench")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(_id="ChatOutput-bench")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    # Round-trip through the payload so the graph looks like one loaded from a saved flow
+    return Graph.from_payload(Graph(chat_input, chat_output).dump()["data"])
+
+
+@pytest.fixture
+def inputs():
+    return [{"input_value": f"message {i}"} for i in range(N_INPUTS)]
+
+
+def _texts(run_outputs):
+    return [run_output.outputs[0].results["message"].text for run_output in run_outputs]
+
+
+@pytest.mark.benchmark
+async def test_graph_run_inputs_sequentially(graph, inputs):
+    """Benchmark running a batch of inputs one after another on the same graph."""
+    results = await graph.arun(inputs, outputs=["ChatOutput-bench"])
+    assert len(results) == len(inputs)
+
+
+@pytest.mark.benchmark
+async def test_graph_run_inputs_concurrently(graph, inputs):
+    """Benchmark running the same batch of inputs concurrently on isolated graph copies."""
+    results = await graph.arun_batch(inputs, outputs=["ChatOutput-bench"], max_concurrency=8)
+    assert _texts(results) == [run_inputs["input_value"] for run_inputs in inputs]
@@ -0,0 +1,69 @@
+import random
+import time
+from collections import defaultdict
+from collections.abc import Callable
+
+import pytest
+from langflow.graph.graph.utils import get_sorted_vertices
+
+SIZES = [1_000, 2_500, 5_000, 10_000]
+
+
+def _chain(size: int) -> list[tuple[str, str]]:
+    return [(f"Prompt-{i}", f"Prompt-{i + 1}") for i in range(size - 1)]
+
+
+def _fan_in(size: int) -> list[tuple[str, str]]:
+    return [(f"TextInput-{i}", f"ChatOutput-{size - 1}") for i in range(size - 1)]
+
+
+def _random_dag(size: int) -> list[tuple[str, str]]:
+    rng = random.Random(size)  # noqa: S311
+    edges = []
+    for i in range(1, size):
+        edges.extend((f"Prompt-{rng.randrange(i)}", f"Prompt-{i}") for _ in range(rng.randint(1, 3)))
+    return edges
+
+
+def _sort(edges: list[tuple[str, str]], stop_component_id: str | None) -> float:
+    """Returns the time get_sorted_vertices takes with maps built like the Graph builds them."""
+    vertex_ids = list(dict.fromkeys(vertex_id for edge in edges for vertex_id in edge))
+    in_degree_map: dict[str, int] = dict.fromkeys(vertex_ids, 0)
+    predecessor_map: dict[str, list[str]] = defaultdict(list)
+    successor_map: dict[str, list[str]] = defaultdict(list)
+    for source, target in edges:
+        in_degree_map[target] += 1
+        predecessor_map[target].append(source)
+        successor_map[source].append(target)
+    start = time.perf_counter()
+    first_layer, remaining_layers = get_sorted_vertices(
+        vertices_ids=vertex_ids,
+        cycle_vertices=set(),
+        stop_component_id=stop_component_id,
+        in_degree_map=in_degree_map,
+        successor_map=successor_map,
+        predecessor_map=predecessor_map,
+        get_vertex_predecessors=lambda vertex_id: predecessor_map[vertex_id],
+        get_vertex_successors=lambda vertex_id: successor_map[vertex_id],
+    )
+    elapsed = time.perf_counter() - start
+    sorted_ids = first_layer + [vertex_id for layer in remaining_layers for vertex_id in layer]
+    # Stopping at the last vertex sorts its ancestors, which are all the vertices of a chain or a fan-in
+    assert stop_component_id in sorted_ids if stop_component_id else len(sorted_ids) == len(vertex_ids)
+    return elapsed
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("build_edges", [_chain, _fan_in, _random_dag], ids=["chain", "fan_in", "random_dag"])
+@pytest.mark.parametrize("with_stop_component", [False, True], ids=["full", "stop_component"])
+def test_sort_scales_linearly(build_edges: Callable[[int], list[tuple[str, str]]], with_stop_component):
+    """Sorting ten times the vertices takes about ten times as long, not a hundred times."""
+    timings = {}
+    for size in SIZES:
+        stop_component_id = f"{build_edges(2)[-1][1].split('-')[0]}-{size - 1}" if with_stop_component else None
+        # The best of a few runs, so a pause of the collector doesn't count as growth
+        timings[size] = min(_sort(build_edges(size), stop_component_id) for _ in range(3))
+
+    report = ", ".join(f"{size}: {elapsed * 1000:.1f}ms" for size, elapsed in timings.items())
+    growth = timings[SIZES[-1]] / timings[SIZES[0]]
+    assert growth < 3 * SIZES[-1] / SIZES[0], report
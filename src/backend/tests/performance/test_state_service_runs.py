@@ -0,0 +1,52 @@
+import asyncio
+import gc
+import tracemalloc
+import uuid
+
+import pytest
+from langflow.services.deps import get_settings_service
+from langflow.services.state.service import InMemoryStateService
+
+RUNS_PER_BATCH = 2_000
+BATCHES = 5
+
+
+async def _run(service: InMemoryStateService, run_id: str) -> None:
+    """A run that writes, observes and reads its state from a worker thread, like a component, then ends."""
+    notified = []
+    service.subscribe("messages", lambda _, new_state, **__: notified.append(new_state), run_id=run_id)
+
+    def build() -> None:
+        for index in range(10):
+            service.append_state("messages", {"text": f"message {index}" * 10}, run_id=run_id)
+        service.update_state("answer", "x" * 1_000, run_id=run_id)
+
+    await asyncio.to_thread(build)
+    assert len(service.get_state("messages", run_id=run_id)) == len(notified) == 10
+    service.release_run(run_id)
+
+
+@pytest.mark.benchmark
+async def test_memory_stays_flat_across_runs():
+    """Thousands of concurrent runs leave no state behind once they end."""
+    service = InMemoryStateService(get_settings_service())
+
+    async def batch() -> None:
+        await asyncio.gather(*(_run(service, str(uuid.uuid4())) for _ in range(RUNS_PER_BATCH)))
+
+    tracemalloc.start()
+    try:
+        # Measured after a first batch, which warms up the thread pool and grows the shards
+        await batch()
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in range(BATCHES):
+            await batch()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert service.run_count == 0
+    # Each run writes about 2KiB of state, so a leak would retain about 20MiB
+    assert retained < 256 * 1024, f"{retained / 1024:.1f}KiB retained after {RUNS_PER_BATCH * BATCHES} runs"
@@ -0,0 +1,52 @@
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.storage.local import LocalStorageService
+from langflow.services.storage.service import STREAM_CHUNK_SIZE
+
+FILE_SIZE = 64 * 1024 * 1024
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+    return LocalStorageService(session_service=None, settings_service=settings_service)
+
+
+async def _chunks():
+    chunk = b"x" * STREAM_CHUNK_SIZE
+    for _ in range(FILE_SIZE // STREAM_CHUNK_SIZE):
+        yield chunk
+
+
+@pytest.mark.benchmark
+async def test_streamed_save_and_read_peak_memory(storage_service):
+    """The peak memory of a streamed round trip stays a few chunks large, whatever the file size."""
+    tracemalloc.start()
+    try:
+        size = await storage_service.save_file_stream("flow", "large.bin", _chunks())
+        read = 0
+        async for chunk in await storage_service.get_file_stream("flow", "large.bin"):
+            read += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert size == read == FILE_SIZE
+    assert peak < 8 * STREAM_CHUNK_SIZE
+
+
+@pytest.mark.benchmark
+async def test_buffered_save_and_read_peak_memory(storage_service):
+    """Baseline: saving and reading the file as a whole holds it in memory at least once."""
+    tracemalloc.start()
+    try:
+        await storage_service.save_file("flow", "large.bin", b"".join([chunk async for chunk in _chunks()]))
+        data = await storage_service.get_file("flow", "large.bin")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(data) == FILE_SIZE
+    assert peak >= FILE_SIZE
@@ -0,0 +1,102 @@
+import asyncio
+import statistics
+import time
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.custom import Component
+from langflow.custom.custom_component.output_execution import shutdown_output_process_pool
+from langflow.graph import Graph
+from langflow.io import IntInput, Output
+from langflow.schema.data import Data
+from langflow.services.deps import get_settings_service
+
+N_HEAVY = 4
+N_LIGHT = 10
+HEAVY_ITERATIONS = 1_000_000
+
+
+class HeavyComponent(Component):
+    inputs = [IntInput(name="iterations", display_name="Iterations")]
+    outputs = [Output(display_name="Total", name="total", method="total")]
+
+    def total(self) -> Data:
+        # Pure Python work: holds the GIL the whole time
+        total = 0
+        for i in range(self.iterations):
+            total += i % 7
+        return Data(data={"total": total})
+
+
+@pytest.fixture
+def light_graph():
+    chat_input = ChatInput(_id="ChatInput-light")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(_id="ChatOutput-light")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    return Graph.from_payload(Graph(chat_input, chat_output).dump()["data"])
+
+
+@pytest.fixture
+def process_pool():
+    yield
+    shutdown_output_process_pool()
+
+
+async def _heavy_output() -> None:
+    component = HeavyComponent(iterations=HEAVY_ITERATIONS)
+    await component._get_output_result(component._outputs_map["total"])
+
+
+async def _light_latencies(graph: Graph) -> list[float]:
+    latencies = []
+    for i in range(N_LIGHT):
+        start = time.perf_counter()
+        await graph.arun([{"input_value": f"message {i}"}], outputs=["ChatOutput-light"])
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def _run_with_heavy_outputs(graph: Graph) -> list[float]:
+    stop = asyncio.Event()
+
+    async def keep_busy():
+        while not stop.is_set():
+            await _heavy_output()
+            # An inline output never suspends, so let the other tasks in between builds
+            await asyncio.sleep(0)
+
+    heavy = [asyncio.create_task(keep_busy()) for _ in range(N_HEAVY)]
+    await asyncio.sleep(0)
+    try:
+        return await _light_latencies(graph)
+    finally:
+        stop.set()
+        await asyncio.gather(*heavy)
+
+
+def _p95(latencies: list[float]) -> float:
+    return statistics.quantiles(latencies, n=20)[-1]
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("process_pool")
+async def test_sync_output_latency_isolation(light_graph, monkeypatch):
+    """Latency of light chat runs while heavy sync outputs run concurrently, per execution policy."""
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "output_process_pool_size", N_HEAVY)
+
+    baseline = await _light_latencies(light_graph)
+    p95 = {}
+    for policy in ("inline", "thread", "process"):
+        monkeypatch.setattr(settings, "sync_output_execution", policy)
+        if policy == "process":
+            # Start the workers before measuring
+            await asyncio.gather(*(_heavy_output() for _ in range(N_HEAVY)))
+        p95[policy] = _p95(await _run_with_heavy_outputs(light_graph))
+
+    report = f"baseline={_p95(baseline):.3f}s " + " ".join(f"{policy}={value:.3f}s" for policy, value in p95.items())
+    # On the event loop, every light run waits for whole heavy outputs
+    assert p95["process"] < p95["inline"] / 2, report
+    assert p95["thread"] < p95["inline"], report
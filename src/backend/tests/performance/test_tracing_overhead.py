@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.services.deps import get_tracing_service
+from langflow.services.tracing.base import BaseTracer
+from langflow.services.tracing.service import TracingService
+
+N_INPUTS = 20
+EXPORT_LATENCY = 0.02
+
+
+class FakeExporter(BaseTracer):
+    """Tracer that stands in for a remote backend by sleeping on every call."""
+
+    def __init__(self, trace_name: str, trace_type: str, project_name: str, trace_id, **kwargs) -> None:  # noqa: ARG002
+        self.trace_id = trace_id
+        self.spans: list[str] = []
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    def add_trace(self, trace_id, trace_name, trace_type, inputs, metadata=None, vertex=None) -> None:  # noqa: ARG002
+        time.sleep(EXPORT_LATENCY)
+        self.spans.append(trace_id)
+
+    def end_trace(self, trace_id, trace_name, outputs=None, error=None, logs=()) -> None:  # noqa: ARG002
+        time.sleep(EXPORT_LATENCY)
+
+    def end(self, inputs, outputs, error=None, metadata=None) -> None:  # noqa: ARG002
+        time.sleep(EXPORT_LATENCY)
+
+    def get_langchain_callback(self):
+        return None
+
+
+@pytest.fixture
+def graph():
+    chat_input = ChatInput(_id="ChatInput-bench")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(_id="ChatOutput-bench")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    return Graph.from_payload(Graph(chat_input, chat_output).dump()["data"])
+
+
+@pytest.fixture
+def exporters(monkeypatch):
+    """Replace the tracers with a single fake exporter and return the exporters created per run."""
+    created: list[FakeExporter] = []
+
+    def initialize_fake_exporter(_self, trace_context) -> None:
+        exporter = FakeExporter(trace_context.run_name, "chain", trace_context.project_name, trace_context.run_id)
+        created.append(exporter)
+        trace_context.tracers["fake"] = exporter
+
+    monkeypatch.setattr(TracingService, "_initialize_langsmith_tracer", initialize_fake_exporter)
+    for name in ("langwatch", "langfuse", "arize_phoenix", "opik"):
+        monkeypatch.setattr(TracingService, f"_initialize_{name}_tracer", lambda _self, _trace_context: None)
+    return created
+
+
+async def _run_inputs(graph: Graph) -> float:
+    start = time.perf_counter()
+    for i in range(N_INPUTS):
+        graph.set_run_id()
+        await graph.arun([{"input_value": f"message {i}"}], outputs=["ChatOutput-bench"])
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+async def test_graph_run_tracing_overhead(graph, exporters, monkeypatch):
+    """Compare running a flow with tracing off and with a slow exporter attached."""
+    tracing_service = get_tracing_service()
+
+    monkeypatch.setattr(tracing_service, "deactivated", True)
+    untraced = await _run_inputs(graph)
+    await asyncio.gather(*graph._end_trace_tasks)
+
+    monkeypatch.setattr(tracing_service, "deactivated", False)
+    traced = await _run_inputs(graph)
+    # Traces are ended in the background once a run returns
+    await asyncio.gather(*graph._end_trace_tasks)
+
+    assert len(exporters) == N_INPUTS
+    assert all(len(exporter.spans) == len(graph.vertices) for exporter in exporters)
+    # Each run makes five exporter calls; none of that latency may land on the event loop
+    exporter_time = N_INPUTS * (2 * len(graph.vertices) + 1) * EXPORT_LATENCY
+    assert traced - untraced < exporter_time / 2, f"untraced={untraced:.3f}s traced={traced:.3f}s"
@@ -67,6 +67,30 @@ async def test_read_flows(client: AsyncClient, logged_in_headers):
     assert isinstance(result, list), "The result must be a list"
 
 
+async def test_read_flows_header_flows(client: AsyncClient, logged_in_headers, monkeypatch):
+    # Force several keyset-paginated batches
+    monkeypatch.setattr("langflow.api.v1.flows.FLOW_HEADER_BATCH_SIZE", 2)
+    node_data = {"nodes": [{"id": "node"}], "edges": []}
+    cases = [
+        {"name": f"flow_{i}", "data": {"nodes": [], "edges": [], "big": "x" * 100}, "is_component": False}
+        for i in range(3)
+    ]
+    cases.append({"name": "component", "data": node_data, "is_component": True})
+    response = await client.post("api/v1/flows/batch/", json={"flows": cases}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    params = {"get_all": True, "header_flows": True}
+    response = await client.get("api/v1/flows/", params=params, headers=logged_in_headers)
+    result = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    headers_by_name = {flow["name"]: flow for flow in result}
+    assert {case["name"] for case in cases} <= set(headers_by_name)
+    assert headers_by_name["flow_0"]["data"] is None, "Flows that are not components must not include data"
+    assert "updated_at" not in headers_by_name["flow_0"]
+    assert headers_by_name["component"]["data"] == node_data
+
+
 async def test_read_flow(client: AsyncClient, logged_in_headers):
     basic_case = {
         "name": "string",
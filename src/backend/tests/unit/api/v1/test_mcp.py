@@ -0,0 +1,41 @@
+from httpx import AsyncClient
+from langflow.api.v1 import mcp
+from langflow.services.deps import session_scope
+
+
+async def test_mcp_tool_catalog_is_scoped_and_invalidated(
+    client: AsyncClient, logged_in_headers, active_user, monkeypatch
+):
+    computed = []
+
+    def fake_json_schema_from_flow(flow):
+        computed.append(flow.name)
+        return {"type": "object", "properties": {}, "required": []}
+
+    monkeypatch.setattr(mcp, "json_schema_from_flow", fake_json_schema_from_flow)
+    empty_data = {"nodes": [], "edges": []}
+    flow_ids = []
+    for name in ["Flow One", "Flow Two"]:
+        response = await client.post(
+            "api/v1/flows/", json={"name": name, "data": empty_data, "is_component": False}, headers=logged_in_headers
+        )
+        flow_ids.append(response.json()["id"])
+
+    async with session_scope() as session:
+        catalog = await mcp.get_mcp_tool_catalog(session, active_user.id)
+        assert sorted(catalog.flow_ids) == ["flow_one", "flow_two"]
+        assert sorted(computed) == ["Flow One", "Flow Two"]
+        assert await mcp.get_mcp_tool_catalog(session, active_user.id) is catalog
+
+    computed.clear()
+    await client.patch(f"api/v1/flows/{flow_ids[0]}", json={"name": "Renamed"}, headers=logged_in_headers)
+    async with session_scope() as session:
+        catalog = await mcp.get_mcp_tool_catalog(session, active_user.id)
+        assert sorted(tool.name for tool in catalog.tools) == ["flow_two", "renamed"]
+        # Only the updated flow had its schema recomputed
+        assert computed == ["Renamed"]
+
+    await client.delete(f"api/v1/flows/{flow_ids[1]}", headers=logged_in_headers)
+    async with session_scope() as session:
+        catalog = await mcp.get_mcp_tool_catalog(session, active_user.id)
+        assert list(catalog.flow_ids) == ["renamed"]
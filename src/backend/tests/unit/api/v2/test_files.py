@@ -207,3 +207,50 @@ async def test_edit_file(files_client, files_created_api_key):
     assert response.status_code == 200
     file = response.json()
     assert file["name"] == "potato.txt"
+
+
+async def test_upload_and_download_binary_file(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    content = bytes(range(256)) * 2048
+
+    response = await files_client.post("api/v2/files", files={"file": ("data.bin", content)}, headers=headers)
+    assert response.status_code == 201
+    upload_response = response.json()
+    assert upload_response["size"] == len(content)
+
+    response = await files_client.get(f"api/v2/files/{upload_response['id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.content == content
+
+
+async def test_download_file_range(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    content = b"0123456789"
+
+    response = await files_client.post("api/v2/files", files={"file": ("digits.txt", content)}, headers=headers)
+    assert response.status_code == 201
+    url = f"api/v2/files/{response.json()['id']}"
+
+    response = await files_client.get(url, headers={**headers, "Range": "bytes=2-5"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 2-5/10"
+    assert response.content == b"2345"
+
+    response = await files_client.get(url, headers={**headers, "Range": "bytes=7-"})
+    assert response.status_code == 206
+    assert response.content == b"789"
+
+    response = await files_client.get(url, headers={**headers, "Range": "bytes=-3"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 7-9/10"
+    assert response.content == b"789"
+
+    # Unsupported range headers are ignored and the whole file is sent
+    response = await files_client.get(url, headers={**headers, "Range": "bytes=0-1,4-5"})
+    assert response.status_code == 200
+    assert response.content == content
+
+    response = await files_client.get(url, headers={**headers, "Range": "bytes=10-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */10"
@@ -0,0 +1,71 @@
+import asyncio
+
+from langchain.agents import BaseMultiActionAgent
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.tools import StructuredTool
+from langflow.base.agents.tool_execution import ConcurrentToolsAgentExecutor, ToolResultCache
+
+
+class FixedPlanAgent(BaseMultiActionAgent):
+    """Requests a fixed list of tool calls per turn and then finishes."""
+
+    turns: list[list[tuple[str, str]]]
+
+    @property
+    def input_keys(self):
+        return ["input"]
+
+    def plan(self, intermediate_steps, callbacks=None, **kwargs):
+        raise NotImplementedError
+
+    async def aplan(self, intermediate_steps, callbacks=None, **kwargs):  # noqa: ARG002
+        turn = len(intermediate_steps) // len(self.turns[0])
+        if turn < len(self.turns):
+            return [AgentAction(tool=name, tool_input={"query": query}, log="") for name, query in self.turns[turn]]
+        return AgentFinish(return_values={"output": "done"}, log="")
+
+
+def _make_tools(calls: list[str], running: list[int], max_running: list[int]):
+    async def search(query: str) -> str:
+        calls.append(query)
+        running[0] += 1
+        max_running[0] = max(max_running[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        return f"result for {query}"
+
+    return [
+        StructuredTool.from_function(
+            coroutine=search, name="search", description="Search", metadata={"idempotent": True}
+        )
+    ]
+
+
+async def test_tool_calls_are_bounded_and_idempotent_results_cached():
+    calls: list[str] = []
+    running, max_running = [0], [0]
+    agent = FixedPlanAgent(
+        turns=[[("search", "a"), ("search", "b"), ("search", "c")], [("search", "a"), ("search", "b"), ("search", "d")]]
+    )
+    cache = ToolResultCache()
+    executor = ConcurrentToolsAgentExecutor.from_agent_and_tools(
+        agent=agent,
+        tools=_make_tools(calls, running, max_running),
+        max_tool_concurrency=2,
+        tool_result_cache=cache,
+        return_intermediate_steps=True,
+    )
+
+    events = [event async for event in executor.astream_events({"input": "go"}, version="v2")]
+
+    assert sorted(calls) == ["a", "b", "c", "d"]
+    assert max_running[0] == 2
+    assert len(cache) == 4
+    # Cached calls still produce the tool events the agent message is built from
+    tool_ends = [event for event in events if event["event"] == "on_tool_end"]
+    assert len(tool_ends) == 6
+    assert [str(event["data"]["output"]) for event in tool_ends].count("result for a") == 2
+    for event in tool_ends:
+        starts = [e for e in events if e["event"] == "on_tool_start" and e["run_id"] == event["run_id"]]
+        assert len(starts) == 1
+        assert events.index(starts[0]) < events.index(event)
@@ -65,6 +65,12 @@ async def consume_and_assert_stream(response, job_id):
             assert parsed["data"]["build_data"] is not None, (
                 f"Missing build_data at position {count}. Full event stream:\n" + "\n".join(lines)
             )
+            assert "build" in (parsed["data"]["build_data"]["profile"] or {}), (
+                f"Missing build profile at position {count}. Full event stream:\n" + "\n".join(lines)
+            )
+            assert parsed["data"]["build_data"]["data"]["output_execution"], (
+                f"Missing output execution at position {count}. Full event stream:\n" + "\n".join(lines)
+            )
         elif count == 5:
             # Final event should be end
             assert parsed["event"] == "end", "Invalid final event. Expected 'end'. Full event stream:\n" + "\n".join(
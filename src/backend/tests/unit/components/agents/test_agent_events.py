@@ -541,3 +541,46 @@ async def test_handle_on_chain_stream_no_output():
     assert updated_message.text == ""
     assert updated_message.properties.state == "partial"
     assert isinstance(start_time, float)
+
+
+async def test_incremental_events_send_deltas_and_persist_at_end():
+    """With a delta sender, intermediate updates are deltas and the message is persisted once more at the end."""
+    persisted: list[Message] = []
+
+    async def send_message(message):
+        persisted.append(Message(**message.model_dump()))
+        return Message(**{**message.model_dump(), "id": "stored-id"})
+
+    deltas: list[dict] = []
+    send_delta = AsyncMock(side_effect=deltas.append)
+
+    events = []
+    for i in range(3):
+        events.extend(
+            [
+                {"event": "on_tool_start", "name": "tool", "run_id": f"run_{i}", "data": {"input": {"i": i}}},
+                {"event": "on_tool_end", "name": "tool", "run_id": f"run_{i}", "data": {"output": f"out {i}"}},
+            ]
+        )
+    agent_message = Message(
+        sender=MESSAGE_SENDER_AI,
+        sender_name="Agent",
+        properties={"icon": "Bot", "state": "partial"},
+        content_blocks=[ContentBlock(title="Agent Steps", contents=[])],
+        session_id="test_session_id",
+    )
+
+    result = await process_agent_events(
+        create_event_iterator(events), agent_message, send_message, send_delta, persist_interval=60
+    )
+
+    # Persisted when the message is first created and once more at the end
+    assert len(persisted) == 2
+    assert [content.output for content in persisted[-1].content_blocks[0].contents] == ["out 0", "out 1", "out 2"]
+    assert result.id == "stored-id"
+    assert result.properties.state == "complete"
+    # Every update carries only the content it changed
+    assert len(deltas) == 6
+    assert all(delta["id"] == "stored-id" and len(delta["contents"]) == 1 for delta in deltas)
+    assert [delta["contents"][0]["content_index"] for delta in deltas] == [0, 0, 1, 1, 2, 2]
+    assert deltas[-1]["contents"][0]["content"]["output"] == "out 2"
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from uuid import UUID
 
 import orjson
@@ -100,3 +101,76 @@ class TestLoopComponentWithAPI(ComponentTestBaseWithClient):
         assert "outputs" in data
         assert "session_id" in data
         assert len(data["outputs"][-1]["outputs"]) > 0
+
+    async def _run_flow_text(self, client: AsyncClient, flow_id: str, headers: dict) -> str:
+        payload = {"input_value": TEXT, "input_type": "chat", "output_type": "chat", "tweaks": {}}
+        response = await client.post(f"/api/v1/run/{flow_id}", json=payload, headers=headers)
+        response.raise_for_status()
+        outputs = response.json()["outputs"][-1]["outputs"]
+        return outputs[0]["results"]["message"]["text"]
+
+    async def test_run_flow_loop_map_mode(
+        self, client: AsyncClient, created_api_key, json_loop_test, logged_in_headers
+    ):
+        headers = {"x-api-key": created_api_key.api_key}
+        sequential_flow_id = await self._create_flow(client, json_loop_test, logged_in_headers)
+        sequential_text = await self._run_flow_text(client, sequential_flow_id, headers)
+
+        flow = orjson.loads(json_loop_test)
+        loop_node = next(node for node in flow["data"]["nodes"] if node["data"]["type"] == "LoopComponent")
+        loop_node["data"]["node"] = LoopComponent().to_frontend_node()["data"]["node"]
+        loop_node["data"]["node"]["template"]["map_mode"]["value"] = True
+        loop_node["data"]["node"]["template"]["max_concurrency"]["value"] = 2
+        map_flow = FlowCreate(name="Map Flow", description="description", data=flow["data"], endpoint_name="map")
+        response = await client.post("api/v1/flows/", json=map_flow.model_dump(), headers=logged_in_headers)
+        response.raise_for_status()
+        map_text = await self._run_flow_text(client, response.json()["id"], headers)
+
+        assert map_text
+        assert map_text == sequential_text
+
+
+class _Body:
+    """An isolated loop body that fails on "fail" items and returns nothing for "none" items."""
+
+    def __init__(self, item: Data):
+        self.item = item
+        self.result: Data | None = None
+
+    async def process(self, **_):
+        if self.item.text == "fail":
+            msg = "body failed"
+            raise ValueError(msg)
+        if self.item.text != "none":
+            self.result = Data(text=self.item.text.upper())
+
+    def get_vertex(self, _):
+        return SimpleNamespace(results={"output": self.result})
+
+
+def _loop_in_graph(items: list[Data]) -> LoopComponent:
+    item_edge = SimpleNamespace(source_handle=SimpleNamespace(name="item"), target_id="body", target_param="data")
+    loop_back_edge = SimpleNamespace(source_id="body", source_handle=SimpleNamespace(name="output"))
+    graph = SimpleNamespace(
+        context={},
+        get_loop_body_vertex_ids=lambda *_: ["body"],
+        get_vertex_edges=lambda _, *, is_source=True, **__: [item_edge] if is_source else [loop_back_edge],
+        create_isolated_subgraph=lambda *_, input_values, **__: _Body(input_values["body"]["data"]),
+    )
+    component = LoopComponent(data=items, map_mode=True, max_concurrency=2)
+    component._vertex = SimpleNamespace(id="loop", graph=graph)
+    return component
+
+
+async def test_map_items_keeps_failed_and_empty_items_in_place():
+    items = [Data(text="a"), Data(text="fail"), Data(text="none"), Data(text="b")]
+    component = _loop_in_graph(items)
+
+    results = await component.map_items()
+
+    assert len(results) == len(items)
+    assert results[0].text == "A"
+    assert results[1].data == {"error": "body failed", "index": 1}
+    assert results[2] == Data()
+    assert results[3].text == "B"
+    assert component.ctx[f"{component._id}_aggregated"] == results
@@ -1,6 +1,8 @@
 import pandas as pd
 import pytest
 from langflow.components.processing.dataframe_operations import DataFrameOperationsComponent
+from langflow.schema import DataFrame
+from langflow.services.deps import get_settings_service
 
 
 @pytest.fixture
@@ -82,3 +84,35 @@ def test_invalid_operation():
     component.operation = "Invalid Operation"
     with pytest.raises(ValueError, match="Unsupported operation: Invalid Operation"):
         component.perform_operation()
+
+
+def test_operations_leave_input_unchanged(sample_dataframe):
+    component = DataFrameOperationsComponent()
+    component.df = sample_dataframe
+    component.operation = "Add Column"
+    component.new_column_name = "D"
+    component.new_column_value = 10
+    component.perform_operation()
+    assert list(sample_dataframe.columns) == ["A", "B", "C"]
+
+
+async def test_arrow_dataframe_storage(sample_dataframe, monkeypatch):
+    """With Arrow storage, the DataFrame outputs of components are Arrow-backed."""
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(get_settings_service().settings, "dataframe_storage", "arrow")
+    component = DataFrameOperationsComponent(df=DataFrame(sample_dataframe), operation="Head", num_rows=2)
+    result = await component._get_output_result(component._outputs_map["output"])
+    assert isinstance(result, DataFrame)
+    assert result.is_arrow_backed
+    assert result["A"].tolist() == [1, 2]
+
+
+def test_filter_arrow_backed_column_with_missing_values(sample_dataframe):
+    pytest.importorskip("pyarrow")
+    component = DataFrameOperationsComponent()
+    component.df = DataFrame(sample_dataframe).add_row({"A": 6}).to_arrow_backed()
+    component.operation = "Filter"
+    component.column_name = "C"
+    component.filter_value = "c"
+    result = component.perform_operation()
+    assert result["A"].tolist() == [3]
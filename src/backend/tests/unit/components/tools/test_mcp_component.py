@@ -1,8 +1,10 @@
 import asyncio
+from contextlib import AsyncExitStack
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from langflow.components.tools.mcp_component import MCPSseClient, MCPStdioClient, MCPToolsComponent
+from langflow.base.mcp.util import MCPSessionPool, MCPSseClient, MCPStdioClient
+from langflow.components.tools.mcp_component import MCPToolsComponent
 
 from tests.base import ComponentTestBaseWithoutClient, VersionComponentMapping
 
@@ -122,7 +124,11 @@ class TestMCPToolsComponent(ComponentTestBaseWithoutClient):
         # Mock get_inputs_for_all_tools to return our mock input
         mock_input = MagicMock()
         mock_input.name = "test_param"
-        with patch.object(component, "get_inputs_for_all_tools") as mock_get_inputs:
+        with (
+            patch.object(component, "get_inputs_for_all_tools") as mock_get_inputs,
+            # Avoid connecting to a real MCP server
+            patch.object(component, "update_tools", AsyncMock(return_value=[mock_structured_tool])),
+        ):
             mock_get_inputs.return_value = {"test_tool": [mock_input]}
             output = await component.build_output()
 
@@ -270,3 +276,92 @@ class TestMCPSseClient:
                 ),
             ):
                 await sse_client.connect_to_server("http://test.url", {}, timeout_seconds=1)
+
+
+class FakeStdioClient:
+    """Stand-in for MCPStdioClient that records connections instead of spawning a process."""
+
+    connections: list["FakeStdioClient"] = []
+    failures_before_connect = 0
+
+    def __init__(self):
+        self.session = None
+        self.exit_stack = AsyncExitStack()
+        self.closed = False
+        self.exit_stack.callback(self._mark_closed)
+
+    def _mark_closed(self):
+        self.closed = True
+
+    async def connect_to_server(self, command_str, env=None):  # noqa: ARG002
+        if FakeStdioClient.failures_before_connect:
+            FakeStdioClient.failures_before_connect -= 1
+            msg = "server not ready"
+            raise OSError(msg)
+        self.session = AsyncMock()
+        self.session.call_tool.side_effect = lambda name, arguments=None: {"tool": name, "arguments": arguments}
+        FakeStdioClient.connections.append(self)
+        tool = MagicMock()
+        tool.name = "test_tool"
+        return [tool]
+
+
+class TestMCPSessionPool:
+    @pytest.fixture(autouse=True)
+    def fake_client(self, monkeypatch):
+        FakeStdioClient.connections = []
+        FakeStdioClient.failures_before_connect = 0
+        monkeypatch.setattr("langflow.base.mcp.util.MCPStdioClient", FakeStdioClient)
+
+    async def test_sessions_are_reused_by_key(self):
+        pool = MCPSessionPool()
+        first = await pool.get_stdio_session("server --flag", ["B=2", "A=1"])
+        second = await pool.get_stdio_session("server --flag", ["A=1", "B=2"])
+        other = await pool.get_stdio_session("server --flag", ["A=3"])
+
+        assert first is second
+        assert other is not first
+        assert [tool.name for tool in first.tools] == ["test_tool"]
+        assert len(FakeStdioClient.connections) == 2
+        await pool.close()
+        assert all(client.closed for client in FakeStdioClient.connections)
+
+    async def test_concurrent_calls_share_one_session(self):
+        pool = MCPSessionPool()
+        session = await pool.get_stdio_session("server")
+        results = await asyncio.gather(*(session.call_tool("test_tool", {"i": i}) for i in range(5)))
+
+        assert [result["arguments"]["i"] for result in results] == list(range(5))
+        assert len(FakeStdioClient.connections) == 1
+        assert FakeStdioClient.connections[0].session.call_tool.await_count == 5
+        await pool.close()
+
+    async def test_failed_health_ping_reconnects(self):
+        pool = MCPSessionPool(ping_interval=0)
+        session = await pool.get_stdio_session("server")
+        FakeStdioClient.connections[0].session.send_ping.side_effect = OSError("broken pipe")
+
+        assert await pool.get_stdio_session("server") is session
+        assert len(FakeStdioClient.connections) == 2
+        assert FakeStdioClient.connections[0].closed
+        await pool.close()
+
+    async def test_connect_retries_with_backoff(self):
+        FakeStdioClient.failures_before_connect = 2
+        pool = MCPSessionPool(max_retries=3, backoff_base=0)
+        session = await pool.get_stdio_session("server")
+        assert session.session is not None
+
+        FakeStdioClient.failures_before_connect = 3
+        with pytest.raises(ConnectionError, match="Failed to connect after 3 attempts"):
+            await pool.get_stdio_session("another server")
+        await pool.close()
+
+    async def test_idle_sessions_are_closed(self):
+        pool = MCPSessionPool(idle_timeout=0)
+        await pool.get_stdio_session("server")
+        await pool.get_stdio_session("another server")
+
+        assert FakeStdioClient.connections[0].closed
+        assert not FakeStdioClient.connections[1].closed
+        await pool.close()
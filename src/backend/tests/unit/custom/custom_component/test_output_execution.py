@@ -0,0 +1,77 @@
+import os
+import threading
+
+import pytest
+from langflow.custom import Component
+from langflow.custom.custom_component.output_execution import shutdown_output_process_pool
+from langflow.io import MessageTextInput, Output
+from langflow.schema.data import Data
+from langflow.services.deps import get_settings_service
+
+
+class WhereComponent(Component):
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Where", name="where", method="where")]
+
+    def where(self) -> Data:
+        data = Data(data={"text": self.text, "pid": os.getpid(), "thread": threading.get_ident()})
+        self.status = data
+        return data
+
+
+class InlineWhereComponent(WhereComponent):
+    sync_output_execution = "inline"
+
+
+@pytest.fixture
+def process_pool():
+    yield
+    shutdown_output_process_pool()
+
+
+async def _run_where(component: Component) -> Data:
+    return await component._get_output_result(component._outputs_map["where"])
+
+
+async def test_sync_outputs_run_in_a_thread_by_default():
+    component = WhereComponent(text="hello")
+
+    result = await _run_where(component)
+
+    assert result.data["thread"] != threading.get_ident()
+    assert component._output_execution == {"where": "thread"}
+
+
+async def test_component_policy_overrides_the_setting(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "sync_output_execution", "process")
+    component = InlineWhereComponent(text="hello")
+
+    result = await _run_where(component)
+
+    assert result.data["thread"] == threading.get_ident()
+    assert component._output_execution == {"where": "inline"}
+
+
+@pytest.mark.usefixtures("process_pool")
+async def test_process_policy_runs_in_a_worker_process(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "sync_output_execution", "process")
+    monkeypatch.setattr(get_settings_service().settings, "output_process_pool_size", 1)
+    component = WhereComponent(text="hello")
+
+    result = await _run_where(component)
+
+    assert result.data["text"] == "hello"
+    assert result.data["pid"] != os.getpid()
+    assert component.status == result
+    assert component._output_execution == {"where": "process"}
+
+
+async def test_process_policy_falls_back_to_a_thread_for_unpicklable_inputs(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "sync_output_execution", "process")
+    component = WhereComponent(text="hello")
+    component._attributes["lock"] = threading.Lock()
+
+    result = await _run_where(component)
+
+    assert result.data["pid"] == os.getpid()
+    assert component._output_execution == {"where": "thread"}
@@ -210,3 +210,15 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+    # Sending an event from a worker thread hands it to the loop the queue belongs to
+    async def test_send_event_from_worker_thread(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_test_event", "test_type")
+
+        await asyncio.to_thread(manager.on_test_event, data={"chunk": "from a thread"})
+
+        event_id, str_data, _ = await asyncio.wait_for(queue.get(), timeout=1)
+        assert event_id.startswith("test_type-")
+        assert json.loads(str_data) == {"event": "test_type", "data": {"chunk": "from a thread"}}
@@ -136,3 +136,25 @@ def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
     tool_calling_agent = ToolCallingAgentComponent()
     tool_calling_agent.set(tools=[tool])
+
+
+async def test_graph_arun_batch():
+    chat_input = ChatInput(_id="ChatInput-batch")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(_id="ChatOutput-batch")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+
+    inputs = [{"input_value": f"message {i}"} for i in range(5)]
+    inputs.insert(2, {"input_value": 42})
+    results = await graph.arun_batch(inputs, outputs=["ChatOutput-batch"], max_concurrency=2)
+
+    assert len(results) == len(inputs)
+    assert isinstance(results[2], TypeError)
+    texts = [result.outputs[0].results["message"].text for result in results if not isinstance(result, Exception)]
+    assert texts == [f"message {i}" for i in range(5)]
+    # The batch runs on copies, so the prepared graph is left untouched
+    assert not any(vertex.built for vertex in graph.vertices)
+
+    with pytest.raises(TypeError):
+        await graph.arun_batch(inputs, outputs=["ChatOutput-batch"], return_exceptions=False)
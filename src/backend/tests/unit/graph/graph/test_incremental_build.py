@@ -0,0 +1,85 @@
+import copy
+
+import pytest
+from langflow.components.outputs import ChatOutput
+from langflow.components.processing.combine_text import CombineTextComponent
+from langflow.components.prompts import PromptComponent
+from langflow.graph import Graph
+from langflow.graph.graph.constants import Finish
+
+
+@pytest.fixture
+def payload() -> dict:
+    prompt = PromptComponent(_id="Prompt-upstream")
+    prompt.set(template="Context")
+    combine = CombineTextComponent(_id="CombineText-middle")
+    combine.set(text1=prompt.build_prompt, text2="question", delimiter=" ")
+    chat_output = ChatOutput(_id="ChatOutput-end")
+    chat_output.set(input_value=combine.combine_texts, should_store_message=False)
+    return Graph(prompt, chat_output).dump()["data"]
+
+
+def _edit(payload: dict, vertex_id: str, field_name: str, value: str) -> dict:
+    """Returns a copy of the payload with a field of a vertex edited, as the frontend sends it."""
+    edited = copy.deepcopy(payload)
+    node = next(node for node in edited["nodes"] if node["id"] == vertex_id)
+    node["data"]["node"]["template"][field_name]["value"] = value
+    return edited
+
+
+async def _build(payload: dict, previous: Graph | None = None) -> Graph:
+    graph = Graph.from_payload(copy.deepcopy(payload))
+    if previous is not None:
+        graph.reuse_unchanged_results(previous)
+    graph.prepare()
+    async for result in graph.async_start():
+        if isinstance(result, Finish):
+            break
+    return graph
+
+
+def _reused(graph: Graph) -> set[str]:
+    return {vertex.id for vertex in graph.vertices if vertex.result.used_frozen_result}
+
+
+async def test_unchanged_upstream_is_reused(payload):
+    previous = await _build(payload)
+    graph = await _build(_edit(payload, "CombineText-middle", "delimiter", " - "), previous)
+
+    assert graph.incremental_build.reused == ["Prompt-upstream"]
+    assert sorted(graph.incremental_build.rebuilt) == ["ChatOutput-end", "CombineText-middle"]
+    assert _reused(graph) == {"Prompt-upstream"}
+    assert graph.get_vertex("ChatOutput-end").results["message"].text == "Context - question"
+
+
+async def test_changed_vertex_rebuilds_downstream(payload):
+    previous = await _build(payload)
+    graph = await _build(_edit(payload, "Prompt-upstream", "template", "Other context"), previous)
+
+    assert graph.incremental_build.reused == []
+    assert not _reused(graph)
+    assert graph.get_vertex("ChatOutput-end").results["message"].text == "Other context question"
+
+
+async def test_outputs_always_run(payload):
+    previous = await _build(payload)
+    graph = await _build(payload, previous)
+
+    assert sorted(graph.incremental_build.reused) == ["CombineText-middle", "Prompt-upstream"]
+    assert graph.incremental_build.rebuilt == ["ChatOutput-end"]
+    assert graph.get_vertex("ChatOutput-end").results["message"].text == "Context question"
+
+
+def test_unbuilt_previous_graph_reuses_nothing(payload):
+    previous = Graph.from_payload(copy.deepcopy(payload))
+    graph = Graph.from_payload(copy.deepcopy(payload))
+
+    assert graph.reuse_unchanged_results(previous).reused == []
+
+
+async def test_always_build(payload):
+    previous = await _build(payload)
+    graph = Graph.from_payload(copy.deepcopy(payload))
+
+    incremental_build = graph.reuse_unchanged_results(previous, always_build=["CombineText-middle"])
+    assert incremental_build.reused == ["Prompt-upstream"]
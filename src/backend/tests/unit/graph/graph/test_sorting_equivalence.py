@@ -0,0 +1,397 @@
+from collections import defaultdict, deque
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from langflow.graph.graph.utils import (
+    MAX_CYCLE_APPEARANCES,
+    filter_vertices_from_vertex,
+    filter_vertices_up_to_vertex,
+    find_cycle_vertices,
+    find_start_component_id,
+    get_sorted_vertices,
+    layered_topological_sort,
+    sort_chat_inputs_first,
+    sort_layer_by_dependency,
+)
+
+# The sorters as they were before they were made linear, to check the new ones against.
+
+
+def _reference_layered_topological_sort(
+    vertices_ids: set[str],
+    in_degree_map: dict[str, int],
+    successor_map: dict[str, list[str]],
+    predecessor_map: dict[str, list[str]],
+    start_id: str | None = None,
+    cycle_vertices: set[str] | None = None,
+    is_input_vertex: Callable[[str], bool] | None = None,  # noqa: ARG001
+    *,
+    is_cyclic: bool = False,
+) -> list[list[str]]:
+    """The implementation of layered_topological_sort before it kept queue membership in a set."""
+    # Queue for vertices with no incoming edges
+    cycle_vertices = cycle_vertices or set()
+    in_degree_map = in_degree_map.copy()
+
+    if is_cyclic and all(in_degree_map.values()):
+        # This means we have a cycle because all vertex have in_degree_map > 0
+        # because of this we set the queue to start on the start_id if it exists
+        if start_id is not None:
+            queue = deque([start_id])
+            # Reset in_degree for start_id to allow cycle traversal
+            in_degree_map[start_id] = 0
+        else:
+            # Find the chat input component
+            chat_input = find_start_component_id(vertices_ids)
+            if chat_input is None:
+                # If no input component is found, start with any vertex
+                queue = deque([next(iter(vertices_ids))])
+                in_degree_map[next(iter(vertices_ids))] = 0
+            else:
+                queue = deque([chat_input])
+                # Reset in_degree for chat_input to allow cycle traversal
+                in_degree_map[chat_input] = 0
+    else:
+        # Start with vertices that have no incoming edges or are input vertices
+        queue = deque(
+            vertex_id
+            for vertex_id in vertices_ids
+            if in_degree_map[vertex_id] == 0
+            # We checked if it is input but that caused the TextInput to be at the start
+            # or (is_input_vertex and is_input_vertex(vertex_id))
+        )
+
+    layers: list[list[str]] = []
+    visited = set()
+    cycle_counts = dict.fromkeys(vertices_ids, 0)
+    current_layer = 0
+
+    # Process the first layer separately to avoid duplicates
+    if queue:
+        layers.append([])  # Start the first layer
+        first_layer_vertices = set()
+        layer_size = len(queue)
+        for _ in range(layer_size):
+            vertex_id = queue.popleft()
+            if vertex_id not in first_layer_vertices:
+                first_layer_vertices.add(vertex_id)
+                visited.add(vertex_id)
+                cycle_counts[vertex_id] += 1
+                layers[current_layer].append(vertex_id)
+
+            for neighbor in successor_map[vertex_id]:
+                # only vertices in `vertices_ids` should be considered
+                # because vertices by have been filtered out
+                # in a previous step. All dependencies of theirs
+                # will be built automatically if required
+                if neighbor not in vertices_ids:
+                    continue
+
+                in_degree_map[neighbor] -= 1  # 'remove' edge
+                if in_degree_map[neighbor] == 0:
+                    queue.append(neighbor)
+
+                # if > 0 it might mean not all predecessors have added to the queue
+                # so we should process the neighbors predecessors
+                elif in_degree_map[neighbor] > 0:
+                    for predecessor in predecessor_map[neighbor]:
+                        if (
+                            predecessor not in queue
+                            and predecessor not in first_layer_vertices
+                            and (in_degree_map[predecessor] == 0 or predecessor in cycle_vertices)
+                        ):
+                            queue.append(predecessor)
+
+        current_layer += 1  # Next layer
+
+    # Process remaining layers normally, allowing cycle vertices to appear multiple times
+    while queue:
+        layers.append([])  # Start a new layer
+        layer_size = len(queue)
+        for _ in range(layer_size):
+            vertex_id = queue.popleft()
+            if vertex_id not in visited or (is_cyclic and cycle_counts[vertex_id] < MAX_CYCLE_APPEARANCES):
+                if vertex_id not in visited:
+                    visited.add(vertex_id)
+                cycle_counts[vertex_id] += 1
+                layers[current_layer].append(vertex_id)
+
+            for neighbor in successor_map[vertex_id]:
+                # only vertices in `vertices_ids` should be considered
+                # because vertices by have been filtered out
+                # in a previous step. All dependencies of theirs
+                # will be built automatically if required
+                if neighbor not in vertices_ids:
+                    continue
+
+                in_degree_map[neighbor] -= 1  # 'remove' edge
+                if in_degree_map[neighbor] == 0 and neighbor not in visited:
+                    queue.append(neighbor)
+                    # # If this is a cycle vertex, reset its in_degree to allow it to appear again
+                    # if neighbor in cycle_vertices and neighbor in visited:
+                    #     in_degree_map[neighbor] = len(predecessor_map[neighbor])
+
+                # if > 0 it might mean not all predecessors have added to the queue
+                # so we should process the neighbors predecessors
+                elif in_degree_map[neighbor] > 0:
+                    for predecessor in predecessor_map[neighbor]:
+                        if predecessor not in queue and (
+                            predecessor not in visited
+                            or (is_cyclic and cycle_counts[predecessor] < MAX_CYCLE_APPEARANCES)
+                        ):
+                            queue.append(predecessor)
+
+        current_layer += 1  # Next layer
+
+    # Remove empty layers
+    return [layer for layer in layers if layer]
+
+
+def _reference_get_sorted_vertices(
+    vertices_ids: list[str],
+    cycle_vertices: set[str],
+    stop_component_id: str | None = None,
+    start_component_id: str | None = None,
+    graph_dict: dict[str, Any] | None = None,
+    in_degree_map: dict[str, int] | None = None,
+    successor_map: dict[str, list[str]] | None = None,
+    predecessor_map: dict[str, list[str]] | None = None,
+    is_input_vertex: Callable[[str], bool] | None = None,
+    get_vertex_predecessors: Callable[[str], list[str]] | None = None,
+    get_vertex_successors: Callable[[str], list[str]] | None = None,
+    *,
+    is_cyclic: bool = False,
+) -> tuple[list[str], list[list[str]]]:
+    """The implementation of get_sorted_vertices before it collected connected vertices in one traversal."""
+    # Handle cycles by converting stop to start
+    if stop_component_id in cycle_vertices:
+        start_component_id = stop_component_id
+        stop_component_id = None
+
+    # Build in_degree_map if not provided
+    if in_degree_map is None:
+        in_degree_map = {}
+        for vertex_id in vertices_ids:
+            if get_vertex_predecessors is not None:
+                in_degree_map[vertex_id] = len(get_vertex_predecessors(vertex_id))
+            else:
+                in_degree_map[vertex_id] = 0
+
+    # Build successor_map if not provided
+    if successor_map is None:
+        successor_map = {}
+        for vertex_id in vertices_ids:
+            if get_vertex_successors is not None:
+                successor_map[vertex_id] = get_vertex_successors(vertex_id)
+            else:
+                successor_map[vertex_id] = []
+
+    # Build predecessor_map if not provided
+    if predecessor_map is None:
+        predecessor_map = {}
+        for vertex_id in vertices_ids:
+            if get_vertex_predecessors is not None:
+                predecessor_map[vertex_id] = get_vertex_predecessors(vertex_id)
+            else:
+                predecessor_map[vertex_id] = []
+
+    # If we have a stop component, we need to filter out all vertices
+    # that are not predecessors of the stop component
+    if stop_component_id is not None:
+        filtered_vertices = filter_vertices_up_to_vertex(
+            vertices_ids,
+            stop_component_id,
+            get_vertex_predecessors=get_vertex_predecessors,
+            get_vertex_successors=get_vertex_successors,
+            graph_dict=graph_dict,
+        )
+        vertices_ids = list(filtered_vertices)
+
+    # If we have a start component, we need to filter out unconnected vertices
+    # but keep vertices that are connected to the graph even if not reachable from start
+    if start_component_id is not None:
+        # First get all vertices reachable from start
+        reachable_vertices = filter_vertices_from_vertex(
+            vertices_ids,
+            start_component_id,
+            get_vertex_predecessors=get_vertex_predecessors,
+            get_vertex_successors=get_vertex_successors,
+            graph_dict=graph_dict,
+        )
+        # Then get all vertices that can reach any reachable vertex
+        connected_vertices = set()
+        for vertex in reachable_vertices:
+            connected_vertices.update(
+                filter_vertices_up_to_vertex(
+                    vertices_ids,
+                    vertex,
+                    get_vertex_predecessors=get_vertex_predecessors,
+                    get_vertex_successors=get_vertex_successors,
+                    graph_dict=graph_dict,
+                )
+            )
+        vertices_ids = list(connected_vertices)
+
+    # Get the layers
+    layers = _reference_layered_topological_sort(
+        vertices_ids=set(vertices_ids),
+        in_degree_map=in_degree_map,
+        successor_map=successor_map,
+        predecessor_map=predecessor_map,
+        start_id=start_component_id,
+        is_input_vertex=is_input_vertex,
+        cycle_vertices=cycle_vertices,
+        is_cyclic=is_cyclic,
+    )
+
+    # Split into first layer and remaining layers
+    if not layers:
+        return [], []
+
+    first_layer = layers[0]
+    remaining_layers = layers[1:]
+
+    # If we have a stop component, we need to filter out all vertices
+    # that are not predecessors of the stop component
+    if stop_component_id is not None and remaining_layers and stop_component_id not in remaining_layers[-1]:
+        remaining_layers[-1].append(stop_component_id)
+
+    # Sort chat inputs first and sort each layer by dependencies
+    all_layers = [first_layer, *remaining_layers]
+    if get_vertex_predecessors is not None and start_component_id is None:
+        all_layers = sort_chat_inputs_first(all_layers, get_vertex_predecessors)
+    if get_vertex_successors is not None:
+        all_layers = sort_layer_by_dependency(all_layers, get_vertex_successors)
+
+    if not all_layers:
+        return [], []
+
+    return all_layers[0], all_layers[1:]
+
+
+COMPONENT_NAMES = ["ChatInput", "TextInput", "Webhook", "Prompt", "OpenAIModel", "Memory", "ChatOutput"]
+
+
+@st.composite
+def flows(draw, max_vertices: int = 12) -> tuple[list[str], list[tuple[str, str]]]:
+    """Vertex IDs named like components and edges between distinct vertices, possibly forming cycles."""
+    size = draw(st.integers(min_value=1, max_value=max_vertices))
+    vertex_ids = [f"{draw(st.sampled_from(COMPONENT_NAMES))}-{index}" for index in range(size)]
+    edges = draw(
+        st.lists(
+            st.tuples(st.sampled_from(vertex_ids), st.sampled_from(vertex_ids)).filter(lambda edge: edge[0] != edge[1]),
+            max_size=3 * size,
+        )
+    )
+    return vertex_ids, edges
+
+
+def _maps(vertex_ids: list[str], edges: list[tuple[str, str]]) -> dict[str, Any]:
+    """The maps Graph builds from its edges, fresh for each sorter since they may be modified."""
+    in_degree_map: dict[str, int] = dict.fromkeys(vertex_ids, 0)
+    predecessor_map: dict[str, list[str]] = defaultdict(list)
+    successor_map: dict[str, list[str]] = defaultdict(list)
+    for source, target in edges:
+        in_degree_map[target] += 1
+        predecessor_map[target].append(source)
+        successor_map[source].append(target)
+    return {"in_degree_map": in_degree_map, "predecessor_map": predecessor_map, "successor_map": successor_map}
+
+
+def _outcome(sort: Callable[[], Any]) -> Any:
+    try:
+        return sort()
+    except Exception as exc:  # noqa: BLE001
+        return type(exc), str(exc)
+
+
+@settings(max_examples=500, deadline=None)
+@given(flow=flows(), data=st.data())
+def test_layered_topological_sort_matches_reference(flow, data):
+    vertex_ids, edges = flow
+    cycle_vertices = set(find_cycle_vertices(edges))
+    start_id = data.draw(st.none() | st.sampled_from(vertex_ids))
+    vertices_set = set(vertex_ids)
+
+    def sort(sorter):
+        return _outcome(
+            lambda: sorter(
+                vertices_ids=vertices_set,
+                start_id=start_id,
+                cycle_vertices=cycle_vertices,
+                is_cyclic=bool(cycle_vertices),
+                **_maps(vertex_ids, edges),
+            )
+        )
+
+    assert sort(layered_topological_sort) == sort(_reference_layered_topological_sort)
+
+
+@settings(max_examples=500, deadline=None)
+@given(flow=flows(), data=st.data())
+def test_get_sorted_vertices_matches_reference(flow, data):
+    vertex_ids, edges = flow
+    cycle_vertices = set(find_cycle_vertices(edges))
+    stop_component_id = data.draw(st.none() | st.sampled_from(vertex_ids))
+
+    def sort(sorter):
+        maps = _maps(vertex_ids, edges)
+        return _outcome(
+            lambda: sorter(
+                vertices_ids=vertex_ids,
+                cycle_vertices=cycle_vertices,
+                stop_component_id=stop_component_id,
+                get_vertex_predecessors=lambda vertex_id: list(maps["predecessor_map"].get(vertex_id, [])),
+                get_vertex_successors=lambda vertex_id: list(maps["successor_map"].get(vertex_id, [])),
+                is_cyclic=bool(cycle_vertices),
+                **maps,
+            )
+        )
+
+    assert sort(get_sorted_vertices) == sort(_reference_get_sorted_vertices)
+
+
+@settings(max_examples=500, deadline=None)
+@given(flow=flows(), data=st.data())
+def test_start_component_keeps_the_same_vertices(flow, data):
+    """With a start component, the vertices to sort are those connected to it, as before.
+
+    Their order within the sorted layers follows the iteration order of a set, so only the vertices are compared.
+    """
+    vertex_ids, edges = flow
+    cycle_vertices = set(find_cycle_vertices(edges))
+    start_component_id = data.draw(st.sampled_from(vertex_ids))
+
+    def sort(sorter):
+        maps = _maps(vertex_ids, edges)
+        outcome = _outcome(
+            lambda: sorter(
+                vertices_ids=vertex_ids,
+                cycle_vertices=cycle_vertices,
+                start_component_id=start_component_id,
+                get_vertex_predecessors=lambda vertex_id: list(maps["predecessor_map"].get(vertex_id, [])),
+                get_vertex_successors=lambda vertex_id: list(maps["successor_map"].get(vertex_id, [])),
+                is_cyclic=bool(cycle_vertices),
+                **maps,
+            )
+        )
+        if isinstance(outcome, tuple) and isinstance(outcome[0], list):
+            first_layer, remaining_layers = outcome
+            return sorted(first_layer + [vertex_id for layer in remaining_layers for vertex_id in layer])
+        return outcome
+
+    assert sort(get_sorted_vertices) == sort(_reference_get_sorted_vertices)
+
+
+@pytest.mark.parametrize("size", [10, 1_000])
+def test_wide_fan_in_is_sorted_in_two_layers(size):
+    sources = [f"TextInput-{index}" for index in range(size)]
+    edges = [(source, "ChatOutput-sink") for source in sources]
+    layers = layered_topological_sort(
+        vertices_ids={*sources, "ChatOutput-sink"}, **_maps([*sources, "ChatOutput-sink"], edges)
+    )
+    assert sorted(layers[0]) == sorted(sources)
+    assert layers[1:] == [["ChatOutput-sink"]]
@@ -0,0 +1,114 @@
+import tracemalloc
+
+import pytest
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.graph.vertex.profiling import (
+    VertexProfile,
+    VertexProfileStats,
+    get_vertex_profile_stats,
+    profile_phase,
+    vertex_profile_var,
+)
+from langflow.services.deps import get_settings_service
+
+
+@pytest.fixture
+def graph():
+    chat_input = ChatInput(_id="ChatInput-profile")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(_id="ChatOutput-profile")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    return Graph.from_payload(Graph(chat_input, chat_output).dump()["data"])
+
+
+def test_profile_phase_without_active_profile_is_a_no_op():
+    @profile_phase("decorated")
+    def add(a, b):
+        return a + b
+
+    assert vertex_profile_var.get() is None
+    with profile_phase("block"):
+        pass
+    assert add(1, 2) == 3
+
+
+async def test_profile_phase_accumulates_calls():
+    @profile_phase("decorated")
+    async def work():
+        return "done"
+
+    profile = VertexProfile()
+    token = vertex_profile_var.set(profile)
+    try:
+        assert await work() == "done"
+        assert await work() == "done"
+        with profile_phase("block"):
+            sum(range(1000))
+    finally:
+        vertex_profile_var.reset(token)
+
+    assert profile.phases["decorated"].calls == 2
+    assert profile.phases["block"].calls == 1
+    assert profile.phases["block"].wall_time >= 0
+    assert profile.to_dict()["block"]["memory_delta_bytes"] is None
+
+
+def test_profile_phase_measures_memory_delta_while_tracing():
+    profile = VertexProfile()
+    token = vertex_profile_var.set(profile)
+    tracemalloc.start()
+    try:
+        with profile_phase("allocate"):
+            data = bytearray(1024 * 1024)
+        with profile_phase("free"):
+            del data
+    finally:
+        tracemalloc.stop()
+        vertex_profile_var.reset(token)
+
+    # The net change in traced memory, give or take what the interpreter allocates or frees on the way
+    assert abs(profile.phases["allocate"].memory_delta_bytes - 1024 * 1024) < 64 * 1024
+    assert abs(profile.phases["free"].memory_delta_bytes + 1024 * 1024) < 64 * 1024
+
+
+async def test_graph_run_profiles_each_vertex(graph):
+    get_vertex_profile_stats().clear()
+
+    await graph.arun([{"input_value": "hello"}], outputs=["ChatOutput-profile"])
+
+    for vertex in graph.vertices:
+        assert {"build", "params", "load_variables", "build_results"} <= vertex.profile.phases.keys()
+        build = vertex.profile.phases["build"]
+        assert build.wall_time >= vertex.profile.phases["build_results"].wall_time
+    histograms = get_vertex_profile_stats().histograms("ChatOutput")
+    assert {histogram.phase for histogram in histograms} >= {"build", "build_results"}
+    assert all(histogram.count == 1 for histogram in histograms if histogram.phase == "build")
+
+
+async def test_graph_run_without_profiling(graph, monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "profile_vertex_builds", False)
+    get_vertex_profile_stats().clear()
+
+    await graph.arun([{"input_value": "hello"}], outputs=["ChatOutput-profile"])
+
+    assert all(vertex.profile is None for vertex in graph.vertices)
+    assert get_vertex_profile_stats().histograms() == []
+
+
+def test_profile_stats_buckets_are_cumulative():
+    stats = VertexProfileStats()
+    for wall_time in (0.002, 0.2, 100.0):
+        profile = VertexProfile()
+        profile.add("build", wall_time, 0.0, None)
+        stats.record("Component", profile)
+
+    (histogram,) = stats.histograms()
+    assert histogram.count == 3
+    assert histogram.buckets["0.001"] == 0
+    assert histogram.buckets["0.005"] == 1
+    assert histogram.buckets["0.25"] == 2
+    assert histogram.buckets["60.0"] == 2
+    assert histogram.buckets["+Inf"] == 3
+    assert histogram.memory_delta_bytes_sum is None
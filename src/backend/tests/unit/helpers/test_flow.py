@@ -0,0 +1,44 @@
+from httpx import AsyncClient
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput
+from langflow.graph import Graph
+from langflow.helpers.flow import clear_flow_graph_templates, get_flow_graph_template, load_flow, run_flow
+
+
+def _flow_data():
+    chat_input = ChatInput(_id="ChatInput-sub")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(_id="ChatOutput-sub")
+    chat_output.set(input_value=chat_input.message_response, should_store_message=False)
+    return Graph(chat_input, chat_output).dump()["data"]
+
+
+async def test_sub_flow_graph_template_is_reused_and_tweaked_per_run(
+    client: AsyncClient, logged_in_headers, active_user
+):
+    clear_flow_graph_templates()
+    response = await client.post(
+        "api/v1/flows/",
+        json={"name": "Sub Flow", "data": _flow_data(), "is_component": False},
+        headers=logged_in_headers,
+    )
+    flow_id = response.json()["id"]
+    user_id = str(active_user.id)
+
+    template = await get_flow_graph_template(user_id, flow_id=flow_id)
+    assert await get_flow_graph_template(user_id, flow_id=flow_id) is template
+    assert await get_flow_graph_template(user_id, flow_name="Sub Flow") is template
+
+    graph = await load_flow(user_id, flow_id=flow_id, tweaks={"ChatInput-sub": {"input_value": "tweaked"}})
+    assert graph is not template
+    assert graph.get_vertex("ChatInput-sub").params["input_value"] == "tweaked"
+    assert template.get_vertex("ChatInput-sub").params["input_value"] != "tweaked"
+
+    run_outputs = await run_flow(
+        flow_id=flow_id, user_id=user_id, output_type="any", tweaks={"ChatInput-sub": {"input_value": "hello"}}
+    )
+    assert run_outputs[0].outputs[0].results["message"].text == "hello"
+
+    # Updating the flow bumps updated_at, so the next call parses a new template
+    await client.patch(f"api/v1/flows/{flow_id}", json={"description": "changed"}, headers=logged_in_headers)
+    assert await get_flow_graph_template(user_id, flow_id=flow_id) is not template
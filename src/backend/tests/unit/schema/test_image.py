@@ -3,9 +3,11 @@ import tempfile
 import aiofiles
 import pytest
 from langflow.schema.image import (
+    detect_image_format,
     get_file_paths,
     get_files,
     is_image_file,
+    with_image_extension,
 )
 from PIL import Image as PILImage
 
@@ -39,6 +41,32 @@ def test_is_image_file__not_image(file_txt):
     assert is_image_file(file_txt) is False
 
 
+def test_detect_image_format(file_image, file_txt):
+    assert detect_image_format(file_image) == "PNG"
+    assert detect_image_format(file_txt) is None
+
+
+def test_detect_image_format_restores_file_position(file_image):
+    with open(file_image, "rb") as f:  # noqa: PTH123
+        f.seek(3)
+        detect_image_format(f)
+        assert f.tell() == 3
+
+
+@pytest.mark.parametrize(
+    ("file_name", "image_format", "expected"),
+    [
+        ("photo", "PNG", "photo.png"),
+        ("photo.png", "PNG", "photo.png"),
+        ("photo.jpeg", "JPEG", "photo.jpeg"),
+        ("photo.txt", "PNG", "photo.txt.png"),
+        ("notes.txt", None, "notes.txt"),
+    ],
+)
+def test_with_image_extension(file_name, image_format, expected):
+    assert with_image_extension(file_name, image_format) == expected
+
+
 def test_get_file_paths(file_image, file_txt):
     files = [file_image, file_txt]
 
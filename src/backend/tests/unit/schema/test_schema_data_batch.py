@@ -0,0 +1,77 @@
+import copy
+import pickle
+
+import pytest
+from langchain_core.documents import Document
+from langflow.schema.data import Data
+from langflow.schema.data_batch import DataBatch
+from langflow.schema.dataframe import DataFrame
+from langflow.serialization.serialization import serialize
+
+
+@pytest.fixture
+def records():
+    return [{"text": "first chunk", "page": 1}, {"text": "second chunk"}, {"text": "third chunk", "page": 3}]
+
+
+class TestDataBatch:
+    def test_items_are_data(self, records):
+        """Test that indexing and iterating materialize Data objects with the batch's text key."""
+        batch = DataBatch.from_records(records, text_key="text", default_value="n/a")
+        assert len(batch) == 3
+        assert isinstance(batch[0], Data)
+        assert batch[0].get_text() == "first chunk"
+        assert batch[-1].data == {"text": "third chunk", "page": 3}
+        assert [item.data for item in batch] == records
+        assert batch.to_data_list() == [Data(data=record) for record in records]
+        with pytest.raises(IndexError):
+            batch[3]
+
+    def test_missing_keys_stay_missing(self, records):
+        """Test that a record lacking a key is rebuilt without it, while columns fill it with None."""
+        batch = DataBatch.from_records(records)
+        assert "page" not in batch[1].data
+        assert batch.column("page") == [1, None, 3]
+        assert batch.to_columns() == {"text": ["first chunk", "second chunk", "third chunk"], "page": [1, None, 3]}
+
+    def test_slice_returns_batch(self, records):
+        batch = DataBatch.from_records(records)
+        sliced = batch[1:]
+        assert isinstance(sliced, DataBatch)
+        assert list(sliced.records()) == records[1:]
+
+    def test_from_documents_matches_data(self):
+        """Test that a batch from Documents holds the same payloads as Data built from them."""
+        documents = [Document(page_content="hello", metadata={"source": "a.txt"}), Document(page_content="world")]
+        batch = DataBatch.from_documents(documents)
+        assert batch == [Data(text=doc.page_content, data=dict(doc.metadata)) for doc in documents]
+
+    def test_append_accepts_data(self):
+        batch = DataBatch()
+        batch.append(Data(data={"text": "a"}))
+        batch.append({"text": "b", "extra": True})
+        assert list(batch.records()) == [{"text": "a"}, {"text": "b", "extra": True}]
+
+    def test_columns_must_have_same_length(self):
+        with pytest.raises(ValueError, match="same length"):
+            DataBatch({"text": ["a", "b"], "page": [1]})
+
+    def test_pickle_and_copy(self, records):
+        batch = DataBatch.from_records(records)
+        assert pickle.loads(pickle.dumps(batch)) == batch  # noqa: S301
+        copied = copy.deepcopy(batch)
+        assert copied == batch
+        assert "page" not in copied[1].data
+
+    def test_dataframe_round_trip(self, records):
+        """Test that a DataFrame is built from the columns and converts back to a batch."""
+        batch = DataBatch.from_records(records)
+        data_frame = DataFrame(batch)
+        assert list(data_frame.columns) == ["text", "page"]
+        assert data_frame["text"].tolist() == ["first chunk", "second chunk", "third chunk"]
+        assert DataFrame(batch).to_data_batch().column("text") == batch.column("text")
+
+    def test_serialize_like_list_of_data(self, records):
+        batch = DataBatch.from_records(records)
+        assert serialize(batch) == serialize(batch.to_data_list())
+        assert serialize(batch, max_items=2) == serialize(batch.to_data_list(), max_items=2)
@@ -1,8 +1,10 @@
 import pandas as pd
 import pytest
 from langchain_core.documents import Document
+from langflow.schema.artifact import ArtifactType, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.dataframe import DataFrame
+from langflow.serialization.constants import MAX_ITEMS_LENGTH
 
 
 @pytest.fixture
@@ -64,3 +66,76 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+
+def test_artifact_previews_first_rows():
+    """Test that the artifact of a large DataFrame holds only the rows serialize() would keep."""
+    data_frame = DataFrame({"value": range(MAX_ITEMS_LENGTH + 10)})
+    raw, artifact_type = post_process_raw(data_frame, ArtifactType.ARRAY.value)
+    assert artifact_type == ArtifactType.ARRAY.value
+    assert len(raw) == MAX_ITEMS_LENGTH
+    assert raw[0] == {"value": 0}
+
+
+def _buffer_address(data_frame: DataFrame, column: str) -> int:
+    """Address of the values buffer of the first chunk of an Arrow-backed column."""
+    return data_frame[column].array._pa_array.chunk(0).buffers()[-1].address
+
+
+class TestArrowStorage:
+    @pytest.fixture(autouse=True)
+    def pa(self):
+        return pytest.importorskip("pyarrow")
+
+    @pytest.fixture
+    def arrow_dataframe(self):
+        return DataFrame({"name": ["John", "Jane", None], "age": [30, 25, 40]}, text_key="name").to_arrow_backed()
+
+    def test_to_arrow_backed(self, arrow_dataframe):
+        """Test that the columns become Arrow arrays and the DataFrame keeps its text key."""
+        assert arrow_dataframe.is_arrow_backed
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in arrow_dataframe.dtypes)
+        assert arrow_dataframe.text_key == "name"
+        assert arrow_dataframe.to_arrow_backed() is arrow_dataframe
+        assert arrow_dataframe.to_data_list()[1].data == {"name": "Jane", "age": 25}
+
+    def test_slicing_and_projection_share_buffers(self, arrow_dataframe):
+        address = _buffer_address(arrow_dataframe, "age")
+        assert _buffer_address(arrow_dataframe[["age"]], "age") == address
+        assert _buffer_address(arrow_dataframe.head(2), "age") == address
+        assert _buffer_address(arrow_dataframe.iloc[1:], "age") == address
+
+    def test_arrow_round_trip(self, arrow_dataframe):
+        table = arrow_dataframe.to_arrow()
+        assert table.column_names == ["name", "age"]
+        restored = DataFrame.from_arrow(table, text_key="name")
+        assert restored.is_arrow_backed
+        assert _buffer_address(restored, "age") == _buffer_address(arrow_dataframe, "age")
+
+    def test_add_rows_keeps_arrow_storage(self, arrow_dataframe):
+        """Test that added rows are converted at once and the existing rows are not copied."""
+        new_df = arrow_dataframe.add_rows([{"name": "Bob", "age": 50}, Data(data={"name": "Alice", "age": 20})])
+        assert new_df.is_arrow_backed
+        assert new_df["name"].tolist()[-2:] == ["Bob", "Alice"]
+        assert _buffer_address(new_df, "age") == _buffer_address(arrow_dataframe, "age")
+
+    def test_mixed_columns_stay_in_pandas_storage(self):
+        data_frame = DataFrame([{"value": {"nested": 1}}, {"value": "text"}])
+        assert data_frame.to_arrow_backed() is data_frame
+        assert not data_frame.is_arrow_backed
+
+    def test_spill_memory_maps_the_rows(self, pa, tmp_path):
+        """Test that a DataFrame above the threshold is memory-mapped rather than allocated."""
+        data_frame = DataFrame({"value": range(100_000)}).to_arrow_backed()
+        allocated = pa.total_allocated_bytes()
+        spilled = data_frame.to_arrow_backed(spill_threshold=0, spill_dir=tmp_path)
+        assert spilled is not data_frame
+        assert spilled["value"].sum() == data_frame["value"].sum()
+        assert pa.total_allocated_bytes() - allocated < data_frame.memory_usage().sum()
+        assert _buffer_address(spilled, "value") != _buffer_address(data_frame, "value")
+        # The mapping outlives the file
+        assert not any(tmp_path.iterdir())
+
+    def test_no_spill_below_threshold(self, arrow_dataframe, tmp_path):
+        assert arrow_dataframe.to_arrow_backed(spill_threshold=2**20, spill_dir=tmp_path) is arrow_dataframe
+        assert not any(tmp_path.iterdir())
@@ -134,6 +134,16 @@ def test_message_with_multiple_images(sample_image, langflow_cache_dir):
     )
 
 
+def test_message_construction_does_not_open_files(monkeypatch):
+    def fail_open(*args, **kwargs):  # noqa: ARG001
+        msg = "Building a message should not open its files"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr("PIL.Image.open", fail_open)
+    message = Message(text="With files", sender=MESSAGE_SENDER_USER, files=["test_flow/image.png", "test_flow/a.txt"])
+    assert message.files == ["test_flow/image.png", "test_flow/a.txt"]
+
+
 def test_message_with_invalid_image_path():
     """Test handling of invalid image path."""
     file_path = "test_flow/non_existent.png"
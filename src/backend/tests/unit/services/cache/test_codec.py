@@ -0,0 +1,134 @@
+from datetime import datetime, timezone
+
+import dill
+import pandas as pd
+import pytest
+from langflow.schema.data import Data
+from langflow.schema.dataframe import DataFrame
+from langflow.schema.message import Message
+from langflow.services.cache.codec import DATA, DATAFRAME, DILL, JSON, MESSAGE, PICKLE, CacheCodec
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return isinstance(other, Point) and (self.x, self.y) == (other.x, other.y)
+
+
+@pytest.fixture
+def codec():
+    return CacheCodec()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, True, 0, 1.5, "text", [1, "a", None], {"a": {"b": [1.0, 2.0]}, "c": "d"}],
+)
+def test_primitives_are_stored_as_json(codec, value):
+    encoded = codec.encode(value)
+
+    assert encoded[0] == JSON
+    assert codec.decode(encoded) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [(1, 2), {1: "a"}, {"a": {1, 2}}, float("nan"), 2**70, datetime.now(timezone.utc), Point(1, 2)],
+)
+def test_other_values_are_pickled(codec, value):
+    encoded = codec.encode(value)
+    decoded = codec.decode(encoded)
+
+    assert encoded[0] == PICKLE
+    assert type(decoded) is type(value)
+    assert decoded == value or value != value  # noqa: PLR0124
+
+
+def test_values_pickle_cannot_handle_use_dill(codec):
+    def build():
+        return "built"
+
+    encoded = codec.encode({"build": build})
+
+    assert encoded[0] == DILL
+    assert codec.decode(encoded)["build"]() == "built"
+
+
+def test_data(codec):
+    data = Data(data={"text": "hello", "score": 0.5}, default_value="")
+    encoded = codec.encode(data)
+    decoded = codec.decode(encoded)
+
+    assert encoded[0] == DATA
+    assert type(decoded) is Data
+    assert decoded == data
+    assert decoded.default_value == ""
+
+
+def test_data_with_other_values_is_pickled(codec):
+    data = Data(data={"created": datetime.now(timezone.utc)})
+    encoded = codec.encode(data)
+
+    assert encoded[0] == PICKLE
+    assert codec.decode(encoded) == data
+
+
+def test_message(codec):
+    message = Message(text="hello", sender="User", sender_name="User", session_id="session", properties={"icon": "x"})
+    encoded = codec.encode(message)
+    decoded = codec.decode(encoded)
+
+    assert encoded[0] == MESSAGE
+    assert type(decoded) is Message
+    assert decoded == message
+    assert decoded.properties == message.properties
+
+
+def test_dataframe(codec):
+    pytest.importorskip("pyarrow")
+    frame = DataFrame(
+        pd.DataFrame({"text": ["a", "b", None], "score": [1.0, 2.0, 3.0]}), text_key="text", default_value="none"
+    )
+    encoded = codec.encode(frame)
+    decoded = codec.decode(encoded)
+
+    assert encoded[0] == DATAFRAME
+    assert type(decoded) is DataFrame
+    pd.testing.assert_frame_equal(decoded, frame)
+    assert (decoded.text_key, decoded.default_value) == ("text", "none")
+
+
+def test_dataframe_with_lists_is_pickled(codec):
+    frame = DataFrame(pd.DataFrame({"tags": [["a"], ["b", "c"]]}))
+    encoded = codec.encode(frame)
+
+    assert encoded[0] == PICKLE
+    assert codec.decode(encoded)["tags"].tolist() == [["a"], ["b", "c"]]
+
+
+def test_values_cached_with_dill_are_read(codec):
+    assert codec.decode(dill.dumps({"a": Data(data={"text": "x"})}, recurse=True)) == {"a": Data(data={"text": "x"})}
+
+
+@pytest.mark.parametrize(("compression", "module"), [("zstd", "zstandard"), ("lz4", "lz4")])
+def test_compression_above_threshold(compression, module):
+    pytest.importorskip(module)
+    codec = CacheCodec(compression=compression, compression_threshold=1024)
+    small, large = "x" * 100, "x" * 100_000
+
+    encoded_small, encoded_large = codec.encode(small), codec.encode(large)
+
+    assert encoded_small[1] == 0
+    assert encoded_large[1] != 0
+    assert len(encoded_large) < len(large) // 10
+    assert codec.decode(encoded_small) == small
+    # Any codec reads compressed values, whatever compression it writes
+    assert CacheCodec().decode(encoded_large) == large
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError, match="Unknown compression"):
+        CacheCodec(compression="gzip")
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from langflow.schema.data import Data
+from langflow.services.cache.service import RedisCache
+from langflow.services.cache.utils import CACHE_MISS
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def cache():
+    server = fakeredis.FakeServer()
+    # Connects once outside the event loop, as the first connection reads the command table and package metadata
+    fakeredis.FakeRedis(server=server).ping()
+    cache = RedisCache(expiration_time=60)
+    cache._client = fakeredis.FakeAsyncRedis(server=server)
+    return cache
+
+
+async def test_set_and_get(cache):
+    await cache.set("text", "value")
+    await cache.set("data", Data(data={"text": "hello"}))
+
+    assert await cache.get("text") == "value"
+    assert await cache.get("data") == Data(data={"text": "hello"})
+    assert await cache.get("missing") is CACHE_MISS
+    assert await cache.get(None) is CACHE_MISS
+
+
+async def test_values_are_read_with_one_command(cache, monkeypatch):
+    await cache.set("text", "value")
+    await cache.set("result", {"built": True})
+
+    async def fail_get(*_, **__):
+        pytest.fail("values stored by the cache should be read with HGETALL only")
+
+    monkeypatch.setattr(cache._client, "get", fail_get)
+
+    assert await cache._client.type("text") == b"hash"
+    assert await cache.get("text") == "value"
+    assert await cache.get("result") == {"built": True}
+    assert await cache.get("missing") is CACHE_MISS
+
+
+async def test_values_cached_as_strings_are_read(cache):
+    await cache._client.setex("text", 60, cache.codec.encode("value"))
+
+    assert await cache.get("text") == "value"
+
+
+async def test_dictionaries_are_stored_as_hashes(cache):
+    await cache.set("result", {"built": True, "data": Data(data={"text": "hello"})})
+
+    assert await cache._client.type("result") == b"hash"
+    assert 0 < await cache._client.ttl("result") <= 60
+    assert await cache.get("result") == {"built": True, "data": Data(data={"text": "hello"})}
+
+
+async def test_set_replaces_hash_fields(cache):
+    await cache.set("result", {"a": 1, "b": 2})
+    await cache.set("result", {"c": 3})
+
+    assert await cache.get("result") == {"c": 3}
+
+
+async def test_set_replaces_value_of_other_type(cache):
+    await cache.set("key", "value")
+    await cache.set("key", {"a": 1})
+    assert await cache.get("key") == {"a": 1}
+
+    await cache.set("key", "value")
+    assert await cache.get("key") == "value"
+
+
+async def test_upsert_updates_fields_on_server(cache, monkeypatch):
+    await cache.set("result", {"a": 1, "b": 2})
+
+    async def fail_get(*_, **__):
+        pytest.fail("upsert of a dictionary should not read it")
+
+    monkeypatch.setattr(cache, "get", fail_get)
+    await cache.upsert("result", {"b": 3, "c": 4})
+    monkeypatch.undo()
+
+    assert await cache.get("result") == {"a": 1, "b": 3, "c": 4}
+
+
+async def test_concurrent_upserts_are_not_lost(cache):
+    await asyncio.gather(*(cache.upsert("result", {f"field {index}": index}) for index in range(50)))
+
+    assert await cache.get("result") == {f"field {index}": index for index in range(50)}
+
+
+async def test_upsert_merges_dictionary_stored_as_string(cache):
+    await cache._client.setex("result", 60, cache.codec.encode({"a": 1}))
+
+    await cache.upsert("result", {"b": 2})
+
+    assert await cache.get("result") == {"a": 1, "b": 2}
+
+
+async def test_upsert_merges_dictionary_stored_whole(cache):
+    await cache.set("result", {1: "a"})
+
+    await cache.upsert("result", {"b": 2})
+
+    assert await cache.get("result") == {1: "a", "b": 2}
+
+
+async def test_upsert_replaces_other_value_stored_whole(cache):
+    await cache.set("key", "value")
+
+    await cache.upsert("key", {"b": 2})
+
+    assert await cache.get("key") == {"b": 2}
+
+
+async def test_upsert_other_values(cache):
+    await cache.upsert("key", "value")
+    assert await cache.get("key") == "value"
+
+    await cache.upsert("key", {1: "a"})
+    assert await cache.get("key") == {1: "a"}
+
+
+async def test_delete_and_contains(cache):
+    await cache.set("result", {"a": 1})
+    assert await cache.contains("result")
+
+    await cache.delete("result")
+
+    assert not await cache.contains("result")
@@ -0,0 +1,102 @@
+import time
+from itertools import count
+
+import pytest
+from langflow.graph import Graph
+from langflow.services.deps import get_settings_service
+from langflow.services.state.service import InMemoryStateService
+
+
+@pytest.fixture
+def service():
+    return InMemoryStateService(get_settings_service())
+
+
+def test_states_are_scoped_to_runs(service):
+    service.update_state("answer", "first", run_id="run-1")
+    service.append_state("history", "a", run_id="run-1")
+    service.append_state("history", "b", run_id="run-1")
+    service.update_state("answer", "second", run_id="run-2")
+
+    assert service.get_state("answer", run_id="run-1") == "first"
+    assert service.get_state("history", run_id="run-1") == ["a", "b"]
+    assert service.get_state("answer", run_id="run-2") == "second"
+    assert service.get_state("history", run_id="run-2") == ""
+
+
+def test_observers_are_scoped_to_runs(service):
+    calls = []
+
+    def observer(key, new_state, *, append):
+        calls.append((key, new_state, append))
+
+    service.subscribe("answer", observer, run_id="run-1")
+    service.update_state("answer", "other run", run_id="run-2")
+    service.update_state("answer", "value", run_id="run-1")
+    service.append_state("answer", "more", run_id="run-1")
+    service.unsubscribe("answer", observer, run_id="run-1")
+    service.update_state("answer", "unsubscribed", run_id="run-1")
+
+    assert calls == [("answer", "value", False), ("answer", "more", True)]
+
+
+def test_observer_can_read_state(service):
+    """Observers are called without holding the lock, so they can read the state that changed."""
+    seen = []
+    service.subscribe("answer", lambda key, _, **__: seen.append(service.get_state(key, "run")), run_id="run")
+    service.update_state("answer", "value", run_id="run")
+
+    assert seen == ["value"]
+
+
+def test_failing_observer_does_not_stop_others(service):
+    calls = []
+
+    def failing(*_, **__):
+        msg = "observer error"
+        raise RuntimeError(msg)
+
+    service.subscribe("answer", failing, run_id="run")
+    service.subscribe("answer", lambda *_, **__: calls.append("called"), run_id="run")
+    service.update_state("answer", "value", run_id="run")
+
+    assert calls == ["called"]
+
+
+def test_release_run(service):
+    service.update_state("answer", "value", run_id="run")
+    service.subscribe("answer", lambda *_, **__: None, run_id="run")
+    assert service.run_count == 1
+
+    service.release_run("run")
+    service.release_run("unknown run")
+
+    assert service.run_count == 0
+    assert service.get_state("answer", run_id="run") == ""
+
+
+def test_unused_runs_expire(service, monkeypatch):
+    monkeypatch.setattr(service.settings_service.settings, "run_state_ttl", 10)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    service.update_state("answer", "value", run_id="run")
+    shard = service._shard("run")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    # Expired runs are swept when a new run starts in their shard
+    new_run_id = next(f"new run {index}" for index in count() if service._shard(f"new run {index}") is shard)
+    service.update_state("answer", "value", run_id=new_run_id)
+
+    assert service.get_state("answer", run_id="run") == ""
+    assert service.run_count == 1
+
+
+async def test_graph_releases_state_when_run_ends():
+    graph = Graph()
+    graph.set_run_id()
+    graph.update_state("answer", "value")
+    assert graph.get_state("answer") == "value"
+
+    await graph.end_all_traces()
+
+    assert graph.get_state("answer") == ""
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.storage.local import LocalStorageService
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+    return LocalStorageService(session_service=None, settings_service=settings_service)
+
+
+async def _chunks(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+async def _read(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+async def test_save_file_stream(storage_service):
+    size = await storage_service.save_file_stream("flow", "data.bin", _chunks(CONTENT, 100))
+
+    assert size == len(CONTENT)
+    assert await storage_service.get_file("flow", "data.bin") == CONTENT
+    assert await storage_service.list_files("flow") == ["data.bin"]
+
+
+async def test_save_file_stream_failure_keeps_previous_file(storage_service):
+    await storage_service.save_file("flow", "data.bin", b"previous")
+
+    async def failing_chunks():
+        yield b"partial"
+        msg = "upload interrupted"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await storage_service.save_file_stream("flow", "data.bin", failing_chunks())
+
+    assert await storage_service.get_file("flow", "data.bin") == b"previous"
+    assert await storage_service.list_files("flow") == ["data.bin"]
+
+
+async def test_get_file_stream_ranges(storage_service):
+    await storage_service.save_file("flow", "data.bin", CONTENT)
+
+    chunks = await _read(await storage_service.get_file_stream("flow", "data.bin", chunk_size=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 124]
+    assert b"".join(chunks) == CONTENT
+
+    chunks = await _read(await storage_service.get_file_stream("flow", "data.bin", start=10, end=710, chunk_size=300))
+    assert b"".join(chunks) == CONTENT[10:710]
+
+    assert (
+        b"".join(await _read(await storage_service.get_file_stream("flow", "data.bin", start=1000))) == CONTENT[1000:]
+    )
+
+
+async def test_get_file_stream_missing_file(storage_service):
+    with pytest.raises(FileNotFoundError):
+        await storage_service.get_file_stream("flow", "missing.bin")
@@ -0,0 +1,99 @@
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from langflow.services.storage import s3
+from langflow.services.storage.s3 import S3StorageService
+
+CONTENT = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def s3_client():
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "upload"}
+    client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag {kwargs['PartNumber']}"}
+    return client
+
+
+@pytest.fixture
+def storage_service(s3_client, tmp_path):
+    settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+    with patch.object(s3.boto3, "client", return_value=s3_client):
+        return S3StorageService(session_service=None, settings_service=settings_service)
+
+
+async def _chunks(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+async def _read(stream) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+async def test_save_small_file_stream(storage_service, s3_client):
+    # Called by keyword, like the files API does
+    size = await storage_service.save_file_stream(flow_id="flow", file_name="data.bin", chunks=_chunks(CONTENT, 100))
+
+    assert size == len(CONTENT)
+    s3_client.put_object.assert_called_once_with(Bucket="langflow", Key="flow/data.bin", Body=CONTENT)
+    s3_client.create_multipart_upload.assert_not_called()
+
+
+async def test_save_file_stream_in_parts(storage_service, s3_client, monkeypatch):
+    monkeypatch.setattr(s3, "MULTIPART_PART_SIZE", 300)
+
+    size = await storage_service.save_file_stream(flow_id="flow", file_name="data.bin", chunks=_chunks(CONTENT, 100))
+
+    assert size == len(CONTENT)
+    parts = [call.kwargs["Body"] for call in s3_client.upload_part.call_args_list]
+    assert [len(part) for part in parts] == [300, 300, 300, 124]
+    assert b"".join(parts) == CONTENT
+    s3_client.complete_multipart_upload.assert_called_once_with(
+        Bucket="langflow",
+        Key="flow/data.bin",
+        UploadId="upload",
+        MultipartUpload={"Parts": [{"ETag": f"etag {number}", "PartNumber": number} for number in range(1, 5)]},
+    )
+    s3_client.put_object.assert_not_called()
+
+
+async def test_failed_file_stream_aborts_upload(storage_service, s3_client, monkeypatch):
+    monkeypatch.setattr(s3, "MULTIPART_PART_SIZE", 300)
+
+    async def failing_chunks():
+        yield CONTENT
+        msg = "upload interrupted"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await storage_service.save_file_stream(flow_id="flow", file_name="data.bin", chunks=failing_chunks())
+
+    s3_client.abort_multipart_upload.assert_called_once_with(Bucket="langflow", Key="flow/data.bin", UploadId="upload")
+    s3_client.complete_multipart_upload.assert_not_called()
+
+
+async def test_get_file_stream(storage_service, s3_client):
+    body = io.BytesIO(CONTENT)
+    s3_client.get_object.return_value = {"Body": body}
+
+    chunks = await _read(await storage_service.get_file_stream(flow_id="flow", file_name="data.bin", chunk_size=300))
+
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 124]
+    assert b"".join(chunks) == CONTENT
+    s3_client.get_object.assert_called_once_with(Bucket="langflow", Key="flow/data.bin")
+    assert body.closed
+
+
+async def test_get_file_stream_range(storage_service, s3_client):
+    s3_client.get_object.return_value = {"Body": io.BytesIO(CONTENT[10:710])}
+
+    stream = await storage_service.get_file_stream(flow_id="flow", file_name="data.bin", start=10, end=710)
+
+    assert b"".join(await _read(stream)) == CONTENT[10:710]
+    s3_client.get_object.assert_called_once_with(Bucket="langflow", Key="flow/data.bin", Range="bytes=10-709")
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from langflow.custom import Component
+from langflow.graph.vertex.profiling import profile_vertex_build
+from langflow.io import Output
+from langflow.schema.data import Data
+from langflow.services.telemetry import event_loop_watchdog
+from langflow.services.telemetry.event_loop_watchdog import (
+    UNKNOWN_COMPONENT,
+    EventLoopStall,
+    EventLoopWatchdog,
+    require_main_loop,
+)
+from langflow.services.telemetry.runtime_metrics import EventLoopLagMonitor, get_runtime_counters
+from langflow.utils.async_helpers import MainLoopRequiredError, run_in_worker_loop
+
+
+@pytest.fixture
+def runtime_counters():
+    counters = get_runtime_counters()
+    counters.clear()
+    yield counters
+    counters.clear()
+
+
+def _blocking_call(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class ThreadReportingComponent(Component):
+    outputs = [Output(display_name="Thread", name="thread", method="get_thread")]
+
+    async def get_thread(self) -> Data:
+        return Data(data={"thread": threading.get_ident()})
+
+
+class DatabaseComponent(Component):
+    outputs = [Output(display_name="Thread", name="thread", method="get_thread")]
+
+    async def get_thread(self) -> Data:
+        require_main_loop("The database")
+        return Data(data={"thread": threading.get_ident()})
+
+
+def test_check_reports_a_stall_once(runtime_counters):
+    monitor = EventLoopLagMonitor(interval=0.5)
+    watchdog = EventLoopWatchdog(monitor, threshold=1.0)
+    monitor.last_beat = 100.0
+
+    assert watchdog.check(now=101.0) is None
+    stall = watchdog.check(now=102.0)
+    assert stall is not None
+    assert stall.duration == pytest.approx(2.0)
+    assert stall.component == UNKNOWN_COMPONENT
+    # The same missed heartbeat is not reported again
+    assert watchdog.check(now=103.0) is None
+    assert runtime_counters.stalls() == {UNKNOWN_COMPONENT: 1}
+
+
+async def test_stall_is_attributed_to_the_vertex_being_built(runtime_counters):
+    monitor = EventLoopLagMonitor(interval=0.01)
+    watchdog = EventLoopWatchdog(monitor, threshold=0.05, offload=True)
+    vertex = SimpleNamespace(id="SlowComponent-abc", vertex_type="SlowComponent", profile=None)
+    monitor.start()
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.05)
+        with profile_vertex_build(vertex, enabled=False):
+            _blocking_call(0.5)
+        await asyncio.sleep(0.05)
+    finally:
+        await watchdog.stop()
+        await monitor.stop()
+
+    assert runtime_counters.stalls() == {"SlowComponent": 1}
+    assert watchdog.is_offloaded("SlowComponent")
+    assert not watchdog.is_offloaded("ChatInput")
+
+
+async def test_stall_captures_the_blocking_frame():
+    monitor = EventLoopLagMonitor(interval=0.01)
+    watchdog = EventLoopWatchdog(monitor, threshold=0.05)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        stalls = []
+
+        def check_while_blocked():
+            time.sleep(0.2)
+            stalls.append(watchdog.check())
+
+        checker = threading.Thread(target=check_while_blocked)
+        checker.start()
+        _blocking_call(0.4)
+        checker.join()
+    finally:
+        await monitor.stop()
+
+    assert stalls[0] is not None
+    assert any("in _blocking_call" in frame for frame in stalls[0].stack)
+
+
+async def test_offloaded_component_outputs_run_in_a_worker_thread(monkeypatch):
+    watchdog = EventLoopWatchdog(EventLoopLagMonitor())
+    monkeypatch.setattr("langflow.custom.custom_component.component.get_event_loop_watchdog", lambda: watchdog)
+
+    async def get_thread() -> int:
+        component = ThreadReportingComponent()
+        component._vertex = SimpleNamespace(vertex_type="ThreadReportingComponent")
+        result = await component._get_output_result(component._outputs_map["thread"])
+        return result.data["thread"]
+
+    assert await get_thread() == threading.get_ident()
+    watchdog.offloaded_components.add("ThreadReportingComponent")
+    assert await get_thread() != threading.get_ident()
+
+
+async def test_main_loop_services_are_refused_on_worker_loops():
+    async def use_database():
+        require_main_loop("The database")
+
+    with pytest.raises(MainLoopRequiredError, match="The database"):
+        await run_in_worker_loop(use_database)
+    # The caller's loop is not affected
+    require_main_loop("The database")
+
+
+async def test_components_using_main_loop_services_are_not_offloaded(monkeypatch):
+    watchdog = EventLoopWatchdog(EventLoopLagMonitor(), offload=True)
+    monkeypatch.setattr(event_loop_watchdog, "_event_loop_watchdog", watchdog)
+    vertex = SimpleNamespace(id="Memory-abc", vertex_type="MemoryComponent", profile=None)
+
+    with profile_vertex_build(vertex, enabled=False):
+        require_main_loop("The database")
+    watchdog._report(EventLoopStall(duration=2.0, component="MemoryComponent", vertex_id=vertex.id))
+
+    assert watchdog.main_loop_components == {"MemoryComponent"}
+    assert not watchdog.is_offloaded("MemoryComponent")
+
+
+async def test_offloaded_component_using_main_loop_services_returns_to_the_main_loop(monkeypatch):
+    watchdog = EventLoopWatchdog(EventLoopLagMonitor(), offload=True)
+    monkeypatch.setattr("langflow.custom.custom_component.component.get_event_loop_watchdog", lambda: watchdog)
+    watchdog.offloaded_components.add("DatabaseComponent")
+    component = DatabaseComponent()
+    component._vertex = SimpleNamespace(vertex_type="DatabaseComponent")
+
+    with pytest.raises(MainLoopRequiredError):
+        await component._get_output_result(component._outputs_map["thread"])
+
+    assert not watchdog.is_offloaded("DatabaseComponent")
+    result = await component._get_output_result(component._outputs_map["thread"])
+    assert result.data["thread"] == threading.get_ident()
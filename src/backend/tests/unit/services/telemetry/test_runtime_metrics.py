@@ -0,0 +1,137 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import status
+from langflow.graph.vertex.profiling import VertexProfile, get_vertex_profile_stats
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.chat.service import ChatService
+from langflow.services.deps import get_settings_service
+from langflow.services.telemetry.runtime_metrics import (
+    EventLoopLagMonitor,
+    generate_runtime_metrics,
+    get_runtime_counters,
+)
+from prometheus_client.parser import text_string_to_metric_families
+
+
+@pytest.fixture
+def runtime_counters():
+    counters = get_runtime_counters()
+    counters.clear()
+    yield counters
+    counters.clear()
+
+
+def _samples(text: str) -> dict[tuple[str, tuple[tuple[str, str], ...]], float]:
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(text)
+        for sample in family.samples
+    }
+
+
+def _block_event_loop(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_counters_are_exposed(runtime_counters):
+    runtime_counters.record_event("token")
+    runtime_counters.record_event("token")
+    runtime_counters.record_cache_lookup("chat", hit=True)
+    runtime_counters.record_cache_lookup("chat", hit=False)
+    runtime_counters.record_cache_lookup("chat", hit=False)
+
+    samples = _samples(generate_runtime_metrics().decode())
+
+    assert samples["langflow_events_total", (("event", "token"),)] == 2
+    assert samples["langflow_cache_lookups_total", (("cache", "chat"), ("result", "hit"))] == 1
+    assert samples["langflow_cache_lookups_total", (("cache", "chat"), ("result", "miss"))] == 2
+
+
+@pytest.mark.parametrize("cache_class", [ThreadingInMemoryCache, AsyncInMemoryCache])
+async def test_chat_cache_lookups_are_counted_once(runtime_counters, cache_class):
+    chat_service = ChatService()
+    chat_service.cache_service = cache_class()
+    await chat_service.set_cache("flow", "graph")
+    runtime_counters.clear()
+
+    await chat_service.get_cache("flow")
+    await chat_service.get_cache("other flow")
+    assert runtime_counters.cache_lookups() == {("chat", "hit"): 1, ("chat", "miss"): 1}
+
+    # Lookups made directly on the cache service are still counted under its own layer
+    lookup = chat_service.cache_service.get("flow")
+    if asyncio.iscoroutine(lookup):
+        await lookup
+    assert runtime_counters.cache_lookups()["service", "hit"] == 1
+
+
+def test_vertex_build_latency_is_exposed_per_component():
+    stats = get_vertex_profile_stats()
+    stats.clear()
+    profile = VertexProfile()
+    profile.add("build", 0.2, 0.1, None)
+    profile.add("params", 0.01, 0.01, None)
+    stats.record("ChatInput", profile)
+    try:
+        samples = _samples(generate_runtime_metrics().decode())
+    finally:
+        stats.clear()
+
+    assert samples["langflow_vertex_build_duration_seconds_count", (("component", "ChatInput"),)] == 1
+    assert samples["langflow_vertex_build_duration_seconds_sum", (("component", "ChatInput"),)] == pytest.approx(0.2)
+    assert samples["langflow_vertex_build_duration_seconds_bucket", (("component", "ChatInput"), ("le", "0.1"))] == 0
+    assert samples["langflow_vertex_build_duration_seconds_bucket", (("component", "ChatInput"), ("le", "0.25"))] == 1
+    # Only whole builds are exposed, the other phases stay on /monitor/profiles
+    assert all(labels != (("component", "ChatInput"), ("phase", "params")) for _, labels in samples)
+
+
+def test_event_loop_lag_histogram():
+    monitor = EventLoopLagMonitor()
+    monitor.observe(0.002)
+    monitor.observe(0.3)
+
+    buckets, lag_sum = monitor.histogram()
+
+    assert monitor.last_lag == 0.3
+    assert lag_sum == pytest.approx(0.302)
+    assert dict(buckets)["0.005"] == 1
+    assert dict(buckets)["0.25"] == 1
+    assert dict(buckets)["0.5"] == 2
+    assert dict(buckets)["+Inf"] == 2
+
+
+async def test_event_loop_lag_monitor_measures_blocked_loop():
+    monitor = EventLoopLagMonitor(interval=0.01)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.02)
+        _block_event_loop(0.2)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    buckets, _ = monitor.histogram()
+    assert dict(buckets)["0.1"] < dict(buckets)["+Inf"]
+
+
+async def test_metrics_endpoint_disabled(client):
+    response = await client.get("/metrics")
+    assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+
+
+async def test_metrics_endpoint(client, monkeypatch, runtime_counters):
+    monkeypatch.setattr(get_settings_service().settings, "runtime_metrics_enabled", True)
+    runtime_counters.record_event("end_vertex")
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    samples = _samples(response.text)
+    assert samples["langflow_events_total", (("event", "end_vertex"),)] == 1
+    assert samples["langflow_build_jobs", ()] == 0
+    assert ("langflow_event_loop_lag_seconds", ()) in samples
@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 import uuid
 from unittest.mock import MagicMock, patch
 
@@ -517,3 +519,110 @@ async def test_concurrent_tracing(tracing_service, mock_component):
     assert tracer2.session_id == "session_id2"
     assert dict(tracer2.outputs_param.get("run_id2 trace_name1")) == {"output_key": "task2_run_id2 component1_output"}
     assert dict(tracer2.outputs_param.get("run_id2 trace_name2")) == {"output_key": "task2_run_id2 component2_output"}
+
+
+@pytest.mark.asyncio
+async def test_cleanup_inputs_without_secrets_is_not_copied():
+    inputs = {"normal_key": "normal_value"}
+
+    assert TracingService._cleanup_inputs(inputs) is inputs
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_trace_component_drops_traces_when_queue_is_full(mock_settings_service, mock_component):
+    """Component traces that do not fit in the queue are dropped, start and end together."""
+    mock_settings_service.settings.tracing_queue_size = 1
+    tracing_service = TracingService(mock_settings_service)
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    trace_context = trace_context_var.get()
+    # Fill the queue before the worker gets a chance to drain it
+    trace_context.traces_queue.put_nowait((lambda: None, ()))
+
+    async with tracing_service.trace_component(mock_component, "dropped_trace", {"input_key": "input_value"}) as ts:
+        ts.set_outputs("dropped_trace", {"output_key": "output_value"})
+
+    await tracing_service.end_tracers({})
+
+    assert trace_context.dropped_traces == 1
+    for tracer in trace_context.tracers.values():
+        assert tracer.add_trace_list == []
+        assert tracer.end_trace_list == []
+        assert tracer.end_called
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_sampled_out_run_has_no_tracers(mock_settings_service, mock_component):
+    mock_settings_service.settings.tracing_sample_rate = 0.0
+    tracing_service = TracingService(mock_settings_service)
+
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+    trace_context = trace_context_var.get()
+    assert trace_context is not None
+    assert trace_context.tracers == {}
+    assert trace_context.worker_task is None
+
+    async with tracing_service.trace_component(mock_component, "test_trace", {"input_key": "input_value"}) as ts:
+        ts.set_outputs("test_trace", {"output_key": "output_value"})
+        assert tracing_service.get_langchain_callbacks() == []
+
+    assert trace_context.traces_queue.empty()
+    await tracing_service.end_tracers({})
+
+
+@pytest.mark.asyncio
+async def test_tracers_are_called_off_the_event_loop(tracing_service, mock_component):
+    class ThreadRecordingTracer(MockTracer):
+        def add_trace(self, *args, **kwargs) -> None:
+            super().add_trace(*args, **kwargs)
+            self.add_trace_thread = threading.get_ident()
+
+        def end(self, *args, **kwargs) -> None:
+            super().end(*args, **kwargs)
+            self.end_thread = threading.get_ident()
+
+    with patch("langflow.services.tracing.service._get_langsmith_tracer", return_value=ThreadRecordingTracer):
+        await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+        async with tracing_service.trace_component(mock_component, "test_trace", {"input_key": "input_value"}):
+            pass
+        await tracing_service.end_tracers({})
+
+    tracer = trace_context_var.get().tracers["langsmith"]
+    assert len(tracer.add_trace_list) == 1
+    assert tracer.add_trace_thread != threading.get_ident()
+    assert tracer.end_thread != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_end_tracers_waits_for_the_batch_being_exported(tracing_service, mock_component):
+    """The queue is empty while the worker exports the last batch, and the tracers must only end after it."""
+    events = []
+    exporting = threading.Event()
+
+    class SlowTracer(MockTracer):
+        def add_trace(self, *args, **kwargs) -> None:
+            exporting.set()
+            time.sleep(0.2)
+            events.append("add")
+            super().add_trace(*args, **kwargs)
+
+        def end_trace(self, *args, **kwargs) -> None:
+            events.append("end_trace")
+            super().end_trace(*args, **kwargs)
+
+        def end(self, *args, **kwargs) -> None:
+            events.append("end")
+            super().end(*args, **kwargs)
+
+    with patch("langflow.services.tracing.service._get_langsmith_tracer", return_value=SlowTracer):
+        await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session", "test_project")
+        trace_context = trace_context_var.get()
+        async with tracing_service.trace_component(mock_component, "test_trace", {"input_key": "input_value"}):
+            pass
+        await asyncio.to_thread(exporting.wait, 5)
+        assert trace_context.traces_queue.empty()
+        await tracing_service.end_tracers({})
+
+    assert events == ["add", "end_trace", "end"]
+    assert trace_context.worker_task is None
@@ -1,4 +1,5 @@
 import asyncio
+import json
 import uuid
 from uuid import UUID
 
@@ -6,6 +7,7 @@ import pytest
 from httpx import codes
 from langflow.memory import aget_messages
 from langflow.services.database.models.flow import FlowUpdate
+from langflow.services.deps import get_settings_service
 
 from tests.unit.build_utils import build_flow, consume_and_assert_stream, create_flow, get_build_events
 
@@ -29,6 +31,25 @@ async def test_build_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
     await consume_and_assert_stream(events_response, job_id)
 
 
+async def test_build_flow_profiles_are_aggregated(client, json_memory_chatbot_no_llm, logged_in_headers):
+    """The phase timings of built components can be queried through the monitor API."""
+    response = await client.delete("api/v1/monitor/profiles", headers=logged_in_headers)
+    assert response.status_code == codes.NO_CONTENT
+
+    flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+    job_id = (await build_flow(client, flow_id, logged_in_headers))["job_id"]
+    events_response = await get_build_events(client, job_id, logged_in_headers)
+    await consume_and_assert_stream(events_response, job_id)
+
+    response = await client.get("api/v1/monitor/profiles", params={"component": "ChatInput"}, headers=logged_in_headers)
+    assert response.status_code == codes.OK
+    histograms = {histogram["phase"]: histogram for histogram in response.json()}
+    assert {"build", "params", "build_results"} <= histograms.keys()
+    assert all(histogram["component"] == "ChatInput" for histogram in histograms.values())
+    assert histograms["build"]["count"] == 1
+    assert histograms["build"]["buckets"]["+Inf"] == 1
+
+
 @pytest.mark.benchmark
 async def test_build_flow_from_request_data(client, json_memory_chatbot_no_llm, logged_in_headers):
     """Test building a flow from request data."""
@@ -78,6 +99,25 @@ async def test_build_flow_with_frozen_path(client, json_memory_chatbot_no_llm, l
     await check_messages(flow_id)
 
 
+async def test_incremental_build_reports_reused_vertices(
+    client, json_memory_chatbot_no_llm, logged_in_headers, monkeypatch
+):
+    """With incremental builds, the vertices_sorted event tells which vertices the build reuses."""
+    monkeypatch.setattr(get_settings_service().settings, "incremental_builds", True)
+    flow_id = await create_flow(client, json_memory_chatbot_no_llm, logged_in_headers)
+    first_job_id = (await build_flow(client, flow_id, logged_in_headers))["job_id"]
+    await consume_and_assert_stream(await get_build_events(client, first_job_id, logged_in_headers), first_job_id)
+
+    job_id = (await build_flow(client, flow_id, logged_in_headers))["job_id"]
+    events_response = await get_build_events(client, job_id, logged_in_headers)
+    lines = [line async for line in events_response.aiter_lines() if line]
+
+    vertices_sorted = next(event["data"] for event in map(json.loads, lines) if event.get("event") == "vertices_sorted")
+    # Every vertex of the chatbot reads the chat input or the session's messages
+    assert vertices_sorted["reused"] == []
+    assert sorted(vertices_sorted["rebuilt"]) == sorted(vertices_sorted["to_run"])
+
+
 async def check_messages(flow_id):
     if isinstance(flow_id, str):
         flow_id = UUID(flow_id)
@@ -1,9 +1,12 @@
 import json
 import os
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
 from langflow.logging.logger import SizedLogBuffer
+from loguru import logger
 
 
 @pytest.fixture
@@ -99,3 +102,80 @@ def test_max_size(sized_log_buffer):
     assert sized_log_buffer.max_size() == 0
     sized_log_buffer.max = 100
     assert sized_log_buffer.max_size() == 100
+
+
+def _write_logs(sized_log_buffer, count, start=0):
+    for i in range(start, start + count):
+        sized_log_buffer.write(json.dumps({"text": f"Log {i}", "record": {"time": {"timestamp": 1625097600 + i}}}))
+
+
+def test_get_since_follows_cursor_across_overwrites(sized_log_buffer):
+    sized_log_buffer.max = 3
+    _write_logs(sized_log_buffer, 2)
+    entries, cursor = sized_log_buffer.get_since(0)
+    assert [text for _, text in entries] == ["Log 0", "Log 1"]
+    assert cursor == 2
+
+    entries, cursor = sized_log_buffer.get_since(cursor)
+    assert entries == []
+    assert cursor == 2
+
+    # Log 2 to Log 5 wrap around the ring; Log 2 is overwritten before the reader gets to it
+    _write_logs(sized_log_buffer, 4, start=2)
+    entries, cursor = sized_log_buffer.get_since(cursor)
+    assert [text for _, text in entries] == ["Log 3", "Log 4", "Log 5"]
+    assert cursor == 6
+
+
+def test_resize_keeps_sequence_numbers(sized_log_buffer):
+    sized_log_buffer.max = 4
+    _write_logs(sized_log_buffer, 4)
+    sized_log_buffer.max = 2
+    _write_logs(sized_log_buffer, 1, start=4)
+
+    assert [text for _, text in sized_log_buffer.buffer] == ["Log 3", "Log 4"]
+    assert sized_log_buffer.next_seq == 5
+    entries, _ = sized_log_buffer.get_since(4)
+    assert [text for _, text in entries] == ["Log 4"]
+
+
+def test_timestamp_lookups_after_wrap_around(sized_log_buffer):
+    sized_log_buffer.max = 4
+    _write_logs(sized_log_buffer, 7)
+
+    assert list(sized_log_buffer.get_after_timestamp(1625097604000, lines=10)) == [
+        1625097604000,
+        1625097605000,
+        1625097606000,
+    ]
+    assert list(sized_log_buffer.get_before_timestamp(1625097605000, lines=10)) == [1625097603000, 1625097604000]
+    # Nothing at or after the timestamp: the latest lines are returned
+    assert list(sized_log_buffer.get_before_timestamp(1625097700000, lines=2)) == [1625097605000, 1625097606000]
+
+
+async def test_wait_for_entries_is_woken_by_write(sized_log_buffer):
+    sized_log_buffer.max = 3
+    assert not await sized_log_buffer.wait_for_entries(0, timeout=0.01)
+
+    # Written from another thread, like a log of a component running in a worker thread
+    writer = threading.Timer(0.05, _write_logs, args=(sized_log_buffer, 1))
+    writer.start()
+    try:
+        assert await sized_log_buffer.wait_for_entries(0, timeout=5)
+    finally:
+        writer.join()
+    assert await sized_log_buffer.wait_for_entries(0, timeout=0)
+    assert not sized_log_buffer._waiters
+
+
+def test_write_loguru_message(sized_log_buffer):
+    sized_log_buffer.max = 2
+    handler_id = logger.add(sized_log_buffer.write, format="{level} {message}")
+    try:
+        logger.info("buffered message")
+    finally:
+        logger.remove(handler_id)
+
+    ((epoch, text),) = sized_log_buffer.buffer
+    assert text == "INFO buffered message\n"
+    assert abs(epoch - time.time() * 1000) < 60_000
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
@@ -356,3 +357,258 @@ async def test_aupdate_message_with_nested_properties(created_message):
     assert updated[0].properties.allow_markdown is True
     assert updated[0].properties.state == "complete"
     assert updated[0].properties.targets == []
+
+
+@pytest.mark.usefixtures("client")
+async def test_aadd_messages_batches_concurrent_writes(monkeypatch):
+    from langflow import memory
+
+    transactions = []
+    original_aadd_messagetables = memory.aadd_messagetables
+
+    async def counting_aadd_messagetables(messages, session):
+        transactions.append(len(messages))
+        return await original_aadd_messagetables(messages, session)
+
+    monkeypatch.setattr(memory, "aadd_messagetables", counting_aadd_messagetables)
+    monkeypatch.setattr(memory, "_message_write_batcher", memory.MessageWriteBatcher(window=0.05, max_batch_size=8))
+    monkeypatch.setattr(memory, "get_message_write_batcher", lambda: memory._message_write_batcher)
+
+    session_id = f"batched-{uuid4()}"
+    stored = await asyncio.gather(
+        *[
+            aadd_messages(Message(text=f"message {i}", sender="User", sender_name="User", session_id=session_id))
+            for i in range(20)
+        ]
+    )
+
+    assert [messages[0].text for messages in stored] == [f"message {i}" for i in range(20)]
+    assert all(messages[0].id for messages in stored)
+    assert transactions == [8, 8, 4]
+    history = await aget_messages(session_id=session_id, order="ASC")
+    assert [message.text for message in history] == [f"message {i}" for i in range(20)]
+
+
+@pytest.mark.usefixtures("client")
+async def test_aget_messages_waits_for_queued_writes(monkeypatch):
+    from langflow import memory
+
+    monkeypatch.setattr(memory, "_message_write_batcher", memory.MessageWriteBatcher(window=0.05))
+    monkeypatch.setattr(memory, "get_message_write_batcher", lambda: memory._message_write_batcher)
+
+    session_id = f"read-your-writes-{uuid4()}"
+    write = asyncio.create_task(
+        aadd_messages(Message(text="queued", sender="User", sender_name="User", session_id=session_id))
+    )
+    await asyncio.sleep(0)
+    messages = await aget_messages(session_id=session_id)
+    assert [message.text for message in messages] == ["queued"]
+    await write
+
+
+@pytest.mark.usefixtures("client")
+async def test_aget_message_history_pages_latest_messages():
+    from datetime import timedelta
+
+    from langflow.memory import aget_message_history
+
+    session_id = f"history-{uuid4()}"
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    await aadd_messages(
+        [
+            Message(
+                text=f"message {i}",
+                sender="User" if i % 2 == 0 else "Machine",
+                sender_name="User" if i % 2 == 0 else "AI",
+                session_id=session_id,
+                timestamp=(start + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S %Z"),
+            )
+            for i in range(25)
+        ]
+        + [Message(text="other session", sender="User", sender_name="User", session_id=f"other-{uuid4()}")]
+    )
+
+    pages = [await aget_message_history(session_id, limit=10)]
+    while pages[-1].next_cursor:
+        pages.append(await aget_message_history(session_id, limit=10, before=pages[-1].next_cursor))
+
+    assert [[message.text for message in page.messages] for page in pages] == [
+        [f"message {i}" for i in range(15, 25)],
+        [f"message {i}" for i in range(5, 15)],
+        [f"message {i}" for i in range(5)],
+    ]
+    latest = pages[0].messages[-1]
+    assert latest.sender_name == "User"
+    assert latest.timestamp == "2025-01-01 00:00:24 UTC"
+    assert isinstance(latest.properties, Properties)
+
+    machine_page = await aget_message_history(session_id, sender="Machine", limit=3)
+    assert [message.text for message in machine_page.messages] == ["message 19", "message 21", "message 23"]
+
+
+@pytest.mark.usefixtures("client")
+async def test_aget_message_history_orders_messages_stored_in_the_same_second():
+    from langflow.memory import aget_message_history
+
+    session_id = f"same-second-{uuid4()}"
+    texts = [f"{sender} {turn}" for turn in range(3) for sender in ("question", "answer")]
+    for text in texts:
+        await astore_message(
+            Message(
+                text=text,
+                sender="User" if text.startswith("question") else "Machine",
+                sender_name="User" if text.startswith("question") else "AI",
+                session_id=session_id,
+                timestamp="2025-01-01 00:00:00 UTC",
+            )
+        )
+
+    assert [message.text for message in (await aget_message_history(session_id)).messages] == texts
+    pages = [await aget_message_history(session_id, limit=4)]
+    while pages[-1].next_cursor:
+        pages.append(await aget_message_history(session_id, limit=1, before=pages[-1].next_cursor))
+    assert [message.text for page in reversed(pages) for message in page.messages] == texts
+
+
+@pytest.mark.usefixtures("client")
+async def test_message_history_cache_serves_active_session(monkeypatch):
+    import langflow.memory
+    from langflow.memory import LCBuiltinChatMemory, aget_message_history, get_message_history_cache
+
+    session_id = f"cached-{uuid4()}"
+    await aadd_messages(
+        [
+            Message(
+                text=f"message {i}",
+                sender="User",
+                sender_name="User",
+                session_id=session_id,
+                timestamp=f"2025-01-01 00:00:0{i} UTC",
+            )
+            for i in range(3)
+        ]
+    )
+    assert [m.text for m in (await aget_message_history(session_id)).messages] == [f"message {i}" for i in range(3)]
+    await astore_message(Message(text="reply", sender="Machine", sender_name="AI", session_id=session_id))
+
+    def no_database():
+        msg = "The history should be served from the cache"
+        raise AssertionError(msg)
+
+    with monkeypatch.context() as m:
+        m.setattr(langflow.memory, "session_scope", no_database)
+        page = await aget_message_history(session_id)
+        assert [message.text for message in page.messages] == ["message 0", "message 1", "message 2", "reply"]
+        assert page.next_cursor is None
+        assert [message.text for message in (await aget_message_history(session_id, sender="Machine")).messages] == [
+            "reply"
+        ]
+        lc_messages = await LCBuiltinChatMemory(flow_id="", session_id=session_id).aget_messages()
+        # Newest first, like aget_messages
+        assert [message.content for message in lc_messages] == ["reply", "message 2", "message 1", "message 0"]
+
+    # Streamed messages are updated as they grow, and the cached window follows them
+    reply = (await aget_messages(session_id=session_id, sender="Machine"))[0]
+    reply.text = "reply, streamed"
+    await aupdate_messages(reply)
+    with monkeypatch.context() as m:
+        m.setattr(langflow.memory, "session_scope", no_database)
+        page = await aget_message_history(session_id)
+        assert [message.text for message in page.messages][-1] == "reply, streamed"
+
+    await adelete_messages(session_id)
+    assert get_message_history_cache().get(session_id) is None
+    assert (await aget_message_history(session_id)).messages == []
+
+
+def _message_row(session_id: str, text: str, second: int) -> MessageRead:
+    return MessageRead(
+        id=uuid4(),
+        text=text,
+        sender="User",
+        sender_name="User",
+        session_id=session_id,
+        flow_id=None,
+        timestamp=datetime(2025, 1, 1, 0, 0, second, tzinfo=timezone.utc),
+    )
+
+
+def test_message_history_cache_orders_messages_stored_in_the_same_second():
+    from langflow.memory import MessageHistoryCache
+
+    rows = [_message_row("a", text, 0) for text in ("question", "answer", "follow up")]
+    for sequence, row in enumerate(rows, start=1):
+        # Ids are random, so only the sequence tells which message was stored first
+        row.sequence = sequence
+        row.id = UUID(int=len(rows) - sequence)
+    cache = MessageHistoryCache(max_messages=10, max_bytes=10_000)
+    cache.begin_load("a")
+    cache.end_load("a", rows[:1], complete=True)
+
+    cache.extend([rows[2], rows[1]])
+
+    cached, next_cursor = cache.get("a", limit=2)
+    assert [row.text for row in cached] == ["answer", "follow up"]
+    assert (next_cursor.timestamp, next_cursor.sequence) == (rows[1].timestamp, 2)
+    assert [row.text for row in cache.get("a")[0]] == ["question", "answer", "follow up"]
+
+
+def test_message_history_cache_window_bounds():
+    from langflow.memory import MessageHistoryCache
+
+    cache = MessageHistoryCache(max_messages=3, max_bytes=10_000)
+    cache.begin_load("a")
+    cache.end_load("a", [_message_row("a", "0", 0), _message_row("a", "1", 1)], complete=True)
+    cache.extend([_message_row("a", "3", 3), _message_row("a", "2", 2)])
+
+    rows, next_cursor = cache.get("a", limit=2)
+    assert [row.text for row in rows] == ["2", "3"]
+    assert next_cursor.timestamp == rows[0].timestamp
+    # The oldest message was dropped, so the window can't tell whether older messages exist
+    assert cache.get("a", limit=3) is None
+
+    row_size = len(_message_row("b", "x" * 100, 0).model_dump_json())
+    cache = MessageHistoryCache(max_messages=10, max_bytes=row_size * 3)
+    for session_id in ("b", "c"):
+        cache.begin_load(session_id)
+        cache.end_load(session_id, [_message_row(session_id, "x" * 100, i) for i in range(2)], complete=True)
+    # Both windows don't fit together, so the least recently used one was evicted
+    assert cache.get("b") is None
+    assert len(cache.get("c")[0]) == 2
+
+
+def test_message_history_cache_discards_stale_loads():
+    from langflow.memory import MessageHistoryCache
+
+    cache = MessageHistoryCache(max_messages=10, max_bytes=10_000)
+    cache.begin_load("a")
+    # A message stored while the history was being read is missing from the loaded rows
+    cache.extend([_message_row("a", "new", 1)])
+    cache.end_load("a", [_message_row("a", "old", 0)], complete=True)
+    assert cache.get("a") is None
+
+    cache.begin_load("a")
+    cache.end_load("a", [_message_row("a", "old", 0), _message_row("a", "new", 1)], complete=True)
+    assert [row.text for row in cache.get("a")[0]] == ["old", "new"]
+
+
+def test_message_history_cache_replaces_updated_messages():
+    from langflow.memory import MessageHistoryCache
+
+    cache = MessageHistoryCache(max_messages=10, max_bytes=10_000)
+    rows = [_message_row("a", "0", 0), _message_row("a", "1", 1)]
+    cache.begin_load("a")
+    cache.end_load("a", rows, complete=True)
+
+    cache.replace([rows[1].model_copy(update={"text": "1, edited"})])
+    assert [row.text for row in cache.get("a")[0]] == ["0", "1, edited"]
+
+    # Updates that change the order or the messages of the window drop it
+    cache.replace([rows[0].model_copy(update={"timestamp": datetime(2025, 1, 1, 0, 0, 5, tzinfo=timezone.utc)})])
+    assert cache.get("a") is None
+
+    for update in ({"error": True}, {"id": uuid4()}):
+        cache.begin_load("a")
+        cache.end_load("a", rows, complete=True)
+        cache.replace([rows[1].model_copy(update=update)])
+        assert cache.get("a") is None
@@ -16,8 +16,13 @@ def opentelemetry_instance():
 def test_init(opentelemetry_instance):
     assert isinstance(opentelemetry_instance, OpenTelemetry)
     assert len(opentelemetry_instance._metrics) > 1
-    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 2
+    assert len(opentelemetry_instance._metrics) == len(opentelemetry_instance._metrics_registry) == 6
     assert "file_uploads" in opentelemetry_instance._metrics
+    assert "subflow_build_duration" in opentelemetry_instance._metrics
+
+
+def test_histogram(opentelemetry_instance):
+    opentelemetry_instance.observe_histogram("subflow_run_duration", 0.25, fixed_labels)
 
 
 def test_gauge(opentelemetry_instance):
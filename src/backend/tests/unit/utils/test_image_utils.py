@@ -70,3 +70,18 @@ def test_create_data_url_unrecognized_extension(tmp_path):
     invalid_file.touch()
     with pytest.raises(ValueError, match="Could not determine MIME type"):
         create_data_url(invalid_file)
+
+
+def test_convert_image_to_base64_caches_until_file_changes(sample_image, monkeypatch):
+    first = convert_image_to_base64(sample_image)
+
+    def fail_open(*args, **kwargs):  # noqa: ARG001
+        msg = "The encoded image should come from the cache"
+        raise AssertionError(msg)
+
+    with monkeypatch.context() as m:
+        m.setattr(type(sample_image), "open", fail_open)
+        assert convert_image_to_base64(sample_image) == first
+
+    sample_image.write_bytes(sample_image.read_bytes() + b"\0")
+    assert convert_image_to_base64(sample_image) != first
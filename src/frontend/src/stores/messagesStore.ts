@@ -67,6 +67,34 @@ export const useMessagesStore = create<MessagesStoreType>((set, get) => ({
       return { messages: updatedMessages };
     });
   },
+  applyMessageDelta: (delta) => {
+    // apply the changed content blocks and contents of an existing message
+    set((state) => {
+      const updatedMessages = [...state.messages];
+      for (let i = state.messages.length - 1; i >= 0; i--) {
+        if (state.messages[i].id === delta.id) {
+          const message = { ...updatedMessages[i] };
+          const blocks = [...(message.content_blocks ?? [])];
+          delta.blocks?.forEach(({ block_index, block }) => {
+            blocks[block_index] = block;
+          });
+          delta.contents?.forEach(({ block_index, content_index, content }) => {
+            if (!blocks[block_index]) return;
+            const contents = [...blocks[block_index].contents];
+            contents[content_index] = content;
+            blocks[block_index] = { ...blocks[block_index], contents };
+          });
+          message.content_blocks = blocks;
+          if (delta.text !== undefined) message.text = delta.text;
+          if (delta.properties !== undefined)
+            message.properties = { ...message.properties, ...delta.properties };
+          updatedMessages[i] = message;
+          break;
+        }
+      }
+      return { messages: updatedMessages };
+    });
+  },
   clearMessages: () => {
     set(() => ({ messages: [] }));
   },
@@ -209,6 +209,14 @@ export type VertexBuildTypeAPI = {
   params: any;
   messages: ChatOutputType[] | ChatInputType[];
   artifacts: any | ChatOutputType | ChatInputType;
+  profile?: Record<string, VertexPhaseProfileType> | null;
+};
+
+export type VertexPhaseProfileType = {
+  wall_time: number;
+  cpu_time: number;
+  memory_delta_bytes: number | null;
+  calls: number;
 };
 
 export type ErrorLogType = {
@@ -236,6 +244,7 @@ export type VertexDataTypeAPI = {
   inactive?: boolean;
   timedelta?: number;
   duration?: string;
+  output_execution?: { [key: string]: string } | null;
   artifacts?: any | ChatOutputType | ChatInputType;
   message?: ChatOutputType | ChatInputType;
 };
@@ -1,4 +1,4 @@
-import { ContentBlock } from "../chat";
+import { ContentBlock, ContentType } from "../chat";
 
 type Message = {
   flow_id: string;
@@ -17,4 +17,16 @@ type Message = {
   content_blocks?: ContentBlock[];
 };
 
-export type { Message };
+type MessageDelta = {
+  id: string;
+  text?: string;
+  properties?: any;
+  blocks?: Array<{ block_index: number; block: ContentBlock }>;
+  contents?: Array<{
+    block_index: number;
+    content_index: number;
+    content: ContentType;
+  }>;
+};
+
+export type { Message, MessageDelta };
@@ -1,4 +1,4 @@
-import { Message } from "../../messages";
+import { Message, MessageDelta } from "../../messages";
 
 export type MessagesStoreType = {
   messages: Message[];
@@ -8,6 +8,7 @@ export type MessagesStoreType = {
   updateMessage: (message: Message) => void;
   updateMessagePartial: (message: Partial<Message>) => void;
   updateMessageText: (id: string, chunk: string) => void;
+  applyMessageDelta: (delta: MessageDelta) => void;
   clearMessages: () => void;
   removeMessages: (ids: string[]) => void;
   deleteSession: (id: string) => void;
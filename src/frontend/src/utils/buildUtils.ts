@@ -592,6 +592,11 @@ async function onEvent(
       useMessagesStore.getState().addMessage(data);
       return true;
     }
+    case "message_delta": {
+      // Apply only the parts of a message that changed since the last event.
+      useMessagesStore.getState().applyMessageDelta(data);
+      return true;
+    }
     case "token": {
       // Use flushSync with a timeout to avoid React batching issues.
       setTimeout(() => {